@@ -0,0 +1,359 @@
+"""
+Pamięć podręczna odpowiedzi endpointów miejsc (read-through).
+
+Przechowywane są gotowe, zserializowane odpowiedzi JSON – trafienie nie wymaga
+ani zapytania do bazy, ani serializacji. Dostępne backendy:
+
+- MemoryCache: LRU z czasem życia wpisów, osobny w każdym procesie roboczym,
+- RedisCache: współdzielony między procesami (dowolny klient zgodny z redis-py).
+
+Klucze szczegółów miejsca zawierają numer wersji miejsca, zwiększany przy
+każdej zmianie miejsca lub jego recenzji. Klucze list zawierają numer
+generacji – każda zmiana zwiększa generację, więc wszystkie zapamiętane
+strony list przestają być używane naraz, bez wyszukiwania ich kluczy.
+Klucz wyliczany jest przed odczytem z bazy, więc odpowiedź zbudowana ze
+starych danych, zapisana już po zmianie, trafia pod nieaktualny klucz
+i nigdy nie zostanie zwrócona.
+
+Awaria backendu (np. niedostępny Redis) nie przerywa żądań – odczyt
+traktowany jest jak chybienie, zapis jest pomijany, a błąd liczony w statystykach.
+"""
+from collections import OrderedDict
+from threading import Lock
+import hashlib
+import json
+import logging
+import time
+
+from fastapi import Response
+
+from app.config import Settings, settings
+
+logger = logging.getLogger(__name__)
+
+# Prefiks kluczy, aby baza Redis mogła być współdzielona z innymi aplikacjami
+KEY_PREFIX = "placeexplorer:"
+
+_LIST_GENERATION_KEY = "places:list:generation"
+
+
+def _place_version_key(place_id: int) -> str:
+    return f"places:detail:version:{place_id}"
+
+
+class MemoryCache:
+    """
+    Pamięć podręczna w procesie z usuwaniem najdawniej używanych wpisów (LRU).
+
+    Attributes:
+        max_entries: Maksymalna liczba przechowywanych wpisów.
+        ttl: Czas życia wpisu w sekundach.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+
+class RedisCache:
+    """
+    Pamięć podręczna w Redis, współdzielona przez wszystkie procesy aplikacji.
+
+    Attributes:
+        client: Klient zgodny z redis-py (get, set, delete, incr, scan_iter).
+        ttl: Czas życia wpisu w sekundach.
+    """
+
+    def __init__(self, client, ttl: float = 60.0):
+        self.client = client
+        self.ttl = ttl
+
+    @classmethod
+    def from_url(cls, url: str, ttl: float = 60.0) -> "RedisCache":
+        """
+        Tworzy backend dla serwera Redis o podanym adresie.
+
+        Args:
+            url (str): Adres serwera, np. redis://localhost:6379/0.
+            ttl (float): Czas życia wpisu w sekundach.
+
+        Raises:
+            RuntimeError: Jeśli pakiet redis nie jest zainstalowany.
+
+        Returns:
+            RedisCache: Backend Redis.
+        """
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis wymaga pakietu redis (pip install redis)")
+        return cls(redis.Redis.from_url(url), ttl=ttl)
+
+    def get(self, key: str) -> bytes | None:
+        return self.client.get(KEY_PREFIX + key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.client.set(KEY_PREFIX + key, value, ex=max(1, int(self.ttl)))
+
+    def delete(self, key: str) -> None:
+        self.client.delete(KEY_PREFIX + key)
+
+    def get_counter(self, key: str) -> int:
+        return int(self.client.get(KEY_PREFIX + key) or 0)
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(KEY_PREFIX + key))
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=KEY_PREFIX + "*"):
+            self.client.delete(key)
+
+
+class ResponseCache:
+    """
+    Pamięć podręczna odpowiedzi miejsc z licznikami trafień i chybień.
+
+    Bez backendu (CACHE_BACKEND=none) wszystkie operacje są pomijane.
+
+    Attributes:
+        backend: MemoryCache, RedisCache lub None.
+        hits: Liczba odpowiedzi zwróconych z pamięci podręcznej.
+        misses: Liczba odpowiedzi zbudowanych od nowa.
+        invalidations: Liczba unieważnień wywołanych zmianami danych.
+        errors: Liczba operacji zakończonych błędem backendu (pominiętych).
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    @classmethod
+    def from_settings(cls, config: Settings = settings) -> "ResponseCache":
+        """
+        Tworzy pamięć podręczną na podstawie ustawień aplikacji.
+
+        Args:
+            config (Settings): Ustawienia aplikacji.
+
+        Raises:
+            ValueError: Jeśli CACHE_BACKEND ma nieznaną wartość.
+
+        Returns:
+            ResponseCache: Pamięć podręczna (wyłączona dla CACHE_BACKEND=none).
+        """
+        if config.cache_backend == "none":
+            return cls()
+        if config.cache_backend == "memory":
+            return cls(MemoryCache(max_entries=config.cache_max_entries, ttl=config.cache_ttl))
+        if config.cache_backend == "redis":
+            return cls(RedisCache.from_url(config.cache_url, ttl=config.cache_ttl))
+        raise ValueError(f"Nieznany CACHE_BACKEND: {config.cache_backend!r}")
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def _failed(self, operation: str) -> None:
+        self.errors += 1
+        logger.warning("Response cache %s failed, bypassing cache", operation, exc_info=True)
+
+    def place_key(self, place_id: int, variant: str | None = None) -> str | None:
+        """
+        Buduje klucz szczegółów miejsca dla bieżącej wersji miejsca.
+
+        Args:
+            place_id (int): Identyfikator miejsca.
+            variant (str | None): Wariant odpowiedzi (np. zestaw pól parametru fields=).
+
+        Returns:
+            str | None: Klucz wpisu lub None, gdy pamięć podręczna jest wyłączona lub niedostępna.
+        """
+        if not self.enabled:
+            return None
+        try:
+            version = self.backend.get_counter(_place_version_key(place_id))
+        except Exception:
+            self._failed("place_key")
+            return None
+        key = f"places:detail:{place_id}:{version}"
+        return key if variant is None else f"{key}:{variant}"
+
+    def list_key(self, params: dict) -> str | None:
+        """
+        Buduje klucz strony listy miejsc dla bieżącej generacji list.
+
+        Args:
+            params (dict): Parametry zapytania (filtry, sortowanie, limit, kursor).
+
+        Returns:
+            str | None: Klucz wpisu lub None, gdy pamięć podręczna jest wyłączona lub niedostępna.
+        """
+        if not self.enabled:
+            return None
+        try:
+            generation = self.backend.get_counter(_LIST_GENERATION_KEY)
+        except Exception:
+            self._failed("list_key")
+            return None
+        digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+        return f"places:list:{generation}:{digest}"
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Zwraca zapamiętaną odpowiedź i aktualizuje liczniki.
+
+        Args:
+            key (str): Klucz wpisu.
+
+        Returns:
+            bytes | None: Treść odpowiedzi lub None przy chybieniu (także przy błędzie backendu).
+        """
+        try:
+            value = self.backend.get(key)
+        except Exception:
+            self._failed("get")
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        try:
+            self.backend.set(key, value)
+        except Exception:
+            self._failed("set")
+
+    def lookup(self, key: str | None) -> Response | None:
+        """
+        Zwraca zapamiętaną odpowiedź HTTP, jeśli istnieje.
+
+        Args:
+            key (str | None): Klucz wpisu (None pomija pamięć podręczną).
+
+        Returns:
+            Response | None: Odpowiedź z zapamiętanymi nagłówkami i X-Cache: HIT lub None.
+        """
+        if not self.enabled or key is None:
+            return None
+        value = self.get(key)
+        if value is None:
+            return None
+        # Wpis to nagłówki (JSON) i treść oddzielone znakiem nowej linii –
+        # zwarty JSON odpowiedzi nie zawiera niezakodowanych znaków nowej linii
+        headers, body = value.split(b"\n", 1)
+        return Response(body, media_type="application/json", headers={**json.loads(headers), "X-Cache": "HIT"})
+
+    def store(self, key: str | None, body: bytes, headers: dict[str, str] | None = None) -> Response:
+        """
+        Zapamiętuje zserializowaną odpowiedź i zwraca ją jako odpowiedź HTTP.
+
+        Args:
+            key (str | None): Klucz wpisu (None – odpowiedź nie jest zapamiętywana).
+            body (bytes): Treść odpowiedzi JSON.
+            headers (dict[str, str] | None): Nagłówki zapamiętywane razem z treścią (np. ETag).
+
+        Returns:
+            Response: Odpowiedź JSON.
+        """
+        headers = headers or {}
+        if not self.enabled or key is None:
+            return Response(body, media_type="application/json", headers=headers)
+        self.set(key, json.dumps(headers).encode() + b"\n" + body)
+        return Response(body, media_type="application/json", headers={**headers, "X-Cache": "MISS"})
+
+    def invalidate_place(self, place_id: int | None) -> None:
+        """
+        Unieważnia szczegóły miejsca i wszystkie strony list.
+
+        Args:
+            place_id (int | None): Identyfikator zmienionego miejsca; None, gdy
+                zmiana dotyczy tylko list (np. nowe miejsce).
+        """
+        if not self.enabled:
+            return
+        try:
+            if place_id is not None:
+                # Nowa wersja – wpisy poprzedniej wersji nie są już odczytywane i wygasają po TTL
+                self.backend.incr(_place_version_key(place_id))
+            self.backend.incr(_LIST_GENERATION_KEY)
+        except Exception:
+            # Zapis w bazie już się powiódł – wpisy wygasną najpóźniej po CACHE_TTL
+            self._failed("invalidate")
+            return
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """Usuwa wszystkie wpisy (np. po przeliczeniu agregatów wszystkich miejsc)."""
+        if not self.enabled:
+            return
+        try:
+            self.backend.clear()
+        except Exception:
+            self._failed("clear")
+            return
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        """
+        Zwraca liczniki pamięci podręcznej.
+
+        Returns:
+            dict: Backend, liczba trafień, chybień, unieważnień, błędów backendu i współczynnik trafień.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.enabled else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+response_cache = ResponseCache.from_settings()
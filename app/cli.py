@@ -0,0 +1,170 @@
+"""
+Polecenia administracyjne aplikacji PlaceExplorer.
+
+Użycie:
+    python -m app.cli recompute-ratings [--place-id ID]
+    python -m app.cli recompute-facets
+    python -m app.cli recompute-rankings
+    python -m app.cli import-places PLIK [--batch-size N]
+    python -m app.cli export-places [--format ndjson|csv] [--include-reviews] [--after-id ID] [--output PLIK]
+"""
+import argparse
+import json
+import sys
+
+from datetime import datetime
+
+from app.database import create_session
+from app.crud.facet import recompute_facet_counts
+from app.crud.review import recompute_rankings, recompute_rating_stats
+from app.exporter import ExportFormat, iter_places_csv, iter_places_ndjson
+from app.importer import PlaceImporter, iter_json_array, iter_ndjson_lines
+
+
+def recompute_ratings(args: argparse.Namespace) -> None:
+    """
+    Przelicza agregaty ocen miejsc na podstawie tabeli recenzji.
+
+    Args:
+        args (argparse.Namespace): Argumenty polecenia.
+    """
+    db = create_session()
+    try:
+        updated = recompute_rating_stats(db, place_id=args.place_id)
+    finally:
+        db.close()
+    print(f"Przeliczono agregaty ocen dla {updated} miejsc")
+
+
+def recompute_facets(args: argparse.Namespace) -> None:
+    """
+    Przelicza liczniki facetów (kraj, miasto, bezpłatny wstęp) na podstawie tabeli miejsc.
+
+    Args:
+        args (argparse.Namespace): Argumenty polecenia.
+    """
+    db = create_session()
+    try:
+        combinations = recompute_facet_counts(db)
+    finally:
+        db.close()
+    print(f"Przeliczono liczniki facetów dla {combinations} kombinacji")
+
+
+def recompute_ranking_scores(args: argparse.Namespace) -> None:
+    """
+    Przelicza wyniki rankingów miejsc (średnią Bayesa i wynik popularności).
+
+    Args:
+        args (argparse.Namespace): Argumenty polecenia.
+    """
+    db = create_session()
+    try:
+        updated = recompute_rankings(db)
+    finally:
+        db.close()
+    print(f"Przeliczono wyniki rankingów dla {updated} miejsc z recenzjami")
+
+
+def import_places(args: argparse.Namespace) -> None:
+    """
+    Importuje miejsca z pliku JSON (tablica) lub NDJSON (obiekt w każdej linii).
+
+    Format rozpoznawany jest po pierwszym znaku pliku: "[" oznacza tablicę JSON.
+
+    Args:
+        args (argparse.Namespace): Argumenty polecenia.
+    """
+    source = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+    db = create_session()
+    try:
+        importer = PlaceImporter(db, batch_size=args.batch_size)
+        first = source.peek(1)[:1] if hasattr(source, "peek") else b""
+        rows = iter_json_array(source.read()) if first == b"[" else iter_ndjson_lines(source)
+        for index, row in enumerate(rows):
+            if importer.add(index, row):
+                importer.flush()
+        result = importer.finish()
+    finally:
+        db.close()
+        if source is not sys.stdin.buffer:
+            source.close()
+
+    print(json.dumps(result.model_dump(), ensure_ascii=False, indent=2))
+
+
+def export_places(args: argparse.Namespace) -> None:
+    """
+    Eksportuje miejsca do pliku lub na standardowe wyjście.
+
+    Args:
+        args (argparse.Namespace): Argumenty polecenia.
+    """
+    export = iter_places_csv if args.format == ExportFormat.csv else iter_places_ndjson
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    db = create_session()
+    try:
+        for chunk in export(
+            db,
+            include_reviews=args.include_reviews,
+            after_id=args.after_id,
+            updated_since=args.updated_since,
+        ):
+            target.write(chunk)
+    finally:
+        db.close()
+        if target is not sys.stdout:
+            target.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Buduje parser argumentów linii poleceń.
+
+    Returns:
+        argparse.ArgumentParser: Parser z zarejestrowanymi poleceniami.
+    """
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Polecenia administracyjne PlaceExplorer")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    recompute = commands.add_parser("recompute-ratings", help="Przelicza agregaty ocen miejsc")
+    recompute.add_argument("--place-id", type=int, default=None, help="Przelicz tylko wskazane miejsce")
+    recompute.set_defaults(handler=recompute_ratings)
+
+    facets = commands.add_parser("recompute-facets", help="Przelicza liczniki facetów listy miejsc")
+    facets.set_defaults(handler=recompute_facets)
+
+    rankings = commands.add_parser("recompute-rankings", help="Przelicza wyniki rankingów miejsc")
+    rankings.set_defaults(handler=recompute_ranking_scores)
+
+    importer = commands.add_parser("import-places", help="Importuje miejsca z pliku JSON lub NDJSON")
+    importer.add_argument("path", help="Ścieżka do pliku lub '-' dla standardowego wejścia")
+    importer.add_argument("--batch-size", type=int, default=None, help="Liczba wierszy w jednej transakcji")
+    importer.set_defaults(handler=import_places)
+
+    exporter = commands.add_parser("export-places", help="Eksportuje miejsca do NDJSON lub CSV")
+    exporter.add_argument("--format", type=ExportFormat, choices=list(ExportFormat), default=ExportFormat.ndjson)
+    exporter.add_argument("--include-reviews", action="store_true", help="Dołącz recenzje miejsc")
+    exporter.add_argument("--after-id", type=int, default=None, help="Wznów eksport po miejscu o tym id")
+    exporter.add_argument(
+        "--updated-since", type=datetime.fromisoformat, default=None, help="Tylko miejsca zmienione od tej chwili (ISO 8601)"
+    )
+    exporter.add_argument("--output", default="-", help="Plik wynikowy lub '-' dla standardowego wyjścia")
+    exporter.set_defaults(handler=export_places)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Punkt wejścia linii poleceń.
+
+    Args:
+        argv (list[str] | None): Argumenty (domyślnie z sys.argv).
+    """
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
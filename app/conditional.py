@@ -0,0 +1,164 @@
+"""
+Warunkowe żądania GET (ETag, Last-Modified, 304 Not Modified).
+
+Walidator odpowiedzi wyliczany jest z kilku kolumn (numeru wersji i updated_at
+miejsca, liczby recenzji i daty najnowszej recenzji), więc do odpowiedzi 304
+wystarcza wąskie zapytanie po indeksie – bez ładowania miejsca, recenzji i bez
+serializacji odpowiedzi.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable
+import hashlib
+
+from fastapi import Request, Response
+
+
+@dataclass(frozen=True)
+class Validator:
+    """
+    Walidator wersji zasobu.
+
+    Attributes:
+        etag: Silny ETag (w cudzysłowie, zgodnie z RFC 9110).
+        last_modified: Chwila ostatniej zmiany zasobu (None dla kolekcji).
+    """
+
+    etag: str
+    last_modified: datetime | None = None
+
+    def headers(self) -> dict[str, str]:
+        """
+        Zwraca nagłówki ETag i Last-Modified.
+
+        Returns:
+            dict[str, str]: Nagłówki odpowiedzi.
+        """
+        headers = {"ETag": self.etag}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(_as_utc(self.last_modified), usegmt=True)
+        return headers
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Traktuje daty bez strefy czasowej (zapisane przez bazę) jako UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _etag(*parts) -> str:
+    digest = hashlib.blake2b("|".join(str(part) for part in parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def place_validator(
+    place_id: int,
+    revision: int,
+    updated_at: datetime | None,
+    review_count: int,
+    last_review_at: datetime | None,
+) -> Validator:
+    """
+    Buduje walidator szczegółów miejsca.
+
+    Numer wersji zmienia się przy każdej edycji, a liczba recenzji przy każdej
+    nowej recenzji, więc ETag jest inny nawet wtedy, gdy dwie zmiany nastąpiły
+    w tej samej sekundzie (SQLite zapisuje daty z dokładnością do sekundy).
+
+    Args:
+        place_id (int): Identyfikator miejsca.
+        revision (int): Numer wersji danych miejsca.
+        updated_at (datetime | None): Data ostatniej edycji miejsca.
+        review_count (int): Liczba recenzji miejsca.
+        last_review_at (datetime | None): Data najnowszej recenzji.
+
+    Returns:
+        Validator: ETag i Last-Modified (późniejsza z dat edycji i najnowszej recenzji).
+    """
+    moments = [moment for moment in (updated_at, last_review_at) if moment is not None]
+    last_modified = max(moments, key=_as_utc) if moments else None
+    return Validator(
+        etag=_etag("place", place_id, revision, updated_at and updated_at.isoformat(), review_count,
+                   last_review_at and last_review_at.isoformat()),
+        last_modified=last_modified,
+    )
+
+
+def collection_validator(rows: Iterable[tuple], has_next: bool) -> Validator:
+    """
+    Buduje walidator strony listy na podstawie wąskiej projekcji jej elementów.
+
+    Args:
+        rows (Iterable[tuple]): Krotki (id, revision, review_count) elementów strony.
+        has_next (bool): Czy istnieje kolejna strona.
+
+    Returns:
+        Validator: ETag strony (bez Last-Modified – usunięcie miejsca nie zmienia żadnej daty).
+    """
+    return Validator(etag=_etag("places", has_next, *(f"{i}:{r}:{c}" for i, r, c in rows)))
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Porównanie słabe (RFC 9110, 13.1.2) – prefiks W/ jest pomijany."""
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def has_conditions(request: Request) -> bool:
+    """
+    Sprawdza, czy żądanie zawiera nagłówki warunkowe.
+
+    Args:
+        request (Request): Żądanie HTTP.
+
+    Returns:
+        bool: True, jeśli przesłano If-None-Match lub If-Modified-Since.
+    """
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, validator: Validator) -> bool:
+    """
+    Sprawdza, czy klient ma aktualną wersję zasobu.
+
+    If-None-Match ma pierwszeństwo; If-Modified-Since jest brany pod uwagę tylko
+    wtedy, gdy klient nie przesłał ETagu.
+
+    Args:
+        request (Request): Żądanie HTTP.
+        validator (Validator): Bieżący walidator zasobu.
+
+    Returns:
+        bool: True, jeśli można odpowiedzieć 304 Not Modified.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, validator.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validator.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # Last-Modified ma dokładność do sekundy
+    return _as_utc(validator.last_modified).replace(microsecond=0) <= since
+
+
+def not_modified(validator: Validator) -> Response:
+    """
+    Buduje odpowiedź 304 Not Modified z nagłówkami walidatora.
+
+    Args:
+        validator (Validator): Bieżący walidator zasobu.
+
+    Returns:
+        Response: Odpowiedź bez treści.
+    """
+    return Response(status_code=304, headers=validator.headers())
@@ -0,0 +1,291 @@
+from dataclasses import dataclass
+from dotenv import load_dotenv
+import os
+
+# Wczytuje zmienne środowiskowe z pliku .env
+load_dotenv()
+
+
+def _env_int(name: str, default: int) -> int:
+    """
+    Odczytuje liczbę całkowitą ze zmiennej środowiskowej.
+
+    Args:
+        name (str): Nazwa zmiennej środowiskowej.
+        default (int): Wartość używana, gdy zmienna nie jest ustawiona.
+
+    Returns:
+        int: Odczytana wartość.
+    """
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Zmienna {name} musi być liczbą całkowitą, otrzymano: {value!r}")
+
+
+def _env_float(name: str, default: float) -> float:
+    """
+    Odczytuje liczbę zmiennoprzecinkową ze zmiennej środowiskowej.
+
+    Args:
+        name (str): Nazwa zmiennej środowiskowej.
+        default (float): Wartość używana, gdy zmienna nie jest ustawiona.
+
+    Returns:
+        float: Odczytana wartość.
+    """
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Zmienna {name} musi być liczbą, otrzymano: {value!r}")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """
+    Odczytuje wartość logiczną ze zmiennej środowiskowej.
+
+    Akceptowane wartości: 1/0, true/false, yes/no, on/off (bez względu na wielkość liter).
+
+    Args:
+        name (str): Nazwa zmiennej środowiskowej.
+        default (bool): Wartość używana, gdy zmienna nie jest ustawiona.
+
+    Returns:
+        bool: Odczytana wartość.
+    """
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    normalized = value.strip().lower()
+    if normalized in ("1", "true", "yes", "on"):
+        return True
+    if normalized in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"Zmienna {name} musi być wartością logiczną, otrzymano: {value!r}")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Ustawienia aplikacji odczytywane ze zmiennych środowiskowych.
+
+    Atrybuty:
+        database_url (str | None):
+            Adres bazy danych (zmienna DATABASE_URL).
+
+        database_replica_urls (tuple[str, ...]):
+            Adresy replik tylko do odczytu (zmienna DATABASE_REPLICA_URLS, rozdzielone przecinkami).
+
+        replica_pin_seconds (float):
+            Czas w sekundach, przez jaki klient po zapisie czyta z bazy głównej (read-your-writes).
+
+        replica_health_interval (float):
+            Odstęp w sekundach między sprawdzeniami dostępności replik.
+
+        db_pool_size (int):
+            Liczba stałych połączeń w puli (na proces roboczy uvicorn).
+
+        db_max_overflow (int):
+            Liczba dodatkowych połączeń otwieranych ponad db_pool_size przy dużym ruchu.
+
+        db_pool_timeout (float):
+            Maksymalny czas oczekiwania na wolne połączenie w sekundach.
+
+        db_pool_recycle (int):
+            Wiek połączenia w sekundach, po którym jest ono otwierane ponownie (-1 wyłącza).
+
+        db_pool_pre_ping (bool):
+            Czy sprawdzać połączenie przed wydaniem z puli (chroni przed
+            zerwanymi połączeniami, np. po restarcie PostgreSQL).
+
+        db_statement_timeout_ms (int):
+            Limit czasu pojedynczego zapytania w milisekundach (0 wyłącza; tylko PostgreSQL).
+
+        places_default_page_size (int):
+            Domyślna liczba miejsc zwracanych na jednej stronie listy.
+
+        places_max_page_size (int):
+            Maksymalna liczba miejsc, o którą klient może poprosić na jednej stronie.
+
+        places_import_batch_size (int):
+            Liczba wierszy zapisywanych w jednej transakcji podczas importu zbiorczego.
+
+        places_import_max_errors (int):
+            Maksymalna liczba błędów wierszy zwracanych w wyniku importu.
+
+        places_export_batch_size (int):
+            Liczba wierszy odczytywanych naraz z kursora podczas eksportu.
+
+        places_nearby_max_radius_m (int):
+            Maksymalny promień wyszukiwania miejsc w pobliżu w metrach.
+
+        cache_backend (str):
+            Backend pamięci podręcznej odpowiedzi: none, memory lub redis.
+
+        cache_url (str):
+            Adres serwera Redis dla CACHE_BACKEND=redis.
+
+        cache_ttl (float):
+            Czas życia wpisu pamięci podręcznej w sekundach.
+
+        cache_max_entries (int):
+            Maksymalna liczba wpisów pamięci podręcznej w procesie (backend memory).
+
+        ws_queue_size (int):
+            Maksymalna liczba wiadomości WebSocket oczekujących na wysłanie do jednego klienta.
+
+        ws_send_timeout (float):
+            Czas w sekundach, po którym klient nieodbierający wiadomości jest rozłączany.
+
+        ws_overflow_policy (str):
+            Zachowanie przy pełnej kolejce klienta: drop_oldest (usuń najstarszą
+            wiadomość) lub disconnect (rozłącz klienta).
+
+        ws_backplane (str):
+            Szyna łącząca procesy robocze dla wspólnego statusu WebSocket:
+            none (status w procesie), memory, redis lub postgres.
+
+        ws_backplane_url (str | None):
+            Adres backplane'u (domyślnie CACHE_URL dla redis i DATABASE_URL dla postgres).
+
+        ws_leader_ttl (float):
+            Czas dzierżawy lidera publikującego status w sekundach; po awarii lidera
+            inny proces przejmuje publikowanie najpóźniej po tym czasie.
+
+        database_async (bool):
+            Czy endpointy miejsc i recenzji mają korzystać z asynchronicznego
+            silnika bazy danych (asyncpg / aiosqlite) zamiast puli wątków.
+
+        sql_profiling (bool):
+            Czy profilować zapytania SQL każdego żądania (nagłówek Server-Timing,
+            wykrywanie N+1, dziennik wolnych zapytań).
+
+        sql_slow_query_ms (float):
+            Czas zapytania w milisekundach, od którego jest ono zapisywane w dzienniku
+            wolnych zapytań (0 wyłącza; tylko przy SQL_PROFILING).
+
+        sql_n_plus_one_threshold (int):
+            Liczba wykonań tego samego zapytania z różnymi parametrami w jednym
+            żądaniu, od której zgłaszany jest wzorzec N+1.
+
+        reviews_write_behind (bool):
+            Czy POST /places/{place_id}/reviews ma umieszczać recenzje w kolejce
+            (odpowiedź 202) i zapisywać je grupowo w tle.
+
+        review_queue_size (int):
+            Maksymalna liczba recenzji oczekujących na zapis w procesie roboczym;
+            przy pełnej kolejce endpoint odpowiada 503.
+
+        review_batch_size (int):
+            Maksymalna liczba recenzji zapisywanych w jednej transakcji.
+
+        review_flush_interval (float):
+            Maksymalny czas w sekundach, przez jaki recenzja czeka na skompletowanie partii.
+
+        ranking_prior_mean (float):
+            Ocena, do której ściągana jest średnia Bayesa miejsc z małą liczbą recenzji.
+
+        ranking_prior_weight (float):
+            Liczba „wirtualnych” recenzji z oceną ranking_prior_mean w średniej Bayesa.
+
+        trending_half_life_hours (float):
+            Okres półtrwania wagi recenzji w wyniku popularności (GET /places/trending).
+    """
+
+    database_url: str | None
+    database_replica_urls: tuple[str, ...]
+    replica_pin_seconds: float
+    replica_health_interval: float
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_timeout: float
+    db_pool_recycle: int
+    db_pool_pre_ping: bool
+    db_statement_timeout_ms: int
+    places_default_page_size: int
+    places_max_page_size: int
+    places_import_batch_size: int
+    places_import_max_errors: int
+    places_export_batch_size: int
+    places_nearby_max_radius_m: int
+    cache_backend: str
+    cache_url: str
+    cache_ttl: float
+    cache_max_entries: int
+    ws_queue_size: int
+    ws_send_timeout: float
+    ws_overflow_policy: str
+    ws_backplane: str
+    ws_backplane_url: str | None
+    ws_leader_ttl: float
+    database_async: bool
+    sql_profiling: bool
+    sql_slow_query_ms: float
+    sql_n_plus_one_threshold: int
+    reviews_write_behind: bool
+    review_queue_size: int
+    review_batch_size: int
+    review_flush_interval: float
+    ranking_prior_mean: float
+    ranking_prior_weight: float
+    trending_half_life_hours: float
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Tworzy ustawienia na podstawie zmiennych środowiskowych.
+
+        Returns:
+            Settings: Obiekt ustawień aplikacji.
+        """
+        max_page_size = _env_int("PLACES_MAX_PAGE_SIZE", 100)
+        return cls(
+            database_url=os.getenv("DATABASE_URL"),
+            database_replica_urls=tuple(
+                url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+            ),
+            replica_pin_seconds=_env_float("REPLICA_PIN_SECONDS", 5.0),
+            replica_health_interval=_env_float("REPLICA_HEALTH_INTERVAL", 5.0),
+            db_pool_size=_env_int("DB_POOL_SIZE", 5),
+            db_max_overflow=_env_int("DB_MAX_OVERFLOW", 10),
+            db_pool_timeout=_env_float("DB_POOL_TIMEOUT", 30.0),
+            db_pool_recycle=_env_int("DB_POOL_RECYCLE", 1800),
+            db_pool_pre_ping=_env_bool("DB_POOL_PRE_PING", True),
+            db_statement_timeout_ms=_env_int("DB_STATEMENT_TIMEOUT_MS", 0),
+            places_default_page_size=min(_env_int("PLACES_DEFAULT_PAGE_SIZE", 20), max_page_size),
+            places_max_page_size=max_page_size,
+            places_import_batch_size=_env_int("PLACES_IMPORT_BATCH_SIZE", 1000),
+            places_import_max_errors=_env_int("PLACES_IMPORT_MAX_ERRORS", 1000),
+            places_export_batch_size=_env_int("PLACES_EXPORT_BATCH_SIZE", 1000),
+            places_nearby_max_radius_m=_env_int("PLACES_NEARBY_MAX_RADIUS_M", 50_000),
+            cache_backend=os.getenv("CACHE_BACKEND", "none").strip().lower() or "none",
+            cache_url=os.getenv("CACHE_URL", "redis://localhost:6379/0"),
+            cache_ttl=_env_float("CACHE_TTL", 60.0),
+            cache_max_entries=_env_int("CACHE_MAX_ENTRIES", 10_000),
+            ws_queue_size=_env_int("WS_QUEUE_SIZE", 8),
+            ws_send_timeout=_env_float("WS_SEND_TIMEOUT", 5.0),
+            ws_overflow_policy=os.getenv("WS_OVERFLOW_POLICY", "drop_oldest").strip().lower() or "drop_oldest",
+            ws_backplane=os.getenv("WS_BACKPLANE", "none").strip().lower() or "none",
+            ws_backplane_url=os.getenv("WS_BACKPLANE_URL") or None,
+            ws_leader_ttl=_env_float("WS_LEADER_TTL", 5.0),
+            database_async=_env_bool("DATABASE_ASYNC", False),
+            sql_profiling=_env_bool("SQL_PROFILING", False),
+            sql_slow_query_ms=_env_float("SQL_SLOW_QUERY_MS", 100.0),
+            sql_n_plus_one_threshold=_env_int("SQL_N_PLUS_ONE_THRESHOLD", 5),
+            reviews_write_behind=_env_bool("REVIEWS_WRITE_BEHIND", False),
+            review_queue_size=_env_int("REVIEW_QUEUE_SIZE", 10_000),
+            review_batch_size=_env_int("REVIEW_BATCH_SIZE", 500),
+            review_flush_interval=_env_float("REVIEW_FLUSH_INTERVAL", 0.05),
+            ranking_prior_mean=_env_float("RANKING_PRIOR_MEAN", 3.5),
+            ranking_prior_weight=_env_float("RANKING_PRIOR_WEIGHT", 10.0),
+            trending_half_life_hours=_env_float("TRENDING_HALF_LIFE_HOURS", 72.0),
+        )
+
+
+settings = Settings.from_env()
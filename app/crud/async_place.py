@@ -0,0 +1,195 @@
+"""
+Asynchroniczne odpowiedniki funkcji z modułu crud.place.
+
+Logika zapytań nie jest powielana – funkcje synchroniczne wykonywane są przez
+AsyncSession.run_sync w kontekście greenletu. Operacje wejścia/wyjścia trafiają
+przy tym do sterownika asynchronicznego (asyncpg / aiosqlite), więc żądanie nie
+zajmuje wątku z puli, a pętla zdarzeń może w tym czasie obsługiwać inne żądania.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.conditional import Validator
+from app.crud import place as crud
+from app.crud.place import ReviewLoading
+from app.models import Place
+from app.schemas import PlaceCreate, PlaceFilters, PlaceSort
+from app.serialization import PlaceFieldSet
+
+
+async def create_place(db: AsyncSession, place: PlaceCreate) -> Place:
+    """
+    Tworzy nowe miejsce w bazie.
+
+        Args:
+            db (AsyncSession): Instancja asynchronicznej sesji bazy danych.
+            place (PlaceCreate): Dane nowego miejsca przesyłane przez klienta.
+
+        Returns:
+            Place: Obiekt reprezentujący utworzone miejsce.
+     """
+    db_place = await db.run_sync(crud.create_place, place)
+    # Nowe miejsce nie ma recenzji – ustawiamy pustą listę bez dodatkowego zapytania
+    set_committed_value(db_place, "reviews", [])
+    return db_place
+
+async def get_place(db: AsyncSession, place_id: int, reviews: ReviewLoading | None = None) -> Place | None:
+    """
+        Pobiera pojedyncze miejsce na podstawie jego identyfikatora ID.
+
+        Args:
+            db (AsyncSession): Instancja asynchronicznej sesji bazy danych.
+            place_id (int): Unikalny identyfikator miejsca.
+            reviews (ReviewLoading | None): Strategia ładowania recenzji.
+
+        Returns:
+            Place | None: Znaleziony obiekt Place lub None, jeśli nie istnieje.
+    """
+    return await db.run_sync(crud.get_place, place_id, reviews)
+
+async def get_places(
+    db: AsyncSession,
+    filters: PlaceFilters | None = None,
+    sort: PlaceSort = PlaceSort.id,
+    limit: int = 20,
+    cursor: str | None = None,
+    reviews: ReviewLoading = ReviewLoading.none,
+) -> tuple[list[Place], str | None]:
+    """
+        Pobiera jedną stronę listy miejsc, stronicowaną kursorem (keyset).
+
+        Args:
+            db (AsyncSession): Instancja asynchronicznej sesji bazy danych.
+            filters (PlaceFilters | None): Filtry listy miejsc.
+            sort (PlaceSort): Sposób sortowania.
+            limit (int): Maksymalna liczba miejsc na stronie.
+            cursor (str | None): Kursor zwrócony razem z poprzednią stroną.
+            reviews (ReviewLoading): Strategia ładowania recenzji miejsc ze strony.
+
+        Raises:
+            InvalidCursorError: Jeśli kursor jest niepoprawny.
+
+        Returns:
+            tuple[list[Place], str | None]: Miejsca z bieżącej strony oraz kursor kolejnej strony.
+    """
+    return await db.run_sync(
+        lambda session: crud.get_places(session, filters, sort=sort, limit=limit, cursor=cursor, reviews=reviews)
+    )
+
+async def get_places_validator(
+    db: AsyncSession,
+    filters: PlaceFilters | None = None,
+    sort: PlaceSort = PlaceSort.id,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> Validator:
+    """
+        Wylicza ETag strony listy miejsc bez ładowania pełnych wierszy.
+
+        Args:
+            db (AsyncSession): Instancja asynchronicznej sesji bazy danych.
+            filters (PlaceFilters | None): Filtry listy miejsc.
+            sort (PlaceSort): Sposób sortowania.
+            limit (int): Maksymalna liczba miejsc na stronie.
+            cursor (str | None): Kursor zwrócony razem z poprzednią stroną.
+
+        Raises:
+            InvalidCursorError: Jeśli kursor jest niepoprawny.
+
+        Returns:
+            Validator: Walidator strony.
+    """
+    return await db.run_sync(
+        lambda session: crud.get_places_validator(session, filters, sort=sort, limit=limit, cursor=cursor)
+    )
+
+async def get_places_document(
+    db: AsyncSession,
+    filters: PlaceFilters | None = None,
+    sort: PlaceSort = PlaceSort.id,
+    limit: int = 20,
+    cursor: str | None = None,
+    fields: PlaceFieldSet | None = None,
+) -> tuple[dict, Validator]:
+    """
+        Pobiera stronę listy miejsc jako słownik gotowy do serializacji.
+
+        Args:
+            db (AsyncSession): Instancja asynchronicznej sesji bazy danych.
+            filters (PlaceFilters | None): Filtry listy miejsc.
+            sort (PlaceSort): Sposób sortowania.
+            limit (int): Maksymalna liczba miejsc na stronie.
+            cursor (str | None): Kursor zwrócony razem z poprzednią stroną.
+            fields (PlaceFieldSet | None): Wybrane pola miejsc; None – wszystkie pola.
+
+        Raises:
+            InvalidCursorError: Jeśli kursor jest niepoprawny.
+
+        Returns:
+            tuple[dict, Validator]: Strona o kształcie schemas.Page[PlaceSummary] i jej walidator.
+    """
+    return await db.run_sync(
+        lambda session: crud.get_places_document(
+            session, filters, sort=sort, limit=limit, cursor=cursor, fields=fields
+        )
+    )
+
+async def get_place_document(
+    db: AsyncSession, place_id: int, fields: PlaceFieldSet | None = None
+) -> tuple[dict, Validator] | None:
+    """
+        Pobiera miejsce wraz z recenzjami jako słownik gotowy do serializacji.
+
+        Args:
+            db (AsyncSession): Instancja asynchronicznej sesji bazy danych.
+            place_id (int): Unikalny identyfikator miejsca.
+            fields (PlaceFieldSet | None): Wybrane pola miejsca; None – wszystkie pola.
+
+        Returns:
+            tuple[dict, Validator] | None: Miejsce i jego walidator lub None, jeśli miejsce nie istnieje.
+    """
+    return await db.run_sync(crud.get_place_document, place_id, fields)
+
+async def get_place_validator(db: AsyncSession, place_id: int) -> Validator | None:
+    """
+        Wylicza ETag i Last-Modified miejsca jednym wąskim zapytaniem.
+
+        Args:
+            db (AsyncSession): Instancja asynchronicznej sesji bazy danych.
+            place_id (int): Unikalny identyfikator miejsca.
+
+        Returns:
+            Validator | None: Walidator miejsca lub None, jeśli miejsce nie istnieje.
+    """
+    return await db.run_sync(crud.get_place_validator, place_id)
+
+async def update_place(db: AsyncSession, place_id: int, place_update: PlaceCreate) -> Place | None:
+    """
+        Aktualizuje dane istniejącego miejsca.
+
+        Args:
+            db (AsyncSession): Instancja asynchronicznej sesji bazy danych.
+            place_id (int): ID miejsca do aktualizacji.
+            place_update (PlaceCreate): Nowe dane dla miejsca.
+
+        Returns:
+            Place | None: Zaktualizowany obiekt Place (z recenzjami) lub None, jeśli miejsce nie zostało znalezione.
+    """
+    place = await db.run_sync(crud.update_place, place_id, place_update)
+    if place is not None:
+        # Odpowiedź zawiera recenzje – ładujemy je jawnie, bo leniwe ładowanie nie działa poza greenletem
+        await db.refresh(place, ["reviews"])
+    return place
+
+async def delete_place(db: AsyncSession, place_id: int) -> bool:
+    """
+    Usuwa miejsce z bazy danych na podstawie jego identyfikatora.
+
+    Args:
+        db (AsyncSession): Instancja asynchronicznej sesji bazy danych.
+        place_id (int): Unikalny identyfikator miejsca do usunięcia.
+
+    Returns:
+        bool: True, jeśli miejsce zostało usunięte, False, jeśli nie istnieje.
+    """
+    return await db.run_sync(crud.delete_place, place_id)
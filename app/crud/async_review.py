@@ -0,0 +1,57 @@
+"""
+Asynchroniczne odpowiedniki funkcji z modułu crud.review.
+
+Podobnie jak w crud.async_place, funkcje synchroniczne wykonywane są przez
+AsyncSession.run_sync, więc agregaty ocen i pozostała logika zapisu pozostają
+w jednym miejscu.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models, schemas
+from . import review as crud
+
+
+async def create_review(db: AsyncSession, place_id: int, review: schemas.ReviewCreate) -> models.Review | None:
+    """
+    Tworzy nową recenzję dla określonego miejsca.
+
+    Args:
+        db (AsyncSession): Instancja asynchronicznej sesji bazy danych.
+        place_id (int): Unikalny identyfikator miejsca, do którego przypisana jest recenzja.
+        review (schemas.ReviewCreate): Obiekt zawierający dane recenzji.
+
+    Returns:
+        models.Review | None: Obiekt utworzonej recenzji lub None, jeśli miejsce nie istnieje.
+    """
+    return await db.run_sync(crud.create_review, place_id, review)
+
+
+async def get_reviews(
+    db: AsyncSession,
+    place_id: int,
+    filters: schemas.ReviewFilters | None = None,
+    sort: schemas.ReviewSort = schemas.ReviewSort.created_at_desc,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> tuple[list[models.Review], str | None] | None:
+    """
+    Pobiera stronę recenzji miejsca, stronicowaną kursorem po (created_at, id).
+
+    Args:
+        db (AsyncSession): Instancja asynchronicznej sesji bazy danych.
+        place_id (int): Unikalny identyfikator miejsca.
+        filters (schemas.ReviewFilters | None): Filtry po ocenie.
+        sort (schemas.ReviewSort): Kierunek sortowania po dacie dodania.
+        limit (int): Maksymalna liczba recenzji na stronie.
+        cursor (str | None): Kursor zwrócony razem z poprzednią stroną.
+
+    Raises:
+        InvalidCursorError: Jeśli kursor jest niepoprawny.
+
+    Returns:
+        tuple[list[models.Review], str | None] | None: Recenzje z bieżącej strony i kursor
+        kolejnej strony lub None, jeśli miejsce nie istnieje.
+    """
+    return await db.run_sync(
+        lambda session: crud.get_reviews(session, place_id, filters, sort=sort, limit=limit, cursor=cursor)
+    )
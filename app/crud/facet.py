@@ -0,0 +1,145 @@
+"""
+Liczniki facetów listy miejsc (kraj, miasto, bezpłatny wstęp).
+
+Tabela place_facet_counts przechowuje liczbę miejsc dla każdej kombinacji
+(country, city, is_free) i jest aktualizowana w tej samej transakcji co
+zmiana miejsca. Endpoint GET /places/facets sumuje jej wiersze – koszt zależy
+od liczby różnych kombinacji, a nie od liczby miejsc.
+
+Filtry city, country i is_free stosowane są bezpośrednio do tabeli liczników.
+Filtry name i min_rating nie mają odpowiednika w tabeli – wtedy liczniki
+wyliczane są z miejsc spełniających filtry (zapytanie korzysta z indeksów).
+"""
+from collections import Counter
+from typing import Iterable
+
+from sqlalchemy import and_, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Place, PlaceFacetCount
+from app.schemas import PlaceFacets, PlaceFilters
+
+# Kolumny facetów w kolejności klucza kombinacji
+FACETS = ("country", "city", "is_free")
+
+
+def facet_key(place) -> tuple:
+    """
+    Zwraca kombinację wartości facetów miejsca.
+
+    Args:
+        place: Obiekt Place lub słownik z danymi miejsca.
+
+    Returns:
+        tuple: Wartości (country, city, is_free).
+    """
+    if isinstance(place, dict):
+        return tuple(place.get(name) for name in FACETS)
+    return tuple(getattr(place, name) for name in FACETS)
+
+
+def adjust_facet_counts(db: Session, deltas: dict[tuple, int]) -> None:
+    """
+    Zmienia liczniki facetów w bieżącej transakcji (bez zatwierdzania).
+
+    Zmiana trafia do wiersza kombinacji o najmniejszym id; jeśli kombinacji
+    nie ma jeszcze w tabeli, dodawany jest nowy wiersz.
+
+    Args:
+        db (Session): Instancja sesji bazy danych.
+        deltas (dict[tuple, int]): Zmiana liczby miejsc dla każdej kombinacji (country, city, is_free).
+    """
+    for key, delta in deltas.items():
+        if not delta:
+            continue
+        match = and_(*(getattr(PlaceFacetCount, name).is_not_distinct_from(value) for name, value in zip(FACETS, key)))
+        target = select(func.min(PlaceFacetCount.id)).where(match).scalar_subquery()
+        updated = db.execute(
+            update(PlaceFacetCount)
+            .where(PlaceFacetCount.id == target)
+            .values(count=PlaceFacetCount.count + delta)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not updated:
+            db.execute(insert(PlaceFacetCount).values(**dict(zip(FACETS, key)), count=delta))
+
+
+def count_facets(places: Iterable) -> Counter:
+    """
+    Zlicza kombinacje wartości facetów miejsc.
+
+    Args:
+        places (Iterable): Obiekty Place lub słowniki z danymi miejsc.
+
+    Returns:
+        Counter: Liczba miejsc dla każdej kombinacji.
+    """
+    return Counter(facet_key(place) for place in places)
+
+
+def get_facets(db: Session, filters: PlaceFilters | None = None, limit: int = 20) -> PlaceFacets:
+    """
+    Zwraca liczbę miejsc dla każdej wartości kraju, miasta i bezpłatnego wstępu.
+
+    Args:
+        db (Session): Instancja sesji bazy danych.
+        filters (PlaceFilters | None): Aktywne filtry listy miejsc.
+        limit (int): Maksymalna liczba wartości każdego facetu (najliczniejsze).
+
+    Returns:
+        PlaceFacets: Łączna liczba miejsc i liczniki wartości facetów.
+    """
+    from app.crud.place import _apply_filters
+
+    if filters is not None and (filters.name or filters.min_rating is not None):
+        columns = [getattr(Place, name) for name in FACETS]
+        query = _apply_filters(select(*columns, func.count(Place.id)), filters).group_by(*columns)
+    else:
+        columns = [getattr(PlaceFacetCount, name) for name in FACETS]
+        query = select(*columns, func.sum(PlaceFacetCount.count)).group_by(*columns)
+        for name in FACETS:
+            value = getattr(filters, name) if filters is not None else None
+            if value is not None:
+                query = query.where(getattr(PlaceFacetCount, name) == value)
+
+    totals = {name: Counter() for name in FACETS}
+    for *key, count in db.execute(query):
+        for name, value in zip(FACETS, key):
+            totals[name][value] += count
+
+    def _values(counter: Counter) -> list[dict]:
+        # Najliczniejsze wartości najpierw, przy remisie alfabetycznie (brak wartości na końcu)
+        ranked = sorted(
+            ((value, count) for value, count in counter.items() if count > 0),
+            key=lambda item: (-item[1], item[0] is None, item[0] if item[0] is not None else ""),
+        )
+        return [{"value": value, "count": count} for value, count in ranked[:limit]]
+
+    return PlaceFacets(
+        total=sum(totals["country"].values()),
+        **{name: _values(totals[name]) for name in FACETS},
+    )
+
+
+def recompute_facet_counts(db: Session) -> int:
+    """
+    Przelicza od nowa liczniki facetów na podstawie tabeli miejsc.
+
+    Służy do jednorazowego uzupełnienia danych (backfill) oraz naprawy
+    liczników, jeśli miejsca były modyfikowane poza aplikacją.
+
+    Args:
+        db (Session): Instancja sesji bazy danych.
+
+    Returns:
+        int: Liczba kombinacji wartości facetów.
+    """
+    columns = [getattr(Place, name) for name in FACETS]
+    db.execute(delete(PlaceFacetCount))
+    inserted = db.execute(
+        insert(PlaceFacetCount).from_select(
+            [*FACETS, "count"], select(*columns, func.count(Place.id)).group_by(*columns)
+        )
+    ).rowcount
+    db.commit()
+    return inserted
@@ -1,8 +1,80 @@
-from app.schemas import PlaceCreate
-from sqlalchemy.orm import Session
-from app.models import Place
+from app.schemas import PlaceCreate, PlaceFilters, PlaceSort
+from app.pagination import decode_cursor, encode_cursor, keyset_condition
+from enum import Enum
+from math import cos, radians
+from sqlalchemy import and_, func, insert, literal_column, or_, select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from app import feed
+from app.cache import response_cache
+from app.conditional import Validator, collection_validator, place_validator
+from app.crud.facet import adjust_facet_counts, count_facets, facet_key
+from app.models import Place, Review
+from app.geo import (
+    GEOGRAPHY_EXPRESSION, METERS_PER_DEGREE, covering_cells, encode_geohash, has_postgis, haversine_m, prefix_range,
+)
+from app.ranking import trending_now
+from app.search import apply_search, search_terms
+from app.serialization import (
+    HISTOGRAM_COLUMNS, REVIEW_COLUMNS, SUMMARY_COLUMNS, PlaceFieldSet, page_document, review_document,
+    summary_document, unique_columns,
+)
 
 
+class ReviewLoading(str, Enum):
+    """
+    Strategia ładowania recenzji razem z miejscami.
+
+    - none: recenzje nie są ładowane; próba odczytu zgłasza błąd zamiast
+      wykonywać osobne zapytanie dla każdego miejsca (N+1),
+    - selectin: recenzje wszystkich miejsc ładowane jednym dodatkowym zapytaniem IN,
+    - joined: recenzje ładowane w tym samym zapytaniu przez LEFT OUTER JOIN.
+    """
+
+    none = "none"
+    selectin = "selectin"
+    joined = "joined"
+
+
+def _review_loader(strategy: ReviewLoading):
+    """
+    Zwraca opcję zapytania odpowiadającą strategii ładowania recenzji.
+
+    Args:
+        strategy (ReviewLoading): Wybrana strategia.
+
+    Returns:
+        ORMOption: Opcja do przekazania w zapytaniu.
+    """
+    if strategy == ReviewLoading.selectin:
+        return selectinload(Place.reviews)
+    if strategy == ReviewLoading.joined:
+        return joinedload(Place.reviews)
+    return raiseload(Place.reviews)
+
+# Kolumny klucza stronicowania dla każdego sposobu sortowania
+_SORT_KEYS = {
+    PlaceSort.id: (Place.id,),
+    PlaceSort.created_at: (Place.created_at, Place.id),
+    PlaceSort.rating: (Place.rating_avg, Place.id),
+}
+
+
+def _with_geohash(values: dict) -> dict:
+    """
+    Uzupełnia dane miejsca o geohash wyliczony ze współrzędnych.
+
+    Args:
+        values (dict): Dane miejsca (wynik model_dump()).
+
+    Returns:
+        dict: Te same dane z kluczem "geohash".
+    """
+    latitude, longitude = values.get("latitude"), values.get("longitude")
+    values["geohash"] = (
+        encode_geohash(latitude, longitude) if latitude is not None and longitude is not None else None
+    )
+    return values
+
 def create_place(db: Session, place: PlaceCreate) -> Place:
     """
     Tworzy nowe miejsce w bazie.
@@ -14,37 +86,441 @@ def create_place(db: Session, place: PlaceCreate) -> Place:
         Returns:
             Place: Obiekt reprezentujący utworzone miejsce.
      """
-    db_place = Place(**place.model_dump())
+    db_place = Place(**_with_geohash(place.model_dump()))
     db.add(db_place)
+    adjust_facet_counts(db, count_facets([db_place]))
     db.commit()
     db.refresh(db_place)
+    response_cache.invalidate_place(None)
+    feed.place_changed("place.created", db_place)
 
     return db_place
 
-def get_place(db: Session, place_id: int) -> Place | None:
+def bulk_create_places(db: Session, places: list[PlaceCreate]) -> list[int]:
+    """
+    Tworzy wiele miejsc w jednej transakcji.
+
+    Wiersze zapisywane są wielowierszowymi instrukcjami INSERT ... RETURNING
+    (mechanizm insertmanyvalues SQLAlchemy), bez odświeżania każdego obiektu,
+    więc koszt na wiersz to ułamek pojedynczego create_place.
+
+        Args:
+            db (Session): Instancja sesji bazy danych.
+            places (list[PlaceCreate]): Dane nowych miejsc.
+
+        Returns:
+            list[int]: Identyfikatory utworzonych miejsc w kolejności danych wejściowych.
+    """
+    if not places:
+        return []
+    rows = [_with_geohash(place.model_dump()) for place in places]
+    ids = db.scalars(insert(Place).returning(Place.id, sort_by_parameter_order=True), rows).all()
+    adjust_facet_counts(db, count_facets(rows))
+    db.commit()
+    response_cache.invalidate_place(None)
+    feed.places_imported(ids, [place.city for place in places])
+    return list(ids)
+
+def get_place(db: Session, place_id: int, reviews: ReviewLoading | None = None) -> Place | None:
     """
         Pobiera pojedyncze miejsce na podstawie jego identyfikatora ID.
 
         Args:
             db (Session): Instancja sesji bazy danych.
             place_id (int): Unikalny identyfikator miejsca.
+            reviews (ReviewLoading | None): Strategia ładowania recenzji; None zachowuje
+                domyślne leniwe ładowanie relacji.
 
         Returns:
             Place | None: Znaleziony obiekt Place lub None, jeśli nie istnieje.
     """
-    return db.get(Place, place_id)
+    if reviews is None:
+        return db.get(Place, place_id)
+    return db.get(Place, place_id, options=[_review_loader(reviews)])
+
+def _apply_filters(query, filters: PlaceFilters | None):
+    """
+    Dodaje do zapytania warunki wynikające z filtrów listy miejsc.
+
+    Args:
+        query (Select): Zapytanie o miejsca.
+        filters (PlaceFilters | None): Filtry przesłane przez klienta.
+
+    Returns:
+        Select: Zapytanie z dodanymi warunkami.
+    """
+    if filters is None:
+        return query
+    if filters.city is not None:
+        query = query.where(Place.city == filters.city)
+    if filters.country is not None:
+        query = query.where(Place.country == filters.country)
+    if filters.name:
+        query = query.where(Place.name.startswith(filters.name, autoescape=True))
+    if filters.is_free is not None:
+        query = query.where(Place.is_free == filters.is_free)
+    if filters.min_rating is not None:
+        query = query.where(Place.rating_avg >= filters.min_rating)
+    return query
+
+def _page_query(query, filters: PlaceFilters | None, sort: PlaceSort, cursor: str | None):
+    """
+    Dodaje do zapytania filtry, warunek kursora i sortowanie strony listy miejsc.
+
+    Args:
+        query (Select): Zapytanie o miejsca lub o wybrane kolumny miejsc.
+        filters (PlaceFilters | None): Filtry listy miejsc.
+        sort (PlaceSort): Sposób sortowania.
+        cursor (str | None): Kursor zwrócony razem z poprzednią stroną.
+
+    Raises:
+        InvalidCursorError: Jeśli kursor jest niepoprawny.
+
+    Returns:
+        tuple[Select, tuple]: Zapytanie oraz kolumny klucza stronicowania.
+    """
+    descending = sort.value.startswith("-")
+    columns = _SORT_KEYS[PlaceSort(sort.value.lstrip("-"))]
+
+    query = _apply_filters(query, filters)
+    if cursor is not None:
+        key = decode_cursor(cursor, sort.value, columns)
+        query = query.where(keyset_condition(columns, key, descending))
+    return query.order_by(*(col.desc() if descending else col.asc() for col in columns)), columns
+
+def get_places(
+    db: Session,
+    filters: PlaceFilters | None = None,
+    sort: PlaceSort = PlaceSort.id,
+    limit: int = 20,
+    cursor: str | None = None,
+    reviews: ReviewLoading = ReviewLoading.none,
+) -> tuple[list[Place], str | None]:
+    """
+        Pobiera jedną stronę listy miejsc, stronicowaną kursorem (keyset).
+
+        Zamiast OFFSET zapytanie zaczyna od klucza ostatniego elementu poprzedniej
+        strony, więc koszt pobrania dowolnej strony jest taki sam jak pierwszej.
+
+        Args:
+            db (Session): Instancja sesji bazy danych.
+            filters (PlaceFilters | None): Filtry listy miejsc.
+            sort (PlaceSort): Sposób sortowania.
+            limit (int): Maksymalna liczba miejsc na stronie.
+            cursor (str | None): Kursor zwrócony razem z poprzednią stroną.
+            reviews (ReviewLoading): Strategia ładowania recenzji miejsc ze strony.
+
+        Raises:
+            InvalidCursorError: Jeśli kursor jest niepoprawny.
+
+        Returns:
+            tuple[list[Place], str | None]: Miejsca z bieżącej strony oraz kursor kolejnej strony.
+    """
+    sort = PlaceSort(sort)
+    query, columns = _page_query(select(Place).options(_review_loader(reviews)), filters, sort, cursor)
+
+    # Pobieramy jeden element więcej, aby wiedzieć, czy istnieje kolejna strona
+    places = list(db.scalars(query.limit(limit + 1)).unique())
+    next_cursor = None
+    if len(places) > limit:
+        places = places[:limit]
+        last = places[-1]
+        next_cursor = encode_cursor(sort.value, [getattr(last, col.key) for col in columns])
+    return places, next_cursor
+
+def get_places_validator(
+    db: Session,
+    filters: PlaceFilters | None = None,
+    sort: PlaceSort = PlaceSort.id,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> Validator:
+    """
+        Wylicza ETag strony listy miejsc bez ładowania pełnych wierszy.
+
+        Zapytanie jest takie samo jak w get_places, ale pobiera tylko kolumny
+        id, revision i review_count, więc jest tanie także dla dużych stron.
+
+        Args:
+            db (Session): Instancja sesji bazy danych.
+            filters (PlaceFilters | None): Filtry listy miejsc.
+            sort (PlaceSort): Sposób sortowania.
+            limit (int): Maksymalna liczba miejsc na stronie.
+            cursor (str | None): Kursor zwrócony razem z poprzednią stroną.
+
+        Raises:
+            InvalidCursorError: Jeśli kursor jest niepoprawny.
+
+        Returns:
+            Validator: Walidator strony.
+    """
+    projection = select(Place.id, Place.revision, Place.review_count)
+    query, _ = _page_query(projection, filters, PlaceSort(sort), cursor)
+    rows = [tuple(row) for row in db.execute(query.limit(limit + 1))]
+    return collection_validator(rows[:limit], len(rows) > limit)
 
-def get_places(db: Session) -> list[Place]:
+def get_places_document(
+    db: Session,
+    filters: PlaceFilters | None = None,
+    sort: PlaceSort = PlaceSort.id,
+    limit: int = 20,
+    cursor: str | None = None,
+    fields: PlaceFieldSet | None = None,
+) -> tuple[dict, Validator]:
     """
-        Pobiera listę miejsc z bazy.
+        Pobiera stronę listy miejsc jako słownik gotowy do serializacji.
+
+        Zapytanie jest takie samo jak w get_places, ale zwraca wiersze (RowMapping)
+        zamiast obiektów ORM, więc odpowiedź nie wymaga walidacji Pydantic.
+        Zestaw pól zawęża listę pobieranych kolumn do pól odpowiedzi oraz kolumn
+        klucza stronicowania i ETagu.
 
         Args:
             db (Session): Instancja sesji bazy danych.
+            filters (PlaceFilters | None): Filtry listy miejsc.
+            sort (PlaceSort): Sposób sortowania.
+            limit (int): Maksymalna liczba miejsc na stronie.
+            cursor (str | None): Kursor zwrócony razem z poprzednią stroną.
+            fields (PlaceFieldSet | None): Wybrane pola miejsc; None – wszystkie pola PlaceSummary.
+
+        Raises:
+            InvalidCursorError: Jeśli kursor jest niepoprawny.
 
         Returns:
-            list[Place]: Lista obiektów Place.
+            tuple[dict, Validator]: Strona o kształcie schemas.Page[PlaceSummary] i jej walidator.
     """
-    return db.query(Place).all()
+    sort = PlaceSort(sort)
+    output = fields.columns if fields is not None else (*SUMMARY_COLUMNS, *HISTOGRAM_COLUMNS)
+    sort_columns = _SORT_KEYS[PlaceSort(sort.value.lstrip("-"))]
+    projection = select(*unique_columns(*output, *sort_columns, Place.revision, Place.review_count))
+    query, columns = _page_query(projection, filters, sort, cursor)
+
+    rows = db.execute(query.limit(limit + 1)).mappings().all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(sort.value, [rows[-1][col.key] for col in columns])
+
+    validator = collection_validator(
+        [(row["id"], row["revision"], row["review_count"]) for row in rows], next_cursor is not None
+    )
+    to_document = fields.document if fields is not None else summary_document
+    return page_document(map(to_document, rows), next_cursor), validator
+
+def get_place_validator(db: Session, place_id: int) -> Validator | None:
+    """
+        Wylicza ETag i Last-Modified miejsca jednym wąskim zapytaniem.
+
+        Data najnowszej recenzji odczytywana jest z indeksu
+        (place_id, created_at, id), bez ładowania recenzji.
+
+        Args:
+            db (Session): Instancja sesji bazy danych.
+            place_id (int): Unikalny identyfikator miejsca.
+
+        Returns:
+            Validator | None: Walidator miejsca lub None, jeśli miejsce nie istnieje.
+    """
+    last_review_at = (
+        select(func.max(Review.created_at)).where(Review.place_id == Place.id).scalar_subquery()
+    )
+    row = db.execute(
+        select(Place.revision, Place.updated_at, Place.review_count, last_review_at).where(Place.id == place_id)
+    ).first()
+    if row is None:
+        return None
+    return place_validator(place_id, *row)
+
+def get_place_document(
+    db: Session, place_id: int, fields: PlaceFieldSet | None = None
+) -> tuple[dict, Validator] | None:
+    """
+        Pobiera miejsce wraz z recenzjami jako słownik gotowy do serializacji.
+
+        Wykonywane są dwa zapytania o wybrane kolumny (miejsce i jego recenzje,
+        po indeksie place_id) – bez obiektów ORM i walidacji Pydantic. Zestaw pól
+        bez recenzji ogranicza się do jednego zapytania o wybrane kolumny, a datę
+        najnowszej recenzji (do ETagu) odczytuje z indeksu.
+
+        Args:
+            db (Session): Instancja sesji bazy danych.
+            place_id (int): Unikalny identyfikator miejsca.
+            fields (PlaceFieldSet | None): Wybrane pola miejsca; None – wszystkie pola Place.
+
+        Returns:
+            tuple[dict, Validator] | None: Miejsce o kształcie schemas.Place (lub modelu
+            zestawu pól) i jego walidator lub None, jeśli miejsce nie istnieje.
+    """
+    with_reviews = fields is None or fields.reviews
+    output = fields.columns if fields is not None else (*SUMMARY_COLUMNS, *HISTOGRAM_COLUMNS)
+    projection = unique_columns(*output, Place.revision, Place.updated_at, Place.review_count)
+    if not with_reviews:
+        last_review_at = select(func.max(Review.created_at)).where(Review.place_id == Place.id).scalar_subquery()
+        projection.append(last_review_at.label("last_review_at"))
+    row = db.execute(select(*projection).where(Place.id == place_id)).mappings().first()
+    if row is None:
+        return None
+
+    document = fields.document(row) if fields is not None else summary_document(row)
+    if with_reviews:
+        reviews = db.execute(
+            select(*REVIEW_COLUMNS).where(Review.place_id == place_id).order_by(Review.id)
+        ).mappings().all()
+        document["reviews"] = [review_document(review) for review in reviews]
+        last_review_at = max((review["created_at"] for review in reviews), default=None)
+    else:
+        last_review_at = row["last_review_at"]
+    validator = place_validator(place_id, row["revision"], row["updated_at"], row["review_count"], last_review_at)
+    return document, validator
+
+def _ranked_places(db: Session, score, city: str | None, country: str | None, limit: int) -> list[dict]:
+    """
+    Pobiera miejsca z najwyższym wynikiem rankingu jako słowniki gotowe do serializacji.
+
+    Miejsca bez recenzji mają wynik 0 i są pomijane. Zapytanie czyta indeks
+    (score, id) albo (city lub country, score, id) od końca, więc jego koszt
+    zależy od limitu, a nie od liczby miejsc i recenzji.
+
+    Args:
+        db (Session): Instancja sesji bazy danych.
+        score: Kolumna wyniku rankingu.
+        city (str | None): Ranking w mieście.
+        country (str | None): Ranking w kraju.
+        limit (int): Maksymalna liczba miejsc.
+
+    Returns:
+        list[dict]: Miejsca o kształcie schemas.PlaceSummary z wynikiem w polu score.
+    """
+    query = select(*SUMMARY_COLUMNS, *HISTOGRAM_COLUMNS, score.label("score")).where(score > 0)
+    if city is not None:
+        query = query.where(Place.city == city)
+    if country is not None:
+        query = query.where(Place.country == country)
+    rows = db.execute(query.order_by(score.desc(), Place.id.desc()).limit(limit)).mappings()
+    return [{**summary_document(row), "score": row["score"]} for row in rows]
+
+def get_top_places(
+    db: Session, city: str | None = None, country: str | None = None, limit: int = 20
+) -> list[dict]:
+    """
+        Pobiera najlepiej oceniane miejsca według średniej Bayesa.
+
+        Args:
+            db (Session): Instancja sesji bazy danych.
+            city (str | None): Ranking w mieście.
+            country (str | None): Ranking w kraju.
+            limit (int): Maksymalna liczba miejsc.
+
+        Returns:
+            list[dict]: Miejsca o kształcie schemas.PlaceRanked, od najwyższej średniej.
+    """
+    return _ranked_places(db, Place.bayesian_score, city, country, limit)
+
+def get_trending_places(
+    db: Session, city: str | None = None, country: str | None = None, limit: int = 20
+) -> list[dict]:
+    """
+        Pobiera miejsca z najwyższym wynikiem popularności (świeże i dobrze ocenione recenzje).
+
+        Args:
+            db (Session): Instancja sesji bazy danych.
+            city (str | None): Ranking w mieście.
+            country (str | None): Ranking w kraju.
+            limit (int): Maksymalna liczba miejsc.
+
+        Returns:
+            list[dict]: Miejsca o kształcie schemas.PlaceRanked z wynikiem na chwilę odczytu.
+    """
+    places = _ranked_places(db, Place.trending_score, city, country, limit)
+    for place in places:
+        place["score"] = trending_now(place["score"])
+    return places
+
+def search_places(
+    db: Session,
+    text: str,
+    filters: PlaceFilters | None = None,
+    limit: int = 20,
+) -> list[Place]:
+    """
+        Wyszukuje miejsca pełnotekstowo po nazwie, mieście i opisie.
+
+        Wyniki są posortowane od najlepiej dopasowanych; ostatni wyraz zapytania
+        dopasowywany jest jako prefiks.
+
+        Args:
+            db (Session): Instancja sesji bazy danych.
+            text (str): Tekst zapytania wpisany przez użytkownika.
+            filters (PlaceFilters | None): Dodatkowe filtry listy miejsc.
+            limit (int): Maksymalna liczba wyników.
+
+        Returns:
+            list[Place]: Znalezione miejsca (bez recenzji).
+    """
+    terms = search_terms(text)
+    if not terms:
+        return []
+    query = select(Place).options(_review_loader(ReviewLoading.none))
+    query = apply_search(_apply_filters(query, filters), db.get_bind().dialect.name, terms)
+    return list(db.scalars(query.limit(limit)))
+
+def get_nearby_places(
+    db: Session,
+    latitude: float,
+    longitude: float,
+    radius_m: float,
+    filters: PlaceFilters | None = None,
+    limit: int = 20,
+) -> list[tuple[Place, float]]:
+    """
+        Pobiera miejsca położone w zadanym promieniu, od najbliższego.
+
+        Na PostgreSQL z PostGIS zapytanie korzysta z indeksu GiST (ST_DWithin).
+        W pozostałych bazach kandydaci wybierani są zakresami indeksu geohash
+        (komórka środka i jej sąsiedzi), a odległość przybliżana rzutem
+        równoodległościowym – dzięki temu koszt zależy od liczby miejsc w okolicy,
+        a nie od rozmiaru tabeli. Zwracana odległość liczona jest wzorem haversine.
+
+        Args:
+            db (Session): Instancja sesji bazy danych.
+            latitude (float): Szerokość geograficzna punktu.
+            longitude (float): Długość geograficzna punktu.
+            radius_m (float): Promień wyszukiwania w metrach.
+            filters (PlaceFilters | None): Dodatkowe filtry listy miejsc.
+            limit (int): Maksymalna liczba miejsc.
+
+        Returns:
+            list[tuple[Place, float]]: Miejsca wraz z odległością w metrach, od najbliższego.
+    """
+    query = _apply_filters(select(Place).options(_review_loader(ReviewLoading.none)), filters)
+
+    if has_postgis(db.connection()):
+        place_point = literal_column(GEOGRAPHY_EXPRESSION)
+        center = func.geography(func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326))
+        distance = func.ST_Distance(place_point, center)
+        query = (
+            query.add_columns(distance)
+            .where(Place.latitude.is_not(None), func.ST_DWithin(place_point, center, radius_m))
+            .order_by(distance, Place.id)
+        )
+        return [(place, float(distance_m)) for place, distance_m in db.execute(query.limit(limit))]
+
+    cells = []
+    for cell in covering_cells(latitude, longitude, radius_m):
+        lower, upper = prefix_range(cell)
+        cells.append(and_(Place.geohash >= lower, Place.geohash < upper) if upper else Place.geohash >= lower)
+
+    # Kwadrat odległości w rzucie równoodległościowym – wystarczający do sortowania na małym obszarze
+    d_lat = (Place.latitude - latitude) * METERS_PER_DEGREE
+    d_lon = (Place.longitude - longitude) * (METERS_PER_DEGREE * cos(radians(latitude)))
+    approx = d_lat * d_lat + d_lon * d_lon
+    query = query.where(or_(*cells), approx <= radius_m * radius_m).order_by(approx, Place.id)
+
+    places = [
+        (place, haversine_m(latitude, longitude, place.latitude, place.longitude))
+        for place in db.scalars(query.limit(limit))
+    ]
+    return sorted(places, key=lambda item: item[1])
 
 def update_place(db: Session, place_id: int, place_update: PlaceCreate) -> Place | None:
     """
@@ -61,10 +537,16 @@ def update_place(db: Session, place_id: int, place_update: PlaceCreate) -> Place
     place = get_place(db, place_id)
     if not place:
         return None
-    for key, value in place_update.model_dump().items():
+    previous = facet_key(place)
+    for key, value in _with_geohash(place_update.model_dump()).items():
         setattr(place, key, value)
+    place.revision = Place.revision + 1
+    if facet_key(place) != previous:
+        adjust_facet_counts(db, {previous: -1, facet_key(place): 1})
     db.commit()
     db.refresh(place)
+    response_cache.invalidate_place(place_id)
+    feed.place_changed("place.updated", place)
     return place
 
 def delete_place(db: Session, place_id: int) -> bool:
@@ -84,6 +566,10 @@ def delete_place(db: Session, place_id: int) -> bool:
     if not place:
         return False
 
+    city = place.city
+    adjust_facet_counts(db, {facet_key(place): -1})
     db.delete(place)
     db.commit()
+    response_cache.invalidate_place(place_id)
+    feed.place_deleted(place_id, city)
     return True
@@ -1,10 +1,65 @@
+from sqlalchemy import Float, bindparam, case, cast, func, insert, select, update
 from sqlalchemy.orm import Session
-from .. import models, schemas
+from .. import feed, models, schemas
+from ..cache import response_cache
+from ..pagination import decode_cursor, encode_cursor, keyset_condition
+from ..ranking import bayesian_score, trending_weight
+
+# Kolumny klucza stronicowania recenzji
+_SORT_KEY = (models.Review.created_at, models.Review.id)
+
+
+def _rating_increments(
+    place_table, count: int, rating_sum: int, histogram: dict[int, int], trending: float
+) -> dict:
+    """
+    Buduje wartości UPDATE zwiększające agregaty ocen i wyniki rankingów miejsca.
+
+    Wyrażenia odwołują się do bieżących wartości kolumn, więc aktualizacja jest
+    atomowa także przy równoległym dodawaniu recenzji do tego samego miejsca.
+
+    Args:
+        place_table: Klasa lub tabela miejsc, której kolumny są aktualizowane.
+        count (int): Liczba dodawanych recenzji.
+        rating_sum (int): Suma dodawanych ocen.
+        histogram (dict[int, int]): Liczba dodawanych recenzji dla każdej oceny.
+        trending (float): Suma wag dodawanych recenzji w wyniku popularności.
+
+    Returns:
+        dict: Słownik wartości do przekazania w ``update().values()``.
+    """
+    values = {
+        "review_count": place_table.review_count + count,
+        "rating_sum": place_table.rating_sum + rating_sum,
+        "rating_avg": cast(place_table.rating_sum + rating_sum, Float) / (place_table.review_count + count),
+        "bayesian_score": bayesian_score(place_table.review_count + count, place_table.rating_sum + rating_sum),
+        "trending_score": place_table.trending_score + trending,
+        # Dodanie recenzji nie jest edycją miejsca – updated_at pozostaje bez zmian
+        "updated_at": place_table.updated_at,
+    }
+    for stars, stars_count in histogram.items():
+        column = f"rating_{stars}"
+        values[column] = getattr(place_table, column) + stars_count
+    return values
+
+
+def _bayesian_or_zero(place_table):
+    """Średnia Bayesa miejsca lub 0 dla miejsca bez recenzji (jak przed pierwszą recenzją)."""
+    return case(
+        (place_table.review_count > 0, bayesian_score(place_table.review_count, place_table.rating_sum)),
+        else_=0.0,
+    )
 
 
 def create_review(db: Session, place_id: int, review: schemas.ReviewCreate) -> models.Review | None:
     """
     Tworzy nową recenzję dla określonego miejsca.
+
+    Agregaty ocen miejsca (liczba, suma, średnia, histogram) i wyniki rankingów
+    są aktualizowane w tej samej transakcji co zapis recenzji. Ta sama instrukcja
+    UPDATE sprawdza też, czy miejsce istnieje, więc nie jest potrzebne osobne
+    zapytanie SELECT.
+
     Args:
         db (Session): Instancja sesji bazy danych.
         place_id (int): Unikalny identyfikator miejsca, do którego przypisana jest recenzja.
@@ -14,9 +69,17 @@ def create_review(db: Session, place_id: int, review: schemas.ReviewCreate) -> m
         models.Review | None: Obiekt utworzonej recenzji lub None, jeśli miejsce nie istnieje.
     """
 
-    place_exists = db.query(models.Place.id).filter(models.Place.id == place_id).first()
+    # RETURNING zwraca nowe agregaty i miasto na potrzeby strumienia zmian bez osobnego SELECT
+    increments = _rating_increments(models.Place, 1, review.rating, {review.rating: 1}, trending_weight(review.rating))
+    place_row = db.execute(
+        update(models.Place)
+        .where(models.Place.id == place_id)
+        .values(**increments)
+        .returning(models.Place.city, models.Place.review_count, models.Place.rating_avg)
+        .execution_options(synchronize_session=False)
+    ).first()
 
-    if not place_exists:
+    if place_row is None:
         return None
 
     db_review = models.Review(
@@ -26,4 +89,250 @@ def create_review(db: Session, place_id: int, review: schemas.ReviewCreate) -> m
     db.add(db_review)
     db.commit()
     db.refresh(db_review)
+    response_cache.invalidate_place(place_id)
+    feed.review_created(db_review, *place_row)
     return db_review
+
+
+def create_reviews_batch(
+    db: Session, items: list[tuple[int, schemas.ReviewCreate]]
+) -> list[models.Review | None]:
+    """
+    Zapisuje wiele recenzji w jednej transakcji (zapis grupowy kolejki recenzji).
+
+    Liczba zapytań nie zależy od liczby recenzji: jedno sprawdzenie istnienia
+    miejsc, jeden wielowierszowy INSERT, jedna instrukcja UPDATE agregatów
+    wykonana dla każdego miejsca (executemany) i jeden odczyt nowych agregatów.
+
+    Args:
+        db (Session): Instancja sesji bazy danych.
+        items (list[tuple[int, schemas.ReviewCreate]]): Pary (identyfikator miejsca, dane recenzji).
+
+    Returns:
+        list[models.Review | None]: Utworzone recenzje w kolejności ``items``;
+        None dla recenzji miejsc, które nie istnieją.
+    """
+    Place, Review = models.Place, models.Review
+    place_ids = {place_id for place_id, _ in items}
+    existing = set(db.scalars(select(Place.id).where(Place.id.in_(place_ids))))
+
+    accepted = [(place_id, review) for place_id, review in items if place_id in existing]
+    rows = [{**review.model_dump(), "place_id": place_id} for place_id, review in accepted]
+    created = []
+    if rows:
+        # Identyfikatory nadawane są w kolejności wierszy VALUES (SQLite i PostgreSQL), więc posortowane
+        # odpowiadają kolejności parametrów; sort_by_parameter_order wymusiłby w SQLite INSERT dla każdego wiersza
+        inserted = sorted(db.execute(insert(Review).returning(Review.id, Review.created_at), rows).all())
+        created = [
+            Review(**row, id=review_id, created_at=created_at)
+            for row, (review_id, created_at) in zip(rows, inserted)
+        ]
+
+        increments = {}
+        for review in created:
+            entry = increments.setdefault(
+                review.place_id, {"b_id": review.place_id, "b_count": 0, "b_sum": 0, "b_trending": 0.0}
+            )
+            entry["b_count"] += 1
+            entry["b_sum"] += review.rating
+            entry["b_trending"] += trending_weight(review.rating, review.created_at)
+            entry[f"b_stars_{review.rating}"] = entry.get(f"b_stars_{review.rating}", 0) + 1
+        for entry in increments.values():
+            for stars in range(1, 6):
+                entry.setdefault(f"b_stars_{stars}", 0)
+
+        # Tabela (a nie klasa) – lista parametrów oznacza wtedy executemany jednej instrukcji
+        histogram = {stars: bindparam(f"b_stars_{stars}") for stars in range(1, 6)}
+        db.execute(
+            update(Place.__table__)
+            .where(Place.__table__.c.id == bindparam("b_id"))
+            .values(**_rating_increments(
+                Place.__table__.c, bindparam("b_count"), bindparam("b_sum"), histogram, bindparam("b_trending")
+            )),
+            list(increments.values()),
+        )
+        aggregates = {
+            row.id: row
+            for row in db.execute(
+                select(Place.id, Place.city, Place.review_count, Place.rating_avg).where(Place.id.in_(increments))
+            )
+        }
+    db.commit()
+
+    for place_id in {review.place_id for review in created}:
+        response_cache.invalidate_place(place_id)
+    for review in created:
+        place = aggregates[review.place_id]
+        feed.review_created(review, place.city, place.review_count, place.rating_avg)
+
+    by_item = iter(created)
+    return [next(by_item) if place_id in existing else None for place_id, _ in items]
+
+
+def get_reviews(
+    db: Session,
+    place_id: int,
+    filters: schemas.ReviewFilters | None = None,
+    sort: schemas.ReviewSort = schemas.ReviewSort.created_at_desc,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> tuple[list[models.Review], str | None] | None:
+    """
+    Pobiera stronę recenzji miejsca, stronicowaną kursorem po (created_at, id).
+
+    Zapytanie korzysta z indeksu (place_id, created_at, id), więc koszt strony
+    nie zależy od liczby recenzji miejsca ani od numeru strony.
+
+    Args:
+        db (Session): Instancja sesji bazy danych.
+        place_id (int): Unikalny identyfikator miejsca.
+        filters (schemas.ReviewFilters | None): Filtry po ocenie.
+        sort (schemas.ReviewSort): Kierunek sortowania po dacie dodania.
+        limit (int): Maksymalna liczba recenzji na stronie.
+        cursor (str | None): Kursor zwrócony razem z poprzednią stroną.
+
+    Raises:
+        InvalidCursorError: Jeśli kursor jest niepoprawny.
+
+    Returns:
+        tuple[list[models.Review], str | None] | None: Recenzje z bieżącej strony i kursor
+        kolejnej strony lub None, jeśli miejsce nie istnieje.
+    """
+    sort = schemas.ReviewSort(sort)
+    descending = sort.value.startswith("-")
+
+    query = select(models.Review).where(models.Review.place_id == place_id)
+    if filters is not None:
+        if filters.rating is not None:
+            query = query.where(models.Review.rating == filters.rating)
+        if filters.min_rating is not None:
+            query = query.where(models.Review.rating >= filters.min_rating)
+        if filters.max_rating is not None:
+            query = query.where(models.Review.rating <= filters.max_rating)
+    if cursor is not None:
+        key = decode_cursor(cursor, sort.value, _SORT_KEY)
+        query = query.where(keyset_condition(_SORT_KEY, key, descending))
+    query = query.order_by(*(col.desc() if descending else col.asc() for col in _SORT_KEY))
+
+    reviews = list(db.scalars(query.limit(limit + 1)))
+
+    # Pusta strona może oznaczać brak miejsca – dopiero wtedy sprawdzamy jego istnienie
+    if not reviews and db.get(models.Place, place_id) is None:
+        return None
+
+    next_cursor = None
+    if len(reviews) > limit:
+        reviews = reviews[:limit]
+        last = reviews[-1]
+        next_cursor = encode_cursor(sort.value, [last.created_at, last.id])
+    return reviews, next_cursor
+
+
+def recompute_rating_stats(db: Session, place_id: int | None = None) -> int:
+    """
+    Przelicza od nowa agregaty ocen na podstawie tabeli recenzji.
+
+    Służy do jednorazowego uzupełnienia danych (backfill) oraz naprawy
+    agregatów, jeśli recenzje były modyfikowane poza aplikacją.
+
+    Args:
+        db (Session): Instancja sesji bazy danych.
+        place_id (int | None): Identyfikator miejsca do przeliczenia; None oznacza wszystkie miejsca.
+
+    Returns:
+        int: Liczba zaktualizowanych miejsc.
+    """
+    Place, Review = models.Place, models.Review
+
+    def _count(*conditions):
+        return (
+            select(func.count(Review.id))
+            .where(Review.place_id == Place.id, *conditions)
+            .scalar_subquery()
+        )
+
+    values = {
+        "review_count": _count(),
+        "rating_sum": select(func.coalesce(func.sum(Review.rating), 0))
+        .where(Review.place_id == Place.id)
+        .scalar_subquery(),
+        "updated_at": Place.updated_at,
+    }
+    for stars in range(1, 6):
+        values[f"rating_{stars}"] = _count(Review.rating == stars)
+
+    statement = update(Place).values(**values).execution_options(synchronize_session=False)
+    if place_id is not None:
+        statement = statement.where(Place.id == place_id)
+    updated = db.execute(statement).rowcount
+
+    # Średnie liczone w drugim kroku z już przeliczonych kolumn
+    average = (
+        update(Place)
+        .values(
+            rating_avg=func.coalesce(cast(Place.rating_sum, Float) / func.nullif(Place.review_count, 0), 0),
+            bayesian_score=_bayesian_or_zero(Place),
+            updated_at=Place.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if place_id is not None:
+        average = average.where(Place.id == place_id)
+    db.execute(average)
+
+    db.commit()
+    if place_id is not None:
+        response_cache.invalidate_place(place_id)
+    else:
+        response_cache.clear()
+    return updated
+
+
+def recompute_rankings(db: Session, batch_size: int = 1000) -> int:
+    """
+    Przelicza od nowa wyniki rankingów miejsc (średnią Bayesa i wynik popularności).
+
+    Potrzebne po zmianie parametrów rankingów (RANKING_PRIOR_*, TRENDING_HALF_LIFE_HOURS)
+    oraz po zmianie recenzji poza aplikacją. Recenzje odczytywane są strumieniowo,
+    a wyniki zapisywane partiami (executemany).
+
+    Args:
+        db (Session): Instancja sesji bazy danych.
+        batch_size (int): Liczba miejsc aktualizowanych jedną instrukcją.
+
+    Returns:
+        int: Liczba miejsc z recenzjami.
+    """
+    Place, Review = models.Place, models.Review
+    db.execute(
+        update(Place)
+        .values(bayesian_score=_bayesian_or_zero(Place), trending_score=0.0, updated_at=Place.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+    # Tabela (a nie klasa) – lista parametrów oznacza wtedy executemany jednej instrukcji
+    places = Place.__table__
+    statement = (
+        update(places)
+        .where(places.c.id == bindparam("b_id"))
+        .values(trending_score=bindparam("b_trending"), updated_at=places.c.updated_at)
+    )
+    scores: dict[int, float] = {}
+    updated = 0
+    reviews = db.execute(
+        select(Review.place_id, Review.rating, Review.created_at).order_by(Review.place_id),
+        execution_options={"yield_per": batch_size},
+    )
+    for place_id, rating, created_at in reviews:
+        if place_id not in scores and len(scores) >= batch_size:
+            db.execute(statement, [{"b_id": key, "b_trending": value} for key, value in scores.items()])
+            updated += len(scores)
+            scores.clear()
+        scores[place_id] = scores.get(place_id, 0.0) + trending_weight(rating, created_at)
+    if scores:
+        db.execute(statement, [{"b_id": key, "b_trending": value} for key, value in scores.items()])
+        updated += len(scores)
+
+    db.commit()
+    response_cache.clear()
+    return updated
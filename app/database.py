@@ -1,35 +1,405 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
-import os
+"""
+Silniki i sesje bazy danych.
 
-# Wczytuje zmienne środowiskowe z pliku .env
-load_dotenv()
+Silniki tworzone są leniwie – przy pierwszym użyciu (get_engine,
+get_async_engine), a nie przy imporcie modułu – więc import aplikacji,
+testów i poleceń CLI nie wymaga DATABASE_URL ani połączenia z bazą.
+Schemat bazy zarządzany jest migracjami (alembic upgrade head).
 
-# Odczyt URL do bazy danych ze zmiennej środowiskowej
-DATABASE_URL = os.getenv("DATABASE_URL")
+Przy DATABASE_REPLICA_URLS żądania GET i HEAD czytają z replik (po kolei,
+z pominięciem niedostępnych), a zapisy trafiają do bazy głównej. Po zapisie
+ReadYourWritesMiddleware ustawia krótkotrwałe ciasteczko, które przez
+REPLICA_PIN_SECONDS kieruje odczyty klienta do bazy głównej – dzięki temu
+klient widzi własne zmiany mimo opóźnienia replikacji.
+"""
+from itertools import count
+import asyncio
+import logging
+import threading
+import time
 
-# Sprawdzenie, czy URL do bazy został poprawnie ustawiony
-if DATABASE_URL is None:
-    raise ValueError("Brak zmiennej DATABASE_URL w środowisku")
+from fastapi import Request
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 
-# Tworzy silnik SQLAlchemy, który zarządza połączeniem z bazą danych
-engine = create_engine(DATABASE_URL)
+from app.config import Settings, settings
+from app.metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool
 
-# Fabryka sesji do pracy z bazą danych
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+logger = logging.getLogger(__name__)
 
-def get_db():
+# Ciasteczko z chwilą (epoch), do której odczyty klienta kierowane są do bazy głównej
+PRIMARY_PIN_COOKIE = "pe_primary_until"
+
+# Metody HTTP, które nie zmieniają danych i mogą czytać z replik
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+
+def database_url(config: Settings = settings) -> str:
+    """
+    Zwraca adres bazy danych z ustawień (zmienna środowiskowa DATABASE_URL).
+
+    Args:
+        config (Settings): Ustawienia aplikacji.
+
+    Raises:
+        ValueError: Jeśli zmienna DATABASE_URL nie jest ustawiona.
+
+    Returns:
+        str: Adres bazy danych.
+    """
+    if config.database_url is None:
+        raise ValueError("Brak zmiennej DATABASE_URL w środowisku")
+    return config.database_url
+
+def engine_options(url: str, config: Settings = settings) -> dict:
+    """
+    Buduje parametry create_engine / create_async_engine na podstawie ustawień.
+
+    Parametry puli stosowane są tylko dla baz serwerowych – SQLite korzysta
+    z własnych pul dopasowanych do pracy na pliku lub w pamięci.
+
+    Args:
+        url (str): Adres bazy danych (synchroniczny lub asynchroniczny).
+        config (Settings): Ustawienia aplikacji.
+
+    Returns:
+        dict: Argumenty nazwane dla funkcji tworzącej silnik.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return {}
+
+    is_async = parsed.get_driver_name() == "asyncpg"
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": config.db_pool_size,
+        "max_overflow": config.db_max_overflow,
+        "pool_timeout": config.db_pool_timeout,
+        "pool_recycle": config.db_pool_recycle,
+        "pool_pre_ping": config.db_pool_pre_ping,
+    }
+
+    if config.db_statement_timeout_ms > 0 and parsed.get_backend_name() == "postgresql":
+        timeout = str(config.db_statement_timeout_ms)
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+# Fabryka sesji do pracy z bazą danych; silnik wiązany jest przy jego utworzeniu (get_engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+# Sterowniki asynchroniczne odpowiadające sterownikom synchronicznym
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    """
+    Zamienia adres bazy danych na adres ze sterownikiem asynchronicznym.
+
+    Args:
+        url (str): Adres bazy danych (np. postgresql+psycopg2://...).
+
+    Raises:
+        ValueError: Jeśli dla danej bazy nie ma obsługiwanego sterownika asynchronicznego.
+
+    Returns:
+        str: Adres z odpowiednim sterownikiem (np. postgresql+asyncpg://...).
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"Brak asynchronicznego sterownika dla bazy {backend}")
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+# Fabryka sesji asynchronicznych; obiekty nie wygasają po commit, bo leniwe
+# doładowanie atrybutów nie jest możliwe poza kontekstem await
+AsyncSessionLocal = async_sessionmaker(class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+_engine: Engine | None = None
+_async_engine: AsyncEngine | None = None
+_engine_lock = threading.Lock()
+
+# Czy silnik synchroniczny utworzyła aplikacja (a nie przekazano go przez set_engine)
+_owns_engine = False
+
+def get_engine() -> Engine:
+    """
+    Zwraca silnik synchroniczny, tworząc go przy pierwszym wywołaniu.
+
+    Raises:
+        ValueError: Jeśli zmienna DATABASE_URL nie jest ustawiona.
+
+    Returns:
+        Engine: Silnik SQLAlchemy zarządzający pulą połączeń.
+    """
+    global _engine, _owns_engine
+    if _engine is None:
+        # Pierwsze żądania mogą trafić jednocześnie do kilku wątków puli
+        with _engine_lock:
+            if _engine is None:
+                url = database_url()
+                set_engine(create_engine(url, **engine_options(url)))
+                _owns_engine = True
+    return _engine
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Zwraca silnik asynchroniczny (tryb DATABASE_ASYNC), tworząc go przy pierwszym wywołaniu.
+
+    Raises:
+        ValueError: Jeśli zmienna DATABASE_URL nie jest ustawiona lub baza nie ma sterownika asynchronicznego.
+
+    Returns:
+        AsyncEngine: Asynchroniczny silnik SQLAlchemy.
+    """
+    global _async_engine
+    if _async_engine is None:
+        url = to_async_url(database_url())
+        _async_engine = create_async_engine(url, **engine_options(url))
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+def set_engine(engine: Engine) -> None:
+    """
+    Ustawia silnik synchroniczny używany przez aplikację (np. bazę testową).
+
+    Args:
+        engine (Engine): Silnik do użycia zamiast tworzonego z DATABASE_URL.
+    """
+    global _engine, _owns_engine
+    _engine = engine
+    _owns_engine = False
+    SessionLocal.configure(bind=engine)
+
+async def dispose_engines() -> None:
+    """
+    Zamyka pule połączeń silników utworzonych przez aplikację (wywoływane przy zatrzymaniu procesu).
+
+    Silnik przekazany przez set_engine pozostaje bez zmian – zarządza nim wywołujący.
+    """
+    global _engine, _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+    if _engine is not None and _owns_engine:
+        _engine.dispose()
+        _engine = None
+    if _replicas is not None:
+        for engine in _replicas.engines:
+            engine.dispose()
+
+class ReplicaSet:
+    """
+    Repliki tylko do odczytu wybierane po kolei (round-robin) z pominięciem niedostępnych.
+
+    Attributes:
+        engines: Silniki replik.
+        healthy: Wynik ostatniego sprawdzenia dostępności każdej repliki.
+        checked_at: Chwila ostatniego sprawdzenia (time.monotonic()).
+    """
+
+    def __init__(self, engines: list[Engine]):
+        self.engines = engines
+        self.healthy = [True] * len(engines)
+        self.checked_at: float | None = None
+        # next() na itertools.count jest atomowe, więc wątki puli nie potrzebują blokady
+        self._next = count()
+
+    def pick(self) -> Engine | None:
+        """
+        Zwraca kolejną dostępną replikę.
+
+        Returns:
+            Engine | None: Silnik repliki lub None, jeśli żadna nie jest dostępna.
+        """
+        for _ in range(len(self.engines)):
+            index = next(self._next) % len(self.engines)
+            if self.healthy[index]:
+                return self.engines[index]
+        return None
+
+    def check(self) -> None:
+        """Sprawdza dostępność każdej repliki zapytaniem SELECT 1."""
+        for index, engine in enumerate(self.engines):
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                healthy = True
+            except SQLAlchemyError:
+                healthy = False
+            if healthy != self.healthy[index]:
+                logger.warning(
+                    "Replika %s jest %s", engine.url.render_as_string(), "dostępna" if healthy else "niedostępna"
+                )
+            self.healthy[index] = healthy
+        self.checked_at = time.monotonic()
+
+    async def run_health_checks(self, interval: float = settings.replica_health_interval) -> None:
+        """
+        Cyklicznie sprawdza dostępność replik (zadanie w tle uruchamiane w lifespan).
+
+        Args:
+            interval (float): Odstęp między sprawdzeniami w sekundach.
+        """
+        while True:
+            await asyncio.to_thread(self.check)
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict:
+        """
+        Zwraca stan replik.
+
+        Returns:
+            dict: Dostępność każdej repliki {nazwa: bool}.
+        """
+        return {f"replica-{index}": healthy for index, healthy in enumerate(self.healthy)}
+
+
+_replicas: ReplicaSet | None = None
+
+def get_replicas() -> ReplicaSet | None:
+    """
+    Zwraca repliki z DATABASE_REPLICA_URLS, tworząc ich silniki przy pierwszym wywołaniu.
+
+    Returns:
+        ReplicaSet | None: Repliki lub None, jeśli nie skonfigurowano żadnej.
+    """
+    global _replicas
+    if _replicas is None and settings.database_replica_urls:
+        with _engine_lock:
+            if _replicas is None:
+                _replicas = ReplicaSet(
+                    [create_engine(url, **engine_options(url)) for url in settings.database_replica_urls]
+                )
+    return _replicas
+
+def set_replicas(replicas: ReplicaSet | None) -> None:
+    """
+    Ustawia repliki używane przez aplikację (np. w testach).
+
+    Args:
+        replicas (ReplicaSet | None): Repliki lub None, aby wszystkie odczyty trafiały do bazy głównej.
+    """
+    global _replicas
+    _replicas = replicas
+
+def engines() -> dict:
+    """
+    Zwraca utworzone dotąd silniki bazy danych.
+
+    Returns:
+        dict: Słownik {nazwa: silnik} – synchroniczny "primary", "async" w trybie DATABASE_ASYNC
+        oraz "replica-N" dla replik.
+    """
+    result = {}
+    if _engine is not None:
+        result["primary"] = _engine
+    if _async_engine is not None:
+        result["async"] = _async_engine.sync_engine
+    if _replicas is not None:
+        result.update((f"replica-{index}", engine) for index, engine in enumerate(_replicas.engines))
+    return result
+
+def create_session(read_only: bool = False) -> Session:
+    """
+    Tworzy sesję bazy danych (np. dla poleceń CLI); wywołujący odpowiada za jej zamknięcie.
+
+    Args:
+        read_only (bool): Czy sesja służy tylko do odczytu – wtedy, jeśli skonfigurowano repliki
+            i któraś jest dostępna, sesja związana jest z repliką.
+
+    Returns:
+        Session: Nowa sesja związana z bazą główną lub repliką.
+    """
+    get_engine()
+    if read_only:
+        replicas = get_replicas()
+        replica = replicas.pick() if replicas is not None else None
+        if replica is not None:
+            return SessionLocal(bind=replica)
+    return SessionLocal()
+
+def pinned_to_primary(request: Request) -> bool:
+    """
+    Sprawdza, czy klient niedawno zapisywał dane i powinien czytać z bazy głównej.
+
+    Args:
+        request (Request): Bieżące żądanie.
+
+    Returns:
+        bool: True, jeśli ciasteczko PRIMARY_PIN_COOKIE wskazuje chwilę w przyszłości.
+    """
+    try:
+        return float(request.cookies.get(PRIMARY_PIN_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """
+    Middleware ASGI ustawiające po udanym zapisie ciasteczko kierujące odczyty klienta do bazy głównej.
+
+    Zapisem jest każde żądanie spoza READ_ONLY_METHODS zakończone kodem < 400.
+    """
+
+    def __init__(self, app, pin_seconds: float = settings.replica_pin_seconds):
+        self.app = app
+        self.pin_seconds = pin_seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in READ_ONLY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = (
+                    f"{PRIMARY_PIN_COOKIE}={time.time() + self.pin_seconds:.3f}; "
+                    f"Max-Age={max(1, round(self.pin_seconds))}; Path=/; HttpOnly; SameSite=Lax"
+                )
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode())]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
+
+def get_db(request: Request):
 
     """
     Generator zwracający sesję SQLAlchemy i zamykający ją po użyciu.
 
+    Żądania GET i HEAD klientów, którzy niedawno nie zapisywali danych,
+    otrzymują sesję repliki (jeśli skonfigurowano DATABASE_REPLICA_URLS).
+
+    Args:
+        request (Request): Bieżące żądanie.
+
     Yields:
         Session: instancja sesji do pracy z bazą danych.
     """
 
-    db = SessionLocal()
+    read_only = request.method in READ_ONLY_METHODS and not pinned_to_primary(request)
+    db = create_session(read_only=read_only)
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+
+    """
+    Asynchroniczny generator zwracający sesję AsyncSession i zamykający ją po użyciu.
+
+    Yields:
+        AsyncSession: instancja asynchronicznej sesji do pracy z bazą danych.
+    """
+
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
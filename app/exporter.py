@@ -0,0 +1,152 @@
+"""
+Strumieniowy eksport miejsc (opcjonalnie z recenzjami) do NDJSON i CSV.
+
+Wiersze odczytywane są kursorem po stronie serwera (yield_per / stream_results)
+partiami o stałym rozmiarze, a każda partia jest od razu zamieniana na tekst,
+więc zużycie pamięci nie zależy od liczby wierszy w tabeli. Eksport jest
+uporządkowany po id, dzięki czemu przerwany eksport można wznowić parametrem
+after_id równym ostatniemu zapisanemu identyfikatorowi.
+"""
+from datetime import datetime
+from enum import Enum
+from typing import Iterator
+import csv
+import io
+import json
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Place, Review
+
+PLACE_COLUMNS = [column.name for column in Place.__table__.columns]
+REVIEW_COLUMNS = [column.name for column in Review.__table__.columns]
+
+
+class ExportFormat(str, Enum):
+    """Obsługiwane formaty eksportu."""
+
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Nieobsługiwany typ: {type(value).__name__}")
+
+
+def _places_query(after_id: int | None, updated_since: datetime | None):
+    query = select(Place.__table__).order_by(Place.id)
+    if after_id is not None:
+        query = query.where(Place.id > after_id)
+    if updated_since is not None:
+        query = query.where(Place.updated_at >= updated_since)
+    return query
+
+
+def _place_partitions(db: Session, after_id, updated_since, batch_size: int):
+    """Zwraca kolejne partie wierszy miejsc odczytywane kursorem po stronie serwera."""
+    result = db.execute(
+        _places_query(after_id, updated_since).execution_options(yield_per=batch_size)
+    )
+    return result.mappings().partitions()
+
+
+def _reviews_by_place(db: Session, place_ids: list[int]) -> dict[int, list[dict]]:
+    """Pobiera recenzje dla partii miejsc jednym zapytaniem."""
+    grouped: dict[int, list[dict]] = {place_id: [] for place_id in place_ids}
+    rows = db.execute(
+        select(Review.__table__)
+        .where(Review.place_id.in_(place_ids))
+        .order_by(Review.place_id, Review.id)
+    ).mappings()
+    for row in rows:
+        grouped[row["place_id"]].append(dict(row))
+    return grouped
+
+
+def iter_places_ndjson(
+    db: Session,
+    include_reviews: bool = False,
+    after_id: int | None = None,
+    updated_since: datetime | None = None,
+    batch_size: int = 1000,
+) -> Iterator[str]:
+    """
+    Zwraca kolejne fragmenty eksportu miejsc w formacie NDJSON.
+
+    Args:
+        db (Session): Instancja sesji bazy danych.
+        include_reviews (bool): Czy dołączyć recenzje (pole "reviews" każdego miejsca).
+        after_id (int | None): Eksportuj tylko miejsca o id większym niż podane.
+        updated_since (datetime | None): Eksportuj tylko miejsca zmienione od podanej chwili.
+        batch_size (int): Liczba wierszy odczytywanych z kursora naraz.
+
+    Yields:
+        str: Fragment eksportu – jedna linia JSON na każde miejsce z partii.
+    """
+    for partition in _place_partitions(db, after_id, updated_since, batch_size):
+        places = [dict(row) for row in partition]
+        if include_reviews:
+            reviews = _reviews_by_place(db, [place["id"] for place in places])
+            for place in places:
+                place["reviews"] = reviews[place["id"]]
+        yield "".join(
+            json.dumps(place, default=_json_default, ensure_ascii=False) + "\n" for place in places
+        )
+
+
+def iter_places_csv(
+    db: Session,
+    include_reviews: bool = False,
+    after_id: int | None = None,
+    updated_since: datetime | None = None,
+    batch_size: int = 1000,
+) -> Iterator[str]:
+    """
+    Zwraca kolejne fragmenty eksportu miejsc w formacie CSV.
+
+    Z recenzjami każdy wiersz odpowiada jednej recenzji (kolumny z prefiksem
+    "review_"), a miejsca bez recenzji mają jeden wiersz z pustymi kolumnami recenzji.
+
+    Args:
+        db (Session): Instancja sesji bazy danych.
+        include_reviews (bool): Czy dołączyć recenzje.
+        after_id (int | None): Eksportuj tylko miejsca o id większym niż podane.
+        updated_since (datetime | None): Eksportuj tylko miejsca zmienione od podanej chwili.
+        batch_size (int): Liczba wierszy odczytywanych z kursora naraz.
+
+    Yields:
+        str: Fragment pliku CSV (nagłówek, a następnie partie wierszy).
+    """
+    review_columns = [f"review_{name}" for name in REVIEW_COLUMNS if name != "place_id"]
+    header = PLACE_COLUMNS + (review_columns if include_reviews else [])
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+
+    for partition in _place_partitions(db, after_id, updated_since, batch_size):
+        places = list(partition)
+        reviews = _reviews_by_place(db, [place["id"] for place in places]) if include_reviews else {}
+        for place in places:
+            values = [place[name] for name in PLACE_COLUMNS]
+            if not include_reviews:
+                writer.writerow(values)
+                continue
+            place_reviews = reviews[place["id"]] or [None]
+            for review in place_reviews:
+                review_values = (
+                    [review[name] for name in REVIEW_COLUMNS if name != "place_id"]
+                    if review is not None
+                    else [None] * len(review_columns)
+                )
+                writer.writerow(values + review_values)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Nagłówek pustego eksportu
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,237 @@
+"""
+Strumień zmian miejsc i recenzji przez WebSocket (/feed).
+
+Klienci subskrybują tematy zamiast cyklicznie odpytywać GET /places/:
+
+- ``places`` – wszystkie miejsca,
+- ``city:<miasto>`` – miejsca w mieście (bez względu na wielkość liter),
+- ``place:<id>`` – jedno miejsce.
+
+Zdarzenia emitowane są przez crud.place i crud.review po zatwierdzeniu
+transakcji. Funkcje crud działają w wątkach puli (endpointy synchroniczne)
+albo w greenletach pętli zdarzeń (tryb asynchroniczny), więc zdarzenie jest
+serializowane w miejscu emisji, a do pętli przekazywane przez
+call_soon_threadsafe. Pętla wiązana jest w lifespan aplikacji – bez niej
+(CLI, skrypty) zdarzenia są pomijane.
+
+Przy skonfigurowanym WS_BACKPLANE zdarzenia przechodzą przez backplane, więc
+trafiają do klientów wszystkich procesów roboczych.
+"""
+from typing import Iterable
+import asyncio
+import json
+import logging
+
+from app.backplane import subscribe_forever
+from app.models import Place, Review
+from app.serialization import (
+    HISTOGRAM_COLUMNS, REVIEW_COLUMNS, SUMMARY_COLUMNS, dumps, review_document, summary_document,
+)
+from app.websocket_manager import ConnectionManager
+
+logger = logging.getLogger(__name__)
+
+# Kanał backplane'u, na którym procesy wymieniają zdarzenia
+FEED_CHANNEL = "placeexplorer_feed"
+
+# Maksymalna liczba tematów subskrybowanych przez jednego klienta
+MAX_TOPICS = 50
+
+# Połączenia /feed – bez cyklicznego statusu, wiadomości wysyłane są tylko przy zmianach
+feed_manager = ConnectionManager(interval=None)
+
+_loop: asyncio.AbstractEventLoop | None = None
+_backplane = None
+_listener: asyncio.Task | None = None
+
+# Trwające publikacje w backplane – referencje chronią zadania przed usunięciem przez GC
+_publishing: set[asyncio.Task] = set()
+
+
+def parse_topic(topic: str) -> str:
+    """
+    Sprawdza i normalizuje nazwę tematu.
+
+    Args:
+        topic (str): Nazwa tematu przesłana przez klienta.
+
+    Raises:
+        ValueError: Jeśli temat ma nieznany format.
+
+    Returns:
+        str: Znormalizowana nazwa tematu.
+    """
+    topic = topic.strip()
+    if topic == "places":
+        return topic
+    kind, _, value = topic.partition(":")
+    value = value.strip()
+    if kind == "city" and value:
+        return city_topic(value)
+    if kind == "place" and value.isdigit():
+        return f"place:{int(value)}"
+    raise ValueError(f"Nieznany temat: {topic!r} (dozwolone: places, city:<miasto>, place:<id>)")
+
+
+def city_topic(city: str) -> str:
+    return f"city:{city.strip().casefold()}"
+
+
+def place_topics(place_id: int, city: str | None) -> list[str]:
+    """
+    Zwraca tematy, których dotyczy zmiana miejsca.
+
+    Args:
+        place_id (int): Identyfikator miejsca.
+        city (str | None): Miasto miejsca.
+
+    Returns:
+        list[str]: Tematy places, city:<miasto> (gdy miasto jest podane) i place:<id>.
+    """
+    topics = ["places", f"place:{place_id}"]
+    if city:
+        topics.append(city_topic(city))
+    return topics
+
+
+def _place_summary(place: Place) -> dict:
+    columns = SUMMARY_COLUMNS + HISTOGRAM_COLUMNS
+    return summary_document({column.key: getattr(place, column.key) for column in columns})
+
+
+def emit(topics: Iterable[str], event: dict) -> None:
+    """
+    Przekazuje zdarzenie do pętli zdarzeń, która rozsyła je subskrybentom tematów.
+
+    Bezpieczne do wywołania z dowolnego wątku; bez powiązanej pętli nic nie robi.
+
+    Args:
+        topics (Iterable[str]): Tematy zdarzenia.
+        event (dict): Treść zdarzenia (pole type i dane).
+    """
+    loop = _loop
+    if loop is None or loop.is_closed():
+        return
+    topics = list(topics)
+    payload = dumps(event).decode()
+    try:
+        if _backplane is not None:
+            message = json.dumps({"topics": topics, "payload": payload})
+            loop.call_soon_threadsafe(_start_publish, _backplane, message)
+        else:
+            loop.call_soon_threadsafe(feed_manager.publish, topics, payload)
+    except RuntimeError:
+        # Pętla została zamknięta w trakcie wyłączania aplikacji
+        pass
+
+
+def _start_publish(backplane, message: str) -> None:
+    task = asyncio.get_running_loop().create_task(backplane.publish(FEED_CHANNEL, message))
+    _publishing.add(task)
+    task.add_done_callback(_publish_done)
+
+
+def _publish_done(task: asyncio.Task) -> None:
+    _publishing.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Nie udało się opublikować zdarzenia w backplane", exc_info=task.exception())
+
+
+def place_changed(event_type: str, place: Place) -> None:
+    """
+    Emituje zdarzenie utworzenia lub edycji miejsca z jego aktualnym podsumowaniem.
+
+    Args:
+        event_type (str): place.created lub place.updated.
+        place (Place): Odświeżony obiekt miejsca.
+    """
+    if _loop is None:
+        return
+    emit(place_topics(place.id, place.city), {"type": event_type, "place": _place_summary(place)})
+
+
+def place_deleted(place_id: int, city: str | None) -> None:
+    """
+    Emituje zdarzenie usunięcia miejsca.
+
+    Args:
+        place_id (int): Identyfikator usuniętego miejsca.
+        city (str | None): Miasto usuniętego miejsca.
+    """
+    emit(place_topics(place_id, city), {"type": "place.deleted", "place": {"id": place_id, "city": city}})
+
+
+def places_imported(ids: list[int], cities: list[str | None]) -> None:
+    """
+    Emituje zdarzenia importu zbiorczego – jedno na miasto, bez danych każdego miejsca.
+
+    Args:
+        ids (list[int]): Identyfikatory utworzonych miejsc.
+        cities (list[str | None]): Miasta utworzonych miejsc (w tej samej kolejności).
+    """
+    if _loop is None:
+        return
+    by_city: dict[str, tuple[str, list[int]]] = {}
+    for place_id, city in zip(ids, cities):
+        by_city.setdefault(city_topic(city) if city else None, (city, []))[1].append(place_id)
+    for topic, (city, place_ids) in by_city.items():
+        topics = ["places", topic] if topic else ["places"]
+        emit(topics, {"type": "places.imported", "city": city, "place_ids": place_ids})
+
+
+def review_created(review: Review, city: str | None, review_count: int, rating_avg: float) -> None:
+    """
+    Emituje zdarzenie dodania recenzji wraz z nowymi agregatami ocen miejsca.
+
+    Args:
+        review (Review): Odświeżony obiekt recenzji.
+        city (str | None): Miasto miejsca.
+        review_count (int): Liczba recenzji miejsca po dodaniu.
+        rating_avg (float): Średnia ocena miejsca po dodaniu.
+    """
+    if _loop is None:
+        return
+    emit(place_topics(review.place_id, city), {
+        "type": "review.created",
+        "review": review_document({column.key: getattr(review, column.key) for column in REVIEW_COLUMNS}),
+        "place": {"id": review.place_id, "city": city, "review_count": review_count, "rating_avg": rating_avg},
+    })
+
+
+async def start(backplane=None) -> None:
+    """
+    Wiąże strumień zmian z bieżącą pętlą zdarzeń (wywoływane w lifespan aplikacji).
+
+    Args:
+        backplane: Backplane łączący procesy robocze lub None (tylko bieżący proces).
+    """
+    global _loop, _backplane, _listener
+    _loop = asyncio.get_running_loop()
+    _backplane = backplane
+    if backplane is not None:
+        _listener = asyncio.create_task(_listen(backplane))
+        await asyncio.sleep(0)
+
+
+async def stop() -> None:
+    """Odłącza strumień zmian od pętli zdarzeń."""
+    global _loop, _backplane, _listener
+    _loop = None
+    _backplane = None
+    if _listener is not None:
+        _listener.cancel()
+        await asyncio.gather(_listener, return_exceptions=True)
+        _listener = None
+
+
+async def _listen(backplane):
+    """Rozsyła lokalnym subskrybentom zdarzenia opublikowane przez dowolny proces."""
+    try:
+        async for raw in subscribe_forever(backplane, FEED_CHANNEL):
+            try:
+                message = json.loads(raw)
+                feed_manager.publish(message["topics"], message["payload"])
+            except (ValueError, KeyError, TypeError):
+                logger.warning("Pominięto niepoprawne zdarzenie: %r", raw)
+    except asyncio.CancelledError:
+        pass
@@ -0,0 +1,195 @@
+"""
+Obliczenia geograficzne na potrzeby wyszukiwania miejsc w pobliżu.
+
+Każde miejsce ze współrzędnymi ma zapisany geohash – tekstowy identyfikator
+komórki siatki, w którym wspólny prefiks oznacza wspólną komórkę. Dzięki temu
+zwykły indeks B-tree na kolumnie geohash działa jak indeks przestrzenny:
+zapytanie o okrąg zamienia się w kilka zakresów prefiksów (komórka środka
+i jej sąsiedzi), a dokładna odległość liczona jest tylko dla kandydatów.
+
+Na PostgreSQL z rozszerzeniem PostGIS zapytanie korzysta zamiast tego
+z indeksu GiST na wyrażeniu geography (patrz migracja 0005).
+"""
+from math import asin, cos, radians, sin, sqrt
+
+from sqlalchemy import DDL, event, text
+from sqlalchemy.engine import Connection
+
+from app.models import Place
+
+# Średni promień Ziemi w metrach
+EARTH_RADIUS_M = 6_371_008.8
+
+# Długość geohasha zapisywanego w bazie (komórka ok. 4,8 m × 4,8 m)
+GEOHASH_PRECISION = 9
+
+# Długość (w metrach) jednego stopnia szerokości geograficznej
+METERS_PER_DEGREE = radians(1) * EARTH_RADIUS_M
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Wynik wykrywania PostGIS dla każdego adresu bazy danych
+_postgis_available: dict[str, bool] = {}
+
+# Indeks GiST tworzony tylko przy dostępnym PostGIS, więc nie należy do modeli
+GEOGRAPHY_INDEX = "ix_places_geography"
+
+# Wyrażenie indeksu – zapytania muszą używać dokładnie tego samego wyrażenia
+GEOGRAPHY_EXPRESSION = "geography(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326))"
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """
+    Koduje współrzędne jako geohash.
+
+    Args:
+        latitude (float): Szerokość geograficzna w stopniach (-90…90).
+        longitude (float): Długość geograficzna w stopniach (-180…180).
+        precision (int): Liczba znaków wyniku.
+
+    Returns:
+        str: Geohash o zadanej długości.
+    """
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        # Bity długości i szerokości geograficznej są przeplatane, zaczynając od długości
+        interval, coordinate = (lon_range, longitude) if even else (lat_range, latitude)
+        middle = (interval[0] + interval[1]) / 2
+        if coordinate >= middle:
+            value = (value << 1) | 1
+            interval[0] = middle
+        else:
+            value <<= 1
+            interval[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits, value = 0, 0
+    return "".join(chars)
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+    """
+    Zwraca rozmiar komórki geohasha o zadanej długości.
+
+    Args:
+        precision (int): Długość geohasha.
+
+    Returns:
+        tuple[float, float]: Wysokość i szerokość komórki w stopniach.
+    """
+    lat_bits = 5 * precision // 2
+    lon_bits = 5 * precision - lat_bits
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lon_bits
+
+
+def covering_cells(latitude: float, longitude: float, radius_m: float) -> list[str]:
+    """
+    Zwraca prefiksy geohasha pokrywające okrąg o zadanym promieniu.
+
+    Wybierana jest najdłuższa precyzja, której komórka jest nie mniejsza niż
+    promień – wtedy okrąg mieści się w komórce środka i jej ośmiu sąsiadach.
+
+    Args:
+        latitude (float): Szerokość geograficzna środka.
+        longitude (float): Długość geograficzna środka.
+        radius_m (float): Promień w metrach.
+
+    Returns:
+        list[str]: Co najwyżej dziewięć unikalnych prefiksów.
+    """
+    lat_scale = METERS_PER_DEGREE
+    lon_scale = METERS_PER_DEGREE * max(cos(radians(latitude)), 1e-6)
+
+    precision = GEOHASH_PRECISION
+    while precision > 1:
+        height, width = cell_size(precision)
+        if height * lat_scale >= radius_m and width * lon_scale >= radius_m:
+            break
+        precision -= 1
+
+    height, width = cell_size(precision)
+    cells = []
+    for d_lat in (-height, 0.0, height):
+        for d_lon in (-width, 0.0, width):
+            lat = min(max(latitude + d_lat, -90.0), 90.0)
+            lon = (longitude + d_lon + 180.0) % 360.0 - 180.0
+            cell = encode_geohash(lat, lon, precision)
+            if cell not in cells:
+                cells.append(cell)
+    return cells
+
+
+def prefix_range(prefix: str) -> tuple[str, str | None]:
+    """
+    Zamienia prefiks geohasha na zakres wartości kolumny.
+
+    Warunek ``lower <= geohash < upper`` korzysta z indeksu B-tree niezależnie
+    od collation bazy (w przeciwieństwie do LIKE 'prefiks%'). Górna granica
+    to prefiks ze zwiększonym ostatnim znakiem alfabetu base32.
+
+    Args:
+        prefix (str): Prefiks geohasha.
+
+    Returns:
+        tuple[str, str | None]: Dolna i górna granica (None, gdy zakres nie ma górnej granicy).
+    """
+    stripped = prefix.rstrip(_BASE32[-1])
+    if not stripped:
+        return prefix, None
+    upper = stripped[:-1] + _BASE32[_BASE32.index(stripped[-1]) + 1]
+    return prefix, upper
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Oblicza odległość po powierzchni Ziemi (wzór haversine).
+
+    Args:
+        lat1 (float): Szerokość geograficzna pierwszego punktu.
+        lon1 (float): Długość geograficzna pierwszego punktu.
+        lat2 (float): Szerokość geograficzna drugiego punktu.
+        lon2 (float): Długość geograficzna drugiego punktu.
+
+    Returns:
+        float: Odległość w metrach.
+    """
+    d_lat = radians(lat2 - lat1)
+    d_lon = radians(lon2 - lon1)
+    a = sin(d_lat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(d_lon / 2) ** 2
+    return 2 * EARTH_RADIUS_M * asin(min(1.0, sqrt(a)))
+
+
+def has_postgis(connection: Connection) -> bool:
+    """
+    Sprawdza (raz dla każdej bazy), czy w bazie PostgreSQL zainstalowano PostGIS.
+
+    Args:
+        connection (Connection): Połączenie z bazą danych.
+
+    Returns:
+        bool: True, jeśli dostępne są funkcje PostGIS.
+    """
+    if connection.dialect.name != "postgresql":
+        return False
+    key = str(connection.engine.url)
+    if key not in _postgis_available:
+        _postgis_available[key] = (
+            connection.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'postgis'")).first() is not None
+        )
+    return _postgis_available[key]
+
+
+def _postgis_installed(ddl, target, bind, **kw) -> bool:
+    return has_postgis(bind)
+
+
+event.listen(
+    Place.__table__,
+    "after_create",
+    DDL(f"CREATE INDEX {GEOGRAPHY_INDEX} ON places USING GIST (({GEOGRAPHY_EXPRESSION}))").execute_if(
+        callable_=_postgis_installed
+    ),
+)
@@ -0,0 +1,177 @@
+"""
+Import zbiorczy miejsc z tablicy JSON lub strumienia NDJSON.
+
+Wiersze są walidowane schematem PlaceCreate i zapisywane partiami – każda
+partia to jedna transakcja z wielowierszowym INSERT ... RETURNING. Błędne
+wiersze nie przerywają importu, lecz trafiają do raportu błędów.
+"""
+from typing import Any, AsyncIterator, Iterable, Iterator
+import json
+
+from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.crud.place import bulk_create_places
+from app.schemas import BulkImportError, BulkImportResult, PlaceCreate
+
+
+def _validation_messages(error: ValidationError) -> list[str]:
+    """
+    Zamienia błąd walidacji Pydantic na listę czytelnych komunikatów.
+
+    Args:
+        error (ValidationError): Błąd walidacji.
+
+    Returns:
+        list[str]: Komunikaty w postaci "pole: opis".
+    """
+    return [
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+        for item in error.errors()
+    ]
+
+
+class PlaceImporter:
+    """
+    Importer miejsc zapisujący poprawne wiersze partiami.
+
+    Użycie::
+
+        importer = PlaceImporter(db)
+        for index, row in enumerate(rows):
+            if importer.add(index, row):
+                importer.flush()
+        result = importer.finish()
+
+    Attributes:
+        db: Sesja bazy danych używana do zapisu.
+        batch_size: Liczba wierszy w jednej transakcji.
+        max_errors: Maksymalna liczba błędów przechowywanych w wyniku.
+        result: Bieżący wynik importu.
+    """
+
+    def __init__(self, db: Session, batch_size: int | None = None, max_errors: int | None = None):
+        self.db = db
+        self.batch_size = batch_size or settings.places_import_batch_size
+        self.max_errors = settings.places_import_max_errors if max_errors is None else max_errors
+        self.result = BulkImportResult()
+        self._batch: list[tuple[int, PlaceCreate]] = []
+
+    def _reject(self, index: int, messages: list[str]) -> None:
+        self.result.failed += 1
+        if len(self.result.errors) < self.max_errors:
+            self.result.errors.append(BulkImportError(index=index, errors=messages))
+
+    def add(self, index: int, row: Any) -> bool:
+        """
+        Waliduje wiersz i dodaje go do bieżącej partii.
+
+        Args:
+            index (int): Numer wiersza w danych wejściowych.
+            row (Any): Słownik z danymi miejsca albo surowa linia NDJSON (str / bytes).
+
+        Returns:
+            bool: True, jeśli partia jest pełna i należy wywołać flush().
+        """
+        try:
+            if isinstance(row, (str, bytes)):
+                place = PlaceCreate.model_validate_json(row)
+            else:
+                place = PlaceCreate.model_validate(row)
+        except ValidationError as e:
+            self._reject(index, _validation_messages(e))
+        else:
+            self._batch.append((index, place))
+        return len(self._batch) >= self.batch_size
+
+    def flush(self) -> None:
+        """
+        Zapisuje bieżącą partię w jednej transakcji.
+
+        Jeśli baza odrzuci partię (np. zbyt długi tekst dla kolumny), wiersze
+        zapisywane są pojedynczo, aby poprawne trafiły do bazy, a błędne do raportu.
+        """
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        try:
+            self.result.inserted += len(bulk_create_places(self.db, [place for _, place in batch]))
+        except DBAPIError:
+            self.db.rollback()
+            for index, place in batch:
+                try:
+                    bulk_create_places(self.db, [place])
+                    self.result.inserted += 1
+                except DBAPIError as e:
+                    self.db.rollback()
+                    self._reject(index, [str(e.orig)])
+
+    def finish(self) -> BulkImportResult:
+        """
+        Zapisuje pozostałe wiersze i zwraca wynik importu.
+
+        Returns:
+            BulkImportResult: Liczba zapisanych i odrzuconych wierszy oraz błędy.
+        """
+        self.flush()
+        return self.result
+
+
+def iter_json_array(payload: bytes | str) -> Iterator[Any]:
+    """
+    Zwraca elementy tablicy JSON.
+
+    Args:
+        payload (bytes | str): Treść dokumentu JSON.
+
+    Raises:
+        ValueError: Jeśli dokument nie jest poprawną tablicą JSON.
+
+    Returns:
+        Iterator[Any]: Elementy tablicy.
+    """
+    data = json.loads(payload)
+    if not isinstance(data, list):
+        raise ValueError("Oczekiwano tablicy JSON")
+    return iter(data)
+
+
+def iter_ndjson_lines(lines: Iterable[bytes | str]) -> Iterator[bytes | str]:
+    """
+    Zwraca niepuste linie strumienia NDJSON.
+
+    Args:
+        lines (Iterable[bytes | str]): Linie pliku lub strumienia.
+
+    Returns:
+        Iterator[bytes | str]: Linie z pominięciem pustych.
+    """
+    for line in lines:
+        if line.strip():
+            yield line
+
+
+async def aiter_ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Dzieli strumień bajtów (np. treść żądania HTTP) na linie NDJSON.
+
+    Fragmenty są przetwarzane na bieżąco, więc w pamięci znajduje się tylko
+    niedokończona linia, a nie cała treść żądania.
+
+    Args:
+        chunks (AsyncIterator[bytes]): Kolejne fragmenty treści.
+
+    Yields:
+        bytes: Niepuste linie.
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
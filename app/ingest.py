@@ -0,0 +1,215 @@
+"""
+Zapis recenzji w tle z grupowaniem transakcji (tryb REVIEWS_WRITE_BEHIND).
+
+Endpoint POST /places/{place_id}/reviews tylko waliduje recenzję i umieszcza
+ją w ograniczonej kolejce procesu, odpowiadając 202 z identyfikatorem
+śledzenia. Zadanie w tle zbiera recenzje w partie – do REVIEW_BATCH_SIZE
+recenzji lub REVIEW_FLUSH_INTERVAL sekund od pierwszej – i zapisuje każdą
+partię w jednej transakcji (crud.review.create_reviews_batch), razem
+z agregatami ocen miejsc.
+
+Pełna kolejka oznacza, że baza nie nadąża – endpoint odpowiada wtedy 503
+z nagłówkiem Retry-After, zamiast zwiększać zużycie pamięci.
+
+Kolejka i stany recenzji są osobne w każdym procesie roboczym. Przy
+zatrzymaniu procesu kolejka jest opróżniana, ale recenzje oczekujące w chwili
+awarii procesu są tracone.
+"""
+from collections import OrderedDict
+import asyncio
+import logging
+import uuid
+
+from app import schemas
+from app.config import settings
+from app.crud.review import create_reviews_batch
+from app.database import create_session
+
+logger = logging.getLogger(__name__)
+
+# Liczba ostatnich recenzji, których stan można odczytać
+MAX_TRACKED = 100_000
+
+
+class QueueFullError(Exception):
+    """Kolejka recenzji jest pełna."""
+
+
+class ReviewIngestor:
+    """
+    Kolejka recenzji z zadaniem zapisującym je partiami.
+
+    Attributes:
+        queue: Recenzje oczekujące na zapis jako (identyfikator śledzenia, miejsce, recenzja).
+        batch_size: Maksymalna liczba recenzji w partii.
+        flush_interval: Maksymalny czas kompletowania partii w sekundach.
+        session_factory: Funkcja tworząca sesję bazy danych dla zapisu partii.
+        statuses: Stany ostatnich recenzji według identyfikatora śledzenia.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = settings.review_queue_size,
+        batch_size: int = settings.review_batch_size,
+        flush_interval: float = settings.review_flush_interval,
+        session_factory=create_session,
+    ):
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.session_factory = session_factory
+        self.queue: asyncio.Queue | None = None
+        self.statuses: OrderedDict[str, schemas.ReviewIngestStatus] = OrderedDict()
+        self.stored = 0
+        self.rejected = 0
+        self.failed = 0
+        self.batches = 0
+        self.overflows = 0
+        self._flusher: asyncio.Task | None = None
+        # Partia w trakcie kompletowania i trwający zapis – dokańczane przy zatrzymaniu
+        self._pending: list = []
+        self._current_flush: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Tworzy kolejkę i uruchamia zadanie zapisujące (wywoływane w lifespan aplikacji)."""
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self._flusher = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Zatrzymuje przyjmowanie recenzji i zapisuje te, które są jeszcze w kolejce."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        if self._current_flush is not None:
+            await asyncio.gather(self._current_flush, return_exceptions=True)
+            self._current_flush = None
+        if self.queue is not None:
+            batch, self._pending = self._take_batch(self._pending), []
+            while batch:
+                await self._flush(batch)
+                batch = self._take_batch([])
+            self.queue = None
+
+    def submit(self, place_id: int, review: schemas.ReviewCreate) -> schemas.ReviewIngestStatus:
+        """
+        Umieszcza recenzję w kolejce zapisu.
+
+        Args:
+            place_id (int): Identyfikator miejsca.
+            review (schemas.ReviewCreate): Zwalidowane dane recenzji.
+
+        Raises:
+            QueueFullError: Jeśli kolejka jest pełna (lub nie została uruchomiona).
+
+        Returns:
+            schemas.ReviewIngestStatus: Stan przyjętej recenzji (queued).
+        """
+        if self.queue is None or self.queue.full():
+            self.overflows += 1
+            raise QueueFullError
+        status = schemas.ReviewIngestStatus(tracking_id=uuid.uuid4().hex, status="queued", place_id=place_id)
+        self.queue.put_nowait((status.tracking_id, place_id, review))
+        self._track(status)
+        return status
+
+    def status(self, tracking_id: str) -> schemas.ReviewIngestStatus | None:
+        """
+        Zwraca stan recenzji.
+
+        Args:
+            tracking_id (str): Identyfikator śledzenia.
+
+        Returns:
+            schemas.ReviewIngestStatus | None: Stan recenzji lub None, jeśli identyfikator jest nieznany.
+        """
+        return self.statuses.get(tracking_id)
+
+    def stats(self) -> dict:
+        """
+        Zwraca liczniki kolejki.
+
+        Returns:
+            dict: Długość kolejki, liczba zapisanych, odrzuconych i utraconych recenzji,
+            liczba partii, średni rozmiar partii i liczba odmów przy pełnej kolejce.
+        """
+        processed = self.stored + self.rejected + self.failed
+        return {
+            "queued": self.queue.qsize() if self.queue is not None else 0,
+            "queue_size": self.queue_size,
+            "stored": self.stored,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "batches": self.batches,
+            "avg_batch_size": round(processed / self.batches, 1) if self.batches else 0.0,
+            "overflows": self.overflows,
+        }
+
+    def _track(self, status: schemas.ReviewIngestStatus) -> None:
+        self.statuses[status.tracking_id] = status
+        self.statuses.move_to_end(status.tracking_id)
+        while len(self.statuses) > MAX_TRACKED:
+            self.statuses.popitem(last=False)
+
+    def _take_batch(self, batch: list) -> list:
+        while len(batch) < self.batch_size and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._pending.append(await self.queue.get())
+            deadline = loop.time() + self.flush_interval
+            # Kompletuj partię do osiągnięcia rozmiaru albo upływu okna czasowego
+            while len(self._take_batch(self._pending)) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    self._pending.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            batch, self._pending = self._pending, []
+            # Zapis osłonięty przed anulowaniem – stop() czeka na jego zakończenie
+            self._current_flush = asyncio.create_task(self._flush(batch))
+            await asyncio.shield(self._current_flush)
+            self._current_flush = None
+
+    async def _flush(self, batch: list) -> None:
+        if not batch:
+            return
+        try:
+            # Sesja synchroniczna – zapis w wątku puli nie blokuje pętli zdarzeń
+            created = await asyncio.to_thread(self._store, [(place_id, review) for _, place_id, review in batch])
+        except Exception:
+            logger.exception("Nie udało się zapisać partii %d recenzji", len(batch))
+            created = [False] * len(batch)
+        self.batches += 1
+
+        for (tracking_id, place_id, _), review in zip(batch, created):
+            if review is False:
+                status, review_id = "failed", None
+                self.failed += 1
+            elif review is None:
+                status, review_id = "rejected", None
+                self.rejected += 1
+            else:
+                status, review_id = "stored", review.id
+                self.stored += 1
+            self._track(schemas.ReviewIngestStatus(
+                tracking_id=tracking_id, status=status, place_id=place_id, review_id=review_id
+            ))
+
+    def _store(self, items: list) -> list:
+        db = self.session_factory()
+        try:
+            return create_reviews_batch(db, items)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+review_ingestor = ReviewIngestor()
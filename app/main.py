@@ -1,15 +1,58 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+import asyncio
+
+from fastapi import APIRouter, FastAPI
+from app import feed
+from app.ingest import review_ingestor
+from app.backplane import start_cluster_status, stop_cluster_status
+from app.config import settings
 from app.routers import places, reviews
-from app.models import Base
-from app.database import engine
+from app.database import ReadYourWritesMiddleware, dispose_engines, get_async_engine, get_engine, get_replicas
+from app.metrics import MetricsMiddleware
 from fastapi.middleware.cors import CORSMiddleware
 from app.routers import websocket as ws_router
+from app.routers import metrics as metrics_router
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Uruchamia i zatrzymuje zadania działające przez cały czas życia procesu roboczego.
+
+    Args:
+        app (FastAPI): Instancja aplikacji.
+    """
+    # Silniki tworzone są tutaj, a nie przy imporcie; połączenia otwierane są przy pierwszym zapytaniu,
+    # a schemat bazy tworzą migracje (alembic upgrade head)
+    get_engine()
+    if settings.database_async:
+        get_async_engine()
+    replicas = get_replicas()
+    replica_health = asyncio.create_task(replicas.run_health_checks()) if replicas is not None else None
+
+    # Przy WS_BACKPLANE status WebSocket publikuje jeden proces dla całego klastra
+    cluster_status = await start_cluster_status()
+    await feed.start(cluster_status.backplane if cluster_status else None)
+    if settings.reviews_write_behind:
+        await review_ingestor.start()
+    try:
+        yield
+    finally:
+        # Kolejka recenzji opróżniana jest przed odłączeniem strumienia zmian i zamknięciem pul
+        await review_ingestor.stop()
+        await feed.stop()
+        await stop_cluster_status()
+        if replica_health is not None:
+            replica_health.cancel()
+            await asyncio.gather(replica_health, return_exceptions=True)
+        await dispose_engines()
+
 
 # Inicjalizacja aplikacji
 app = FastAPI(
     title="PlaceExplorer",
     description="Aplikacja do odkrywania i oceniania ciekawych miejsc",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Konfiguracja CORS
@@ -26,10 +69,63 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Inicjalizacja bazy danych
-Base.metadata.create_all(bind=engine)
+# Pomiar czasu obsługi żądań (GET /metrics, status WebSocket)
+app.add_middleware(MetricsMiddleware)
+
+# Odczyty z replik – po zapisie klient czyta przez chwilę z bazy głównej
+if settings.database_replica_urls:
+    app.add_middleware(ReadYourWritesMiddleware)
+
+# Profilowanie zapytań SQL (SQL_PROFILING=1)
+if settings.sql_profiling:
+    from app.profiling import SQLProfilingMiddleware
+
+    app.add_middleware(SQLProfilingMiddleware)
+
+
+def _without_overridden(router: APIRouter, overrides: list[APIRouter]) -> APIRouter:
+    """
+    Zwraca kopię routera bez tras, które mają swoje odpowiedniki w routerach nadpisujących.
+
+    Trasy porównywane są po ścieżce i metodzie HTTP, więc pozostałe endpointy
+    (również statyczne ścieżki dodane przed /{place_id}) zachowują swoją kolejność.
+
+    Args:
+        router (APIRouter): Router źródłowy.
+        overrides (list[APIRouter]): Routery, których trasy mają pierwszeństwo.
+
+    Returns:
+        APIRouter: Router zawierający tylko trasy bez odpowiedników.
+    """
+    overridden = {
+        (route.path, method)
+        for override in overrides
+        for route in override.routes
+        for method in getattr(route, "methods", None) or ()
+    }
+    filtered = APIRouter()
+    filtered.routes.extend(
+        route for route in router.routes
+        if not any((route.path, method) in overridden for method in getattr(route, "methods", None) or ())
+    )
+    return filtered
+
 
 # Rejestracja routerów
-app.include_router(places.router)
-app.include_router(reviews.router)
+api_routers = [places.router, reviews.router]
+if settings.database_async:
+    # W trybie asynchronicznym endpointy miejsc i recenzji obsługiwane są bez puli wątków
+    from app.routers import async_places, async_reviews
+
+    api_routers += [async_places.router, async_reviews.router]
+if settings.reviews_write_behind:
+    # Recenzje przyjmowane do kolejki i zapisywane w tle partiami
+    from app.routers import queued_reviews
+
+    api_routers.append(queued_reviews.router)
+
+# Trasy późniejszych routerów zastępują trasy wcześniejszych o tej samej ścieżce i metodzie
+for index, api_router in enumerate(api_routers):
+    app.include_router(_without_overridden(api_router, api_routers[index + 1:]))
 app.include_router(ws_router.router)
+app.include_router(metrics_router.router)
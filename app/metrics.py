@@ -0,0 +1,431 @@
+from bisect import bisect_left
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+import time
+
+
+class PoolMetrics:
+    """
+    Statystyki pobierania połączeń z puli.
+
+    Attributes:
+        acquisitions: Liczba pobranych połączeń.
+        wait_total: Łączny czas oczekiwania na połączenie (sekundy).
+        wait_max: Najdłuższe pojedyncze oczekiwanie (sekundy).
+        timeouts: Liczba żądań, które nie doczekały się połączenia (pool_timeout).
+    """
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+
+    def record_wait(self, seconds: float) -> None:
+        """
+        Zapisuje czas oczekiwania na połączenie.
+
+        Args:
+            seconds (float): Czas oczekiwania w sekundach.
+        """
+        self.acquisitions += 1
+        self.wait_total += seconds
+        if seconds > self.wait_max:
+            self.wait_max = seconds
+
+
+class _InstrumentedPoolMixin:
+    """
+    Domieszka mierząca czas pobrania połączenia z puli.
+
+    Mierzony jest czas metody _do_get, czyli oczekiwanie na wolne połączenie
+    oraz ewentualne otwarcie nowego połączenia w ramach max_overflow.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """Pula QueuePool zbierająca statystyki oczekiwania na połączenia."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """Pula AsyncAdaptedQueuePool zbierająca statystyki oczekiwania na połączenia."""
+
+
+def pool_status(pool) -> dict:
+    """
+    Zwraca bieżący stan puli połączeń.
+
+    Args:
+        pool: Pula połączeń silnika SQLAlchemy.
+
+    Returns:
+        dict: Rozmiar puli, liczba połączeń wypożyczonych i wolnych, nadmiar (overflow)
+        oraz statystyki oczekiwania, jeśli pula jest instrumentowana.
+    """
+    status = {"pool_class": type(pool).__name__}
+    for name in ("size", "checkedout", "checkedin", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            status[name] = method()
+
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(
+            acquisitions=metrics.acquisitions,
+            timeouts=metrics.timeouts,
+            wait_avg_ms=round(metrics.wait_total / metrics.acquisitions * 1000, 3) if metrics.acquisitions else 0.0,
+            wait_max_ms=round(metrics.wait_max * 1000, 3),
+        )
+    return status
+
+
+# Górne granice kubełków histogramu czasu odpowiedzi (sekundy), jak w klientach Prometheus
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Okno kroczące statusu: WINDOW_SLOTS przedziałów po SLOT_SECONDS sekund
+SLOT_SECONDS = 10
+WINDOW_SLOTS = 6
+
+
+class LatencyHistogram:
+    """
+    Histogram czasów odpowiedzi o stałych kubełkach.
+
+    Attributes:
+        buckets: Liczba obserwacji w każdym kubełku (ostatni – powyżej największej granicy).
+        count: Liczba obserwacji.
+        total: Suma czasów w sekundach.
+        errors: Liczba odpowiedzi z kodem 5xx.
+    """
+
+    __slots__ = ("buckets", "count", "total", "errors")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float, error: bool) -> None:
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if error:
+            self.errors += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, value in enumerate(other.buckets):
+            self.buckets[index] += value
+        self.count += other.count
+        self.total += other.total
+        self.errors += other.errors
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Szacuje kwantyl przez interpolację liniową wewnątrz kubełka.
+
+        Args:
+            q (float): Kwantyl z przedziału (0, 1).
+
+        Returns:
+            float | None: Szacowany czas w sekundach lub None, gdy brak obserwacji.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, value in enumerate(self.buckets):
+            if value and seen + value >= rank:
+                lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+                if index == len(LATENCY_BUCKETS):
+                    return lower
+                return lower + (LATENCY_BUCKETS[index] - lower) * (rank - seen) / value
+            seen += value
+        return LATENCY_BUCKETS[-1]
+
+
+class RouteMetrics:
+    """
+    Statystyki jednej trasy: histogram od startu procesu (dla Prometheus)
+    i histogramy przedziałów okna kroczącego (dla statusu).
+
+    Attributes:
+        total: Histogram wszystkich żądań od startu procesu.
+        statuses: Liczba odpowiedzi dla każdego kodu HTTP.
+        window: Pierścień par (numer przedziału, histogram przedziału).
+    """
+
+    __slots__ = ("total", "statuses", "window")
+
+    def __init__(self):
+        self.total = LatencyHistogram()
+        self.statuses: dict[int, int] = {}
+        self.window: list[tuple[int, LatencyHistogram]] = [(-1, LatencyHistogram()) for _ in range(WINDOW_SLOTS)]
+
+    def observe(self, status: int, seconds: float, now: float) -> None:
+        error = status >= 500
+        self.total.observe(seconds, error)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+        slot = int(now // SLOT_SECONDS)
+        index = slot % WINDOW_SLOTS
+        slot_id, histogram = self.window[index]
+        if slot_id != slot:
+            histogram = LatencyHistogram()
+            self.window[index] = (slot, histogram)
+        histogram.observe(seconds, error)
+
+    def recent(self, now: float) -> LatencyHistogram:
+        """
+        Zwraca histogram żądań z okna kroczącego (ostatnie WINDOW_SLOTS × SLOT_SECONDS sekund).
+
+        Args:
+            now (float): Bieżący czas (time.monotonic()).
+
+        Returns:
+            LatencyHistogram: Suma histogramów aktualnych przedziałów.
+        """
+        oldest = int(now // SLOT_SECONDS) - WINDOW_SLOTS + 1
+        merged = LatencyHistogram()
+        for slot_id, histogram in self.window:
+            if slot_id >= oldest:
+                merged.merge(histogram)
+        return merged
+
+
+class RequestMetrics:
+    """
+    Metryki żądań HTTP bieżącego procesu roboczego.
+
+    Wszystkie aktualizacje wykonywane są w wątku pętli zdarzeń (przez
+    MetricsMiddleware), więc liczniki to zwykłe pola bez blokad – koszt
+    pomiaru to kilka operacji na liczbach całkowitych na żądanie. Każdy
+    proces uvicorn ma własne liczniki.
+
+    Attributes:
+        routes: Statystyki tras, kluczem jest para (metoda, szablon ścieżki).
+        in_flight: Liczba żądań w trakcie obsługi.
+        started_at: Chwila utworzenia (time.monotonic()).
+    """
+
+    def __init__(self):
+        self.routes: dict[tuple[str, str], RouteMetrics] = {}
+        self.in_flight = 0
+        self.started_at = time.monotonic()
+
+    def observe(self, method: str, route: str, status: int, seconds: float) -> None:
+        """
+        Zapisuje zakończone żądanie.
+
+        Args:
+            method (str): Metoda HTTP.
+            route (str): Szablon ścieżki trasy (np. /places/{place_id}).
+            status (int): Kod odpowiedzi.
+            seconds (float): Czas obsługi w sekundach.
+        """
+        key = (method, route)
+        stats = self.routes.get(key)
+        if stats is None:
+            stats = self.routes[key] = RouteMetrics()
+        stats.observe(status, seconds, time.monotonic())
+
+    def summary(self) -> dict:
+        """
+        Zwraca podsumowanie z okna kroczącego (do wiadomości statusu).
+
+        Returns:
+            dict: Liczba żądań na sekundę, odsetek błędów 5xx, żądania w trakcie
+            obsługi oraz dla każdej trasy RPS i kwantyle p50/p95/p99 w milisekundach.
+        """
+        now = time.monotonic()
+        window = min(WINDOW_SLOTS * SLOT_SECONDS, max(now - self.started_at, 1.0))
+        overall = LatencyHistogram()
+        routes = {}
+        for (method, route), stats in self.routes.items():
+            recent = stats.recent(now)
+            if not recent.count:
+                continue
+            overall.merge(recent)
+            routes[f"{method} {route}"] = {
+                "rps": round(recent.count / window, 3),
+                **{
+                    f"p{int(q * 100)}_ms": round(recent.quantile(q) * 1000, 2)
+                    for q in (0.5, 0.95, 0.99)
+                },
+            }
+        return {
+            "window_seconds": round(window, 1),
+            "requests_per_second": round(overall.count / window, 3),
+            "error_rate": round(overall.errors / overall.count, 4) if overall.count else 0.0,
+            "in_flight": self.in_flight,
+            "routes": routes,
+        }
+
+
+request_metrics = RequestMetrics()
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI mierzące czas obsługi żądań HTTP.
+
+    Czysty middleware ASGI (bez BaseHTTPMiddleware), więc nie tworzy
+    dodatkowych zadań ani strumieni dla każdego żądania. Trasa rozpoznawana jest
+    po szablonie ścieżki ustawionym przez router w scope["route"], więc liczba
+    serii nie rośnie z liczbą identyfikatorów w adresach.
+    """
+
+    def __init__(self, app, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.metrics.in_flight += 1
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.metrics.in_flight -= 1
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            self.metrics.observe(scope["method"], route, status, time.perf_counter() - started)
+
+
+def status_summary() -> dict:
+    """
+    Zwraca podsumowanie metryk procesu wysyłane w wiadomościach statusu WebSocket.
+
+    Returns:
+        dict: Metryki żądań (request_metrics.summary()) i stan pul połączeń.
+    """
+    # Import lokalny – app.database importuje pule zdefiniowane w tym module
+    from app.database import engines
+
+    return {
+        **request_metrics.summary(),
+        "db_pool": {name: pool_status(engine.pool) for name, engine in engines().items()},
+    }
+
+
+def combine_summaries(summaries: dict[str, dict]) -> dict:
+    """
+    Łączy podsumowania metryk procesów roboczych w podsumowanie klastra.
+
+    Kwantyli z różnych procesów nie da się zsumować, więc dla klastra podawane
+    są sumaryczne RPS, odsetek błędów (ważony liczbą żądań) i żądania w toku,
+    a szczegóły tras – osobno dla każdego procesu.
+
+    Args:
+        summaries (dict[str, dict]): Podsumowania (status_summary()) według identyfikatora procesu.
+
+    Returns:
+        dict: Podsumowanie klastra z kluczem workers zawierającym podsumowania procesów.
+    """
+    rps = sum(summary["requests_per_second"] for summary in summaries.values())
+    errors = sum(summary["requests_per_second"] * summary["error_rate"] for summary in summaries.values())
+    return {
+        "requests_per_second": round(rps, 3),
+        "error_rate": round(errors / rps, 4) if rps else 0.0,
+        "in_flight": sum(summary["in_flight"] for summary in summaries.values()),
+        "workers": summaries,
+    }
+
+
+def _label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{name}="{_label_value(value)}"' for name, value in labels.items()) + "}"
+
+
+def prometheus_text(
+    metrics: RequestMetrics,
+    engines: dict,
+    extra: dict[str, tuple[str, float]] | None = None,
+) -> str:
+    """
+    Zwraca metryki w formacie tekstowym Prometheus (wersja 0.0.4).
+
+    Args:
+        metrics (RequestMetrics): Metryki żądań procesu.
+        engines (dict): Silniki bazy danych {nazwa: silnik}.
+        extra (dict[str, tuple[str, float]] | None): Dodatkowe metryki {nazwa: (typ, wartość)},
+            gdzie typ to gauge lub counter.
+
+    Returns:
+        str: Treść odpowiedzi dla GET /metrics.
+    """
+    lines = [
+        "# HELP http_requests_total Liczba obsłużonych żądań HTTP.",
+        "# TYPE http_requests_total counter",
+    ]
+    for (method, route), stats in sorted(metrics.routes.items()):
+        for status, count in sorted(stats.statuses.items()):
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+
+    lines += [
+        "# HELP http_request_duration_seconds Czas obsługi żądań HTTP.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for (method, route), stats in sorted(metrics.routes.items()):
+        cumulative = 0
+        for bound, value in zip((*LATENCY_BUCKETS, "+Inf"), stats.total.buckets):
+            cumulative += value
+            lines.append(
+                f"http_request_duration_seconds_bucket{_labels(method=method, route=route, le=bound)} {cumulative}"
+            )
+        lines.append(f"http_request_duration_seconds_sum{_labels(method=method, route=route)} {stats.total.total}")
+        lines.append(f"http_request_duration_seconds_count{_labels(method=method, route=route)} {stats.total.count}")
+
+    lines += [
+        "# HELP http_requests_in_flight Liczba żądań w trakcie obsługi.",
+        "# TYPE http_requests_in_flight gauge",
+        f"http_requests_in_flight {metrics.in_flight}",
+    ]
+
+    pool_metrics = {
+        "size": ("gauge", "Rozmiar puli połączeń."),
+        "checkedout": ("gauge", "Połączenia wypożyczone z puli."),
+        "overflow": ("gauge", "Połączenia otwarte ponad rozmiar puli."),
+        "acquisitions": ("counter", "Liczba pobrań połączenia z puli."),
+        "timeouts": ("counter", "Liczba przekroczeń pool_timeout."),
+    }
+    statuses = {name: pool_status(engine.pool) for name, engine in engines.items()}
+    for key, (kind, description) in pool_metrics.items():
+        name = f"db_pool_{key}" + ("_total" if kind == "counter" else "")
+        samples = [(engine, status[key]) for engine, status in statuses.items() if key in status]
+        if not samples:
+            continue
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+        lines += [f"{name}{_labels(engine=engine)} {value}" for engine, value in samples]
+
+    for name, (kind, value) in (extra or {}).items():
+        lines += [f"# TYPE {name} {kind}", f"{name} {value}"]
+    return "\n".join(lines) + "\n"
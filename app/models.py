@@ -1,8 +1,17 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, func, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, func, Boolean, ForeignKey, Index
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import relationship, declarative_base
 
 Base = declarative_base()
 
+# SQLite zapisuje CURRENT_TIMESTAMP z dokładnością do sekundy, a domyślny format
+# parametrów zawiera mikrosekundy. Oba formaty muszą być zgodne, aby porównania
+# dat (np. w kursorach stronicowania) działały poprawnie na zapisanych tekstach.
+Timestamp = DateTime().with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite",
+)
+
 class Place(Base):
     """
     Klasa reprezentująca miejsce, które może zostać odwiedzone przez użytkownika (np. atrakcja turystyczna, muzeum).
@@ -26,6 +35,15 @@ class Place(Base):
         country (Optional[str]):
             Kraj, w którym znajduje się miejsce.
 
+        latitude (Optional[float]):
+            Szerokość geograficzna w stopniach.
+
+        longitude (Optional[float]):
+            Długość geograficzna w stopniach.
+
+        geohash (Optional[str]):
+            Geohash współrzędnych, indeksowany na potrzeby wyszukiwania miejsc w pobliżu.
+
         visit_duration (Optional[str]):
             Szacowany czas zwiedzania (np. "30 minut", "1-2 godziny").
 
@@ -38,6 +56,28 @@ class Place(Base):
         updated_at (datetime):
             Data i godzina ostatniej aktualizacji rekordu.
 
+        revision (int):
+            Numer wersji danych miejsca zwiększany przy każdej edycji (składnik ETagu,
+            niezależny od dokładności zapisu updated_at).
+
+        review_count (int):
+            Liczba recenzji miejsca (wartość zdenormalizowana).
+
+        rating_sum (int):
+            Suma ocen ze wszystkich recenzji.
+
+        rating_avg (float):
+            Średnia ocena (0, jeśli miejsce nie ma recenzji); indeksowana na potrzeby sortowania.
+
+        rating_1 … rating_5 (int):
+            Histogram ocen – liczba recenzji z daną liczbą gwiazdek.
+
+        bayesian_score (float):
+            Średnia Bayesa ocen (ranking najlepiej ocenianych, patrz app.ranking).
+
+        trending_score (float):
+            Suma malejących z czasem wag recenzji (ranking popularnych, patrz app.ranking).
+
         reviews (List[Review]):
             Lista recenzji powiązanych z danym miejscem.
             Relacja jeden-do-wielu z klasą Review.
@@ -53,14 +93,91 @@ class Place(Base):
     city = Column(String(100), nullable=True, index=True)
     country = Column(String(100), nullable=True, index=True)
 
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    geohash = Column(String(12), nullable=True, index=True)
+
     visit_duration = Column(String(100), nullable=True)
     is_free = Column(Boolean, nullable=True)
 
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now())
+    revision = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Agregaty ocen aktualizowane przy dodawaniu recenzji
+    review_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_avg = Column(Float, nullable=False, default=0.0, server_default="0")
+    rating_1 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_2 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_3 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_4 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_5 = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Wyniki rankingów aktualizowane razem z agregatami ocen
+    bayesian_score = Column(Float, nullable=False, default=0.0, server_default="0")
+    trending_score = Column(Float, nullable=False, default=0.0, server_default="0")
 
     reviews = relationship("Review", back_populates="place", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Indeks pod stronicowanie kursorem po (created_at, id)
+        Index("ix_places_created_at_id", "created_at", "id"),
+        # Indeks pod sortowanie i stronicowanie po średniej ocenie
+        Index("ix_places_rating_avg_id", "rating_avg", "id"),
+        # Indeksy rankingów – ogólnych oraz w mieście i kraju
+        Index("ix_places_bayesian_score_id", "bayesian_score", "id"),
+        Index("ix_places_city_bayesian_score_id", "city", "bayesian_score", "id"),
+        Index("ix_places_country_bayesian_score_id", "country", "bayesian_score", "id"),
+        Index("ix_places_trending_score_id", "trending_score", "id"),
+        Index("ix_places_city_trending_score_id", "city", "trending_score", "id"),
+        Index("ix_places_country_trending_score_id", "country", "trending_score", "id"),
+    )
+
+    @property
+    def rating_histogram(self) -> dict[int, int]:
+        """Histogram ocen w postaci słownika {liczba gwiazdek: liczba recenzji}."""
+        return {stars: getattr(self, f"rating_{stars}") or 0 for stars in range(1, 6)}
+
+
+
+class PlaceFacetCount(Base):
+    """
+    Liczba miejsc dla kombinacji kraju, miasta i bezpłatnego wstępu (liczniki facetów).
+
+    Tabela aktualizowana jest przyrostowo przy tworzeniu, edycji i usuwaniu miejsc,
+    więc liczniki facetów odczytywane są z kilkuset wierszy zamiast grupowania
+    całej tabeli places. Ta sama kombinacja może wyjątkowo wystąpić w kilku
+    wierszach (współbieżne pierwsze wstawienie) – liczniki są zawsze sumowane.
+
+    Atrybuty:
+        id (int):
+            Unikalny identyfikator wiersza.
+
+        country (Optional[str]):
+            Kraj miejsc.
+
+        city (Optional[str]):
+            Miasto miejsc.
+
+        is_free (Optional[bool]):
+            Informacja o bezpłatnym wstępie.
+
+        count (int):
+            Liczba miejsc z tą kombinacją wartości.
+    """
+
+    __tablename__ = "place_facet_counts"
+
+    id = Column(Integer, primary_key=True)
+    country = Column(String(100), nullable=True)
+    city = Column(String(100), nullable=True)
+    is_free = Column(Boolean, nullable=True)
+    count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        Index("ix_place_facet_counts_country_city_is_free", "country", "city", "is_free"),
+    )
 
 
 class Review(Base):
@@ -98,7 +215,12 @@ class Review(Base):
     content = Column(Text)
     rating = Column(Integer)  # 1-5
 
-    created_at = Column(DateTime, server_default=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
 
     place_id = Column(Integer, ForeignKey("places.id"))
-    place = relationship("Place", back_populates="reviews")
\ No newline at end of file
+    place = relationship("Place", back_populates="reviews")
+
+    __table_args__ = (
+        # Indeks pod ładowanie recenzji miejsca i stronicowanie po (created_at, id)
+        Index("ix_reviews_place_id_created_at", "place_id", "created_at", "id"),
+    )
\ No newline at end of file
@@ -0,0 +1,90 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any, Sequence
+import binascii
+import json
+
+from sqlalchemy import literal, tuple_
+
+
+class InvalidCursorError(ValueError):
+    """Wyjątek zgłaszany, gdy kursor przesłany przez klienta jest niepoprawny."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(column, value: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    """
+    Koduje klucz ostatniego elementu strony do postaci nieprzezroczystego kursora.
+
+    Args:
+        sort (str): Nazwa sortowania, dla którego kursor jest ważny.
+        values (Sequence[Any]): Wartości kolumn klucza sortowania ostatniego elementu.
+
+    Returns:
+        str: Kursor w postaci tekstu base64 bezpiecznego dla URL.
+    """
+    payload = json.dumps({"s": sort, "k": [_encode_value(v) for v in values]}, separators=(",", ":"))
+    return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, columns: Sequence) -> tuple:
+    """
+    Dekoduje kursor i sprawdza, czy pasuje do wybranego sortowania.
+
+    Args:
+        cursor (str): Kursor otrzymany od klienta.
+        sort (str): Nazwa bieżącego sortowania.
+        columns (Sequence): Kolumny klucza sortowania (służą do konwersji typów).
+
+    Raises:
+        InvalidCursorError: Jeśli kursor jest uszkodzony lub dotyczy innego sortowania.
+
+    Returns:
+        tuple: Wartości klucza, od którego należy kontynuować.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(urlsafe_b64decode(padded.encode()))
+        if payload["s"] != sort or len(payload["k"]) != len(columns):
+            raise InvalidCursorError("Kursor nie pasuje do wybranego sortowania")
+        return tuple(_decode_value(col, v) for col, v in zip(columns, payload["k"]))
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Niepoprawny kursor") from e
+
+
+def keyset_condition(columns: Sequence, values: Sequence[Any], descending: bool = False):
+    """
+    Buduje warunek WHERE wybierający elementy położone za kluczem kursora.
+
+    Porównanie krotek (np. ``(created_at, id) > (:a, :b)``) pozwala bazie
+    skorzystać z indeksu złożonego, dzięki czemu kolejne strony kosztują tyle samo co pierwsza.
+
+    Args:
+        columns (Sequence): Kolumny klucza sortowania.
+        values (Sequence[Any]): Wartości klucza z kursora.
+        descending (bool): Czy sortowanie jest malejące.
+
+    Returns:
+        ColumnElement: Warunek do użycia w klauzuli WHERE.
+    """
+    # Parametry muszą mieć typ kolumny, aby zostały zapisane w tym samym formacie co dane
+    values = [literal(value, col.type) for col, value in zip(columns, values)]
+    if len(columns) == 1:
+        left, right = columns[0], values[0]
+    else:
+        left, right = tuple_(*columns), tuple_(*values)
+    return left < right if descending else left > right
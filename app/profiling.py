@@ -0,0 +1,209 @@
+"""
+Profilowanie zapytań SQL w obrębie żądania i dziennik wolnych zapytań.
+
+Tryb włączany zmienną SQL_PROFILING=1. Zdarzenia before_cursor_execute /
+after_cursor_execute SQLAlchemy mierzą każde zapytanie, a SQLProfilingMiddleware
+przypisuje je do bieżącego żądania przez zmienną kontekstową (kontekst jest
+kopiowany do wątków puli i greenletów silnika asynchronicznego). Dla każdego
+żądania:
+
+- nagłówek Server-Timing podaje liczbę i łączny czas zapytań,
+- wielokrotne wykonanie tego samego zapytania z różnymi parametrami (wzorzec
+  N+1) jest zapisywane w dzienniku z nazwą trasy,
+- zapytania dłuższe niż SQL_SLOW_QUERY_MS trafiają do dziennika wraz
+  z parametrami i trasą, która je wywołała.
+"""
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Maksymalna długość parametrów zapytania zapisywanych w dzienniku
+MAX_LOGGED_PARAMETERS = 500
+
+_current_profile: ContextVar["RequestProfile | None"] = ContextVar("sql_profile", default=None)
+
+
+@dataclass
+class StatementStats:
+    """
+    Statystyki jednego tekstu zapytania w obrębie żądania.
+
+    Attributes:
+        count: Liczba wykonań.
+        duration: Łączny czas wykonania w sekundach.
+        parameters: Różne zestawy parametrów (ograniczone do progu wykrywania N+1).
+    """
+
+    count: int = 0
+    duration: float = 0.0
+    parameters: set[str] = field(default_factory=set)
+
+
+@dataclass
+class RequestProfile:
+    """
+    Zapytania SQL wykonane podczas obsługi jednego żądania.
+
+    Attributes:
+        scope: Scope ASGI żądania (trasa ustawiana jest przez router).
+        count: Liczba zapytań.
+        duration: Łączny czas zapytań w sekundach.
+        statements: Statystyki według tekstu zapytania.
+    """
+
+    scope: dict
+    count: int = 0
+    duration: float = 0.0
+    statements: dict[str, StatementStats] = field(default_factory=dict)
+
+    @property
+    def route(self) -> str:
+        route = getattr(self.scope.get("route"), "path", None) or self.scope.get("path", "")
+        return f"{self.scope.get('method', '')} {route}".strip()
+
+
+class SQLProfiler:
+    """
+    Nasłuchuje wykonań zapytań wszystkich silników i przypisuje je do bieżącego żądania.
+
+    Attributes:
+        slow_query_seconds: Próg wolnego zapytania w sekundach (0 wyłącza dziennik).
+        n_plus_one_threshold: Liczba wykonań zapytania z różnymi parametrami uznawana za N+1.
+    """
+
+    def __init__(
+        self,
+        slow_query_ms: float = settings.sql_slow_query_ms,
+        n_plus_one_threshold: int = settings.sql_n_plus_one_threshold,
+    ):
+        self.slow_query_seconds = slow_query_ms / 1000
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.installed = False
+
+    def install(self) -> None:
+        """Rejestruje nasłuch zdarzeń dla wszystkich silników (również utworzonych później)."""
+        if not self.installed:
+            event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+            self.installed = True
+
+    def uninstall(self) -> None:
+        """Usuwa nasłuch zdarzeń."""
+        if self.installed:
+            event.remove(Engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(Engine, "after_cursor_execute", self._after_cursor_execute)
+            self.installed = False
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("profiling_started", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["profiling_started"].pop()
+        elapsed = time.perf_counter() - started
+
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.count += 1
+            profile.duration += elapsed
+            stats = profile.statements.get(statement)
+            if stats is None:
+                stats = profile.statements[statement] = StatementStats()
+            stats.count += 1
+            stats.duration += elapsed
+            if len(stats.parameters) < self.n_plus_one_threshold:
+                stats.parameters.add(repr(parameters))
+
+        if self.slow_query_seconds and elapsed >= self.slow_query_seconds:
+            logger.warning(
+                "Wolne zapytanie (%.1f ms, %s): %s; parametry: %.*s",
+                elapsed * 1000,
+                profile.route if profile is not None else "poza żądaniem",
+                statement,
+                MAX_LOGGED_PARAMETERS,
+                repr(parameters),
+            )
+
+    def n_plus_one(self, profile: RequestProfile) -> list[tuple[str, StatementStats]]:
+        """
+        Zwraca zapytania wykonane wielokrotnie z różnymi parametrami.
+
+        Args:
+            profile (RequestProfile): Profil żądania.
+
+        Returns:
+            list[tuple[str, StatementStats]]: Pary (tekst zapytania, statystyki) od najczęstszych.
+        """
+        repeated = [
+            (statement, stats)
+            for statement, stats in profile.statements.items()
+            if len(stats.parameters) >= self.n_plus_one_threshold
+        ]
+        return sorted(repeated, key=lambda item: item[1].count, reverse=True)
+
+
+profiler = SQLProfiler()
+
+
+def server_timing(profile: RequestProfile) -> str:
+    """
+    Buduje wartość nagłówka Server-Timing dla zapytań żądania.
+
+    Args:
+        profile (RequestProfile): Profil żądania.
+
+    Returns:
+        str: Np. db;dur=3.21;desc="4 queries".
+    """
+    return f'db;dur={profile.duration * 1000:.2f};desc="{profile.count} queries"'
+
+
+class SQLProfilingMiddleware:
+    """
+    Middleware ASGI zbierające profil zapytań SQL każdego żądania HTTP.
+
+    Nagłówek Server-Timing dołączany jest na początku odpowiedzi, więc
+    w odpowiedziach strumieniowanych (eksport) obejmuje tylko zapytania
+    wykonane przed wysłaniem pierwszego fragmentu; dziennik N+1 sporządzany
+    jest po zakończeniu odpowiedzi.
+    """
+
+    def __init__(self, app, sql_profiler: SQLProfiler = profiler):
+        self.app = app
+        self.profiler = sql_profiler
+        sql_profiler.install()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope)
+        token = _current_profile.set(profile)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing(profile).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_profile.reset(token)
+            for statement, stats in self.profiler.n_plus_one(profile):
+                logger.warning(
+                    "Możliwe zapytania N+1 w %s: %d wykonań (%.1f ms) zapytania: %s",
+                    profile.route,
+                    stats.count,
+                    stats.duration * 1000,
+                    statement,
+                )
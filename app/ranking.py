@@ -0,0 +1,87 @@
+"""
+Wyniki rankingów miejsc: najlepiej oceniane (średnia Bayesa) i popularne (trending).
+
+Średnia Bayesa ściąga średnią miejsc z małą liczbą recenzji do oceny
+RANKING_PRIOR_MEAN – jedna recenzja 5/5 nie wyprzedza miejsca ze średnią 4,8
+z kilkuset recenzji. Wynik zależy tylko od liczby i sumy ocen miejsca, więc
+aktualizowany jest tą samą instrukcją UPDATE co pozostałe agregaty ocen.
+
+Wynik popularności to suma wag recenzji (ocena / 5) malejących wykładniczo
+z wiekiem recenzji (okres półtrwania TRENDING_HALF_LIFE_HOURS). Zamiast
+przeliczać wszystkie wyniki wraz z upływem czasu, waga recenzji zapisywana
+jest względem stałej chwili TRENDING_EPOCH: 2^((t - epoka) / okres półtrwania).
+Wspólny czynnik 2^(-(teraz - epoka) / okres półtrwania) nie zmienia kolejności,
+więc nowa recenzja tylko dodaje swoją wagę do wyniku miejsca, a indeks na
+kolumnie wyniku pozostaje aktualny. Wartość na chwilę odczytu wylicza trending_now.
+
+Wagi rosną wykładniczo z czasem: przy okresie półtrwania 72 h zakres liczb
+zmiennoprzecinkowych wystarcza na ponad 8 lat od epoki. Po zmianie parametrów
+rankingów wyniki trzeba przeliczyć: python -m app.cli recompute-rankings.
+"""
+from datetime import datetime, timezone
+
+from sqlalchemy import Float, cast
+
+from app.config import settings
+
+# Chwila odniesienia wag wyniku popularności
+TRENDING_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# Maksymalna ocena recenzji (waga recenzji to ocena / MAX_RATING)
+MAX_RATING = 5
+
+
+def _hours_since_epoch(moment: datetime | None) -> float:
+    if moment is None:
+        moment = datetime.now(timezone.utc)
+    elif moment.tzinfo is None:
+        # Daty zapisane przez bazę nie mają strefy czasowej i są w UTC
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - TRENDING_EPOCH).total_seconds() / 3600
+
+
+def trending_weight(rating: int, created_at: datetime | None = None) -> float:
+    """
+    Zwraca wagę recenzji w wyniku popularności (względem TRENDING_EPOCH).
+
+    Args:
+        rating (int): Ocena recenzji.
+        created_at (datetime | None): Chwila dodania recenzji (None – teraz).
+
+    Returns:
+        float: Waga recenzji.
+    """
+    return rating / MAX_RATING * 2 ** (_hours_since_epoch(created_at) / settings.trending_half_life_hours)
+
+
+def trending_now(score: float, now: datetime | None = None) -> float:
+    """
+    Przelicza zapisany wynik popularności na wartość w chwili odczytu.
+
+    Args:
+        score (float): Wynik zapisany w kolumnie trending_score.
+        now (datetime | None): Chwila odczytu (None – teraz).
+
+    Returns:
+        float: Suma wag recenzji, w której recenzja sprzed okresu półtrwania waży połowę.
+    """
+    return score * 2 ** (-_hours_since_epoch(now) / settings.trending_half_life_hours)
+
+
+def bayesian_score(review_count, rating_sum):
+    """
+    Buduje średnią Bayesa z liczby i sumy ocen.
+
+    Działa zarówno dla liczb, jak i wyrażeń SQL (kolumn i parametrów).
+
+    Args:
+        review_count: Liczba recenzji.
+        rating_sum: Suma ocen.
+
+    Returns:
+        Średnia ocen z dodanymi ranking_prior_weight recenzjami o ocenie ranking_prior_mean.
+    """
+    prior = settings.ranking_prior_weight * settings.ranking_prior_mean
+    if isinstance(rating_sum, (int, float)):
+        return (prior + rating_sum) / (settings.ranking_prior_weight + review_count)
+    return cast(rating_sum + prior, Float) / (review_count + settings.ranking_prior_weight)
@@ -0,0 +1,179 @@
+"""
+Asynchroniczne wersje endpointów miejsc, używane w trybie DATABASE_ASYNC.
+
+Ścieżki i schematy odpowiedzi są identyczne jak w routers.places, dzięki czemu
+dokumentacja OpenAPI nie zależy od wybranego trybu.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated
+from .. import schemas
+from ..cache import response_cache
+from ..conditional import has_conditions, is_not_modified, not_modified
+from ..config import settings
+from ..database import get_async_db
+from ..pagination import InvalidCursorError
+from .places import FIELDS_DESCRIPTION
+from ..serialization import InvalidFieldsError, dumps, parse_place_fields
+from ..crud.async_place import (
+    create_place, get_place_document, get_place_validator, get_places_document, get_places_validator,
+    delete_place, update_place,
+)
+
+router = APIRouter(prefix="/places", tags=["places"])
+
+@router.post("/", response_model=schemas.Place)
+async def create_place_endpoint(place: schemas.PlaceCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+        Tworzy nowe miejsce w systemie.
+
+        Args:
+            place (schemas.PlaceCreate): Dane nowego miejsca.
+            db (AsyncSession): Asynchroniczna sesja bazy danych.
+
+        Returns:
+            schemas.Place: Utworzony obiekt miejsca.
+        """
+    return await create_place(db, place)
+
+
+@router.get("/", response_model=schemas.Page[schemas.PlaceSummary])
+async def read_places_endpoint(
+    filters: Annotated[schemas.PlaceFilters, Depends()],
+    request: Request,
+    sort: schemas.PlaceSort = schemas.PlaceSort.id,
+    limit: int = Query(settings.places_default_page_size, ge=1, le=settings.places_max_page_size),
+    cursor: str | None = None,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+        Pobiera stronę listy miejsc z opcjonalnymi filtrami.
+
+        Args:
+            filters (schemas.PlaceFilters): Filtry po mieście, kraju, początku nazwy i bezpłatnym wstępie.
+            request (Request): Żądanie HTTP (nagłówki warunkowe).
+            sort (schemas.PlaceSort): Sposób sortowania.
+            limit (int): Liczba miejsc na stronie.
+            cursor (str | None): Kursor kolejnej strony zwrócony w poprzedniej odpowiedzi.
+            fields (str | None): Wybrane pola lub zestawy pól (summary, full) rozdzielone przecinkami.
+            db (AsyncSession): Asynchroniczna sesja bazy danych.
+
+        Raises:
+            HTTPException: 400 jeśli kursor lub parametr fields jest niepoprawny.
+
+        Returns:
+            schemas.Page[schemas.PlaceSummary]: Strona miejsc wraz z kursorem kolejnej strony.
+        """
+    try:
+        field_set = parse_place_fields(fields)
+        if has_conditions(request):
+            validator = await get_places_validator(db, filters, sort=sort, limit=limit, cursor=cursor)
+            if is_not_modified(request, validator):
+                return not_modified(validator)
+
+        key = response_cache.list_key(
+            {
+                "filters": filters.model_dump(), "sort": sort, "limit": limit, "cursor": cursor,
+                "fields": field_set.key if field_set is not None else None,
+            }
+        )
+        cached = response_cache.lookup(key)
+        if cached is not None:
+            return cached
+
+        page, validator = await get_places_document(
+            db, filters, sort=sort, limit=limit, cursor=cursor, fields=field_set
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    except InvalidFieldsError as error:
+        raise HTTPException(status_code=400, detail=f"Unknown field: {error}")
+    return response_cache.store(key, dumps(page), validator.headers())
+
+
+@router.get("/{place_id}", response_model=schemas.Place)
+async def read_place_endpoint(
+    place_id: int,
+    request: Request,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+        Pobiera szczegółowe informacje o konkretnym miejscu na podstawie ID.
+
+        Args:
+            place_id (int): ID miejsca.
+            request (Request): Żądanie HTTP (nagłówki warunkowe).
+            fields (str | None): Wybrane pola lub zestawy pól (summary, full) rozdzielone przecinkami.
+            db (AsyncSession): Asynchroniczna sesja bazy danych.
+
+        Raises:
+            HTTPException: 400 jeśli parametr fields jest niepoprawny, 404 jeśli miejsce nie istnieje.
+
+        Returns:
+            schemas.Place: Obiekt znalezionego miejsca.
+        """
+    try:
+        field_set = parse_place_fields(fields, detail=True)
+    except InvalidFieldsError as error:
+        raise HTTPException(status_code=400, detail=f"Unknown field: {error}")
+
+    if has_conditions(request):
+        validator = await get_place_validator(db, place_id)
+        if validator is None:
+            raise HTTPException(status_code=404, detail="Place not found")
+        if is_not_modified(request, validator):
+            return not_modified(validator)
+
+    key = response_cache.place_key(place_id, field_set.key if field_set is not None else None)
+    cached = response_cache.lookup(key)
+    if cached is not None:
+        return cached
+
+    found = await get_place_document(db, place_id, field_set)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Place not found")
+    place, validator = found
+    return response_cache.store(key, dumps(place), validator.headers())
+
+
+@router.put("/{place_id}", response_model=schemas.Place)
+async def update_place_endpoint(
+    place_id: int, place_update: schemas.PlaceCreate, db: AsyncSession = Depends(get_async_db)
+):
+    """
+        Aktualizuje dane istniejącego miejsca.
+
+        Args:
+            place_id (int): ID miejsca do aktualizacji.
+            place_update (schemas.PlaceCreate): Nowe dane miejsca.
+            db (AsyncSession): Asynchroniczna sesja bazy danych.
+
+        Raises:
+            HTTPException: 404 jeśli miejsce nie istnieje.
+
+        Returns:
+            schemas.Place: Zaktualizowany obiekt miejsca.
+    """
+    place = await update_place(db, place_id, place_update)
+    if place is None:
+        raise HTTPException(status_code=404, detail="Place not found")
+    return place
+
+
+@router.delete("/{place_id}", status_code=204)
+async def delete_place_endpoint(place_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Usuwa miejsce z systemu.
+
+    Args:
+        place_id (int): ID miejsca do usunięcia.
+        db (AsyncSession): Asynchroniczna sesja bazy danych.
+
+    Raises:
+        HTTPException: 404 jeśli miejsce nie istnieje.
+    """
+    deleted = await delete_place(db, place_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Place not found")
@@ -0,0 +1,74 @@
+"""
+Asynchroniczne wersje endpointów recenzji, używane w trybie DATABASE_ASYNC.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated
+from ..config import settings
+from ..database import get_async_db
+from .. import schemas
+from ..crud.async_review import create_review as create_review_crud, get_reviews
+from ..pagination import InvalidCursorError
+
+router = APIRouter(prefix="/places", tags=["reviews"])
+
+@router.post("/{place_id}/reviews", response_model=schemas.Review)
+async def add_new_review(place_id: int, review: schemas.ReviewCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+        Tworzy nową recenzję dla określonego miejsca (place_id).
+
+        Args:
+            place_id (int): Unikalny identyfikator miejsca.
+            review (schemas.ReviewCreate): Dane nowej recenzji.
+            db (AsyncSession): Asynchroniczna sesja bazy danych.
+
+        Raises:
+            HTTPException: 404 jeśli miejsce nie zostanie znalezione w bazie danych.
+
+        Returns:
+            schemas.Review: Obiekt utworzonej recenzji.
+        """
+    db_review = await create_review_crud(db, place_id, review)
+
+    if db_review is None:
+        raise HTTPException(status_code=404, detail="Place not found")
+
+    return db_review
+
+
+@router.get("/{place_id}/reviews", response_model=schemas.Page[schemas.Review])
+async def read_reviews(
+    place_id: int,
+    filters: Annotated[schemas.ReviewFilters, Depends()],
+    sort: schemas.ReviewSort = schemas.ReviewSort.created_at_desc,
+    limit: int = Query(settings.places_default_page_size, ge=1, le=settings.places_max_page_size),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+        Pobiera stronę recenzji określonego miejsca.
+
+        Args:
+            place_id (int): Unikalny identyfikator miejsca.
+            filters (schemas.ReviewFilters): Filtry po ocenie recenzji.
+            sort (schemas.ReviewSort): Kierunek sortowania po dacie dodania.
+            limit (int): Liczba recenzji na stronie.
+            cursor (str | None): Kursor kolejnej strony zwrócony w poprzedniej odpowiedzi.
+            db (AsyncSession): Asynchroniczna sesja bazy danych.
+
+        Raises:
+            HTTPException: 400 jeśli kursor jest niepoprawny, 404 jeśli miejsce nie istnieje.
+
+        Returns:
+            schemas.Page[schemas.Review]: Strona recenzji wraz z kursorem kolejnej strony.
+        """
+    try:
+        page = await get_reviews(db, place_id, filters, sort=sort, limit=limit, cursor=cursor)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if page is None:
+        raise HTTPException(status_code=404, detail="Place not found")
+
+    reviews, next_cursor = page
+    return {"items": reviews, "next_cursor": next_cursor}
@@ -0,0 +1,90 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from .. import backplane, feed
+from ..cache import response_cache
+from ..database import engines
+from ..ingest import review_ingestor
+from ..metrics import pool_status, prometheus_text, request_metrics
+from ..websocket_manager import manager
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("", response_class=PlainTextResponse)
+def read_prometheus_metrics():
+    """
+    Zwraca metryki bieżącego procesu roboczego w formacie tekstowym Prometheus.
+
+    Zawiera liczniki i histogramy czasu obsługi żądań dla każdej trasy, liczbę
+    żądań w toku, stan pul połączeń oraz wskaźniki WebSocket i pamięci podręcznej.
+    Liczniki są osobne dla każdego procesu uvicorn.
+
+    Returns:
+        PlainTextResponse: Metryki w formacie text/plain; version=0.0.4.
+    """
+    cache = response_cache.stats()
+    body = prometheus_text(request_metrics, engines(), {
+        "websocket_connected_clients": ("gauge", len(manager.active_connections)),
+        "websocket_feed_clients": ("gauge", len(feed.feed_manager.active_connections)),
+        "websocket_dropped_messages_total": ("counter", manager.stats()["dropped_messages"]),
+        "response_cache_hits_total": ("counter", cache["hits"]),
+        "response_cache_misses_total": ("counter", cache["misses"]),
+        "response_cache_errors_total": ("counter", cache["errors"]),
+    })
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
+@router.get("/db-pool")
+def read_db_pool_metrics():
+    """
+    Zwraca stan pul połączeń z bazą danych bieżącego procesu roboczego.
+
+    Każdy proces uvicorn ma własną pulę, więc łączna liczba połączeń do bazy
+    to liczba procesów × (DB_POOL_SIZE + DB_MAX_OVERFLOW).
+
+    Returns:
+        dict: Stan puli dla każdego silnika (liczba połączeń wypożyczonych,
+        wolnych, nadmiarowych oraz statystyki oczekiwania na połączenie).
+    """
+    return {name: pool_status(engine.pool) for name, engine in engines().items()}
+
+
+@router.get("/cache")
+def read_cache_metrics():
+    """
+    Zwraca liczniki pamięci podręcznej odpowiedzi bieżącego procesu roboczego.
+
+    Returns:
+        dict: Nazwa backendu, liczba trafień, chybień i unieważnień oraz współczynnik trafień.
+    """
+    return response_cache.stats()
+
+
+@router.get("/review-ingest")
+def read_review_ingest_metrics():
+    """
+    Zwraca liczniki kolejki zapisu recenzji w tle (tryb REVIEWS_WRITE_BEHIND) bieżącego procesu roboczego.
+
+    Returns:
+        dict: Długość kolejki, liczba zapisanych, odrzuconych i utraconych recenzji,
+        liczba i średni rozmiar partii oraz liczba odmów przy pełnej kolejce.
+    """
+    return review_ingestor.stats()
+
+
+@router.get("/websocket")
+def read_websocket_metrics():
+    """
+    Zwraca statystyki rozsyłania statusu przez WebSocket w bieżącym procesie roboczym.
+
+    Przy skonfigurowanym WS_BACKPLANE zawiera też stan klastra (czy proces jest
+    liderem, liczba procesów i łączna liczba klientów).
+
+    Returns:
+        dict: Liczba klientów, długość kolejek, utracone wiadomości, rozłączenia
+        wolnych klientów, czas ostatniego rozesłania, pominięte takty i stan klastra.
+    """
+    stats = manager.stats()
+    if backplane.cluster_status is not None:
+        stats["cluster"] = backplane.cluster_status.stats()
+    return stats
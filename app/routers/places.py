@@ -1,12 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime
+from typing import Annotated
 from .. import schemas
+from ..cache import response_cache
+from ..conditional import has_conditions, is_not_modified, not_modified
+from ..config import settings
 from ..database import get_db
-from ..crud.place import create_place, get_places, get_place, delete_place, update_place
+from ..exporter import ExportFormat, iter_places_csv, iter_places_ndjson
+from ..importer import PlaceImporter, aiter_ndjson_lines, iter_json_array
+from ..pagination import InvalidCursorError
+from ..serialization import InvalidFieldsError, dumps, parse_place_fields
+from ..crud.facet import get_facets
+from ..crud.place import (
+    create_place, get_nearby_places, get_place_document, get_place_validator, get_places_document,
+    get_places_validator, get_top_places, get_trending_places, delete_place, search_places, update_place,
+)
 
 router = APIRouter(prefix="/places", tags=["places"])
 
+FIELDS_DESCRIPTION = "Pola odpowiedzi rozdzielone przecinkami lub zestaw pól: summary, full"
+
+# Typy treści rozpoznawane jako strumień NDJSON (jeden obiekt JSON w każdej linii)
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines"}
+
 @router.post("/", response_model=schemas.Place)
 def create_place_endpoint(place: schemas.PlaceCreate, db: Session = Depends(get_db)):
     """
@@ -22,39 +41,361 @@ def create_place_endpoint(place: schemas.PlaceCreate, db: Session = Depends(get_
     return create_place(db, place)
 
 
-@router.get("/", response_model=List[schemas.Place])
-def read_places_endpoint(db: Session = Depends(get_db)):
+@router.post(
+    "/bulk",
+    response_model=schemas.BulkImportResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/PlaceCreate"}}},
+                "application/x-ndjson": {"schema": {"type": "string", "description": "Jeden obiekt PlaceCreate w każdej linii"}},
+            },
+        }
+    },
+)
+async def bulk_import_places_endpoint(request: Request, db: Session = Depends(get_db)):
+    """
+        Importuje wiele miejsc naraz z tablicy JSON lub strumienia NDJSON.
+
+        Treść NDJSON (Content-Type: application/x-ndjson) przetwarzana jest na bieżąco,
+        bez wczytywania całości do pamięci. Poprawne wiersze zapisywane są partiami
+        (PLACES_IMPORT_BATCH_SIZE) w osobnych transakcjach, a błędne są pomijane
+        i opisywane w wyniku.
+
+        Args:
+            request (Request): Żądanie HTTP z danymi miejsc.
+            db (Session): Sesja bazy danych.
+
+        Raises:
+            HTTPException: 400 jeśli treść nie jest tablicą JSON, 415 dla nieobsługiwanego typu treści.
+
+        Returns:
+            schemas.BulkImportResult: Liczba zapisanych i odrzuconych wierszy oraz błędy.
+        """
+    media_type = request.headers.get("content-type", "application/json").split(";")[0].strip().lower()
+    importer = PlaceImporter(db)
+
+    if media_type in NDJSON_MEDIA_TYPES:
+        index = 0
+        async for line in aiter_ndjson_lines(request.stream()):
+            if importer.add(index, line):
+                await run_in_threadpool(importer.flush)
+            index += 1
+    elif media_type == "application/json":
+        try:
+            rows = iter_json_array(await request.body())
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Expected a JSON array of places")
+        for index, row in enumerate(rows):
+            if importer.add(index, row):
+                await run_in_threadpool(importer.flush)
+    else:
+        raise HTTPException(status_code=415, detail="Unsupported content type")
+
+    return await run_in_threadpool(importer.finish)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}},
+)
+def export_places_endpoint(
+    format: ExportFormat = ExportFormat.ndjson,
+    include_reviews: bool = False,
+    after_id: int | None = Query(None, description="Wznów eksport po miejscu o tym id"),
+    updated_since: datetime | None = Query(None, description="Tylko miejsca zmienione od tej chwili"),
+    db: Session = Depends(get_db),
+):
+    """
+        Strumieniowo eksportuje miejsca (opcjonalnie z recenzjami) w formacie NDJSON lub CSV.
+
+        Dane odczytywane są kursorem po stronie serwera i wysyłane partiami,
+        więc zużycie pamięci nie zależy od rozmiaru tabeli. Eksport jest
+        uporządkowany po id – przerwany eksport można wznowić parametrem after_id.
+
+        Args:
+            format (ExportFormat): Format eksportu (ndjson lub csv).
+            include_reviews (bool): Czy dołączyć recenzje miejsc.
+            after_id (int | None): Identyfikator ostatniego wyeksportowanego miejsca.
+            updated_since (datetime | None): Znacznik czasu ostatniej zmiany (eksport przyrostowy).
+            db (Session): Sesja bazy danych.
+
+        Returns:
+            StreamingResponse: Strumień z danymi eksportu.
+        """
+    options = dict(
+        include_reviews=include_reviews,
+        after_id=after_id,
+        updated_since=updated_since,
+        batch_size=settings.places_export_batch_size,
+    )
+    if format == ExportFormat.csv:
+        content, media_type = iter_places_csv(db, **options), "text/csv"
+    else:
+        content, media_type = iter_places_ndjson(db, **options), "application/x-ndjson"
+
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="places.{format.value}"'},
+    )
+
+
+@router.get("/search", response_model=list[schemas.PlaceSummary])
+def search_places_endpoint(
+    filters: Annotated[schemas.PlaceFilters, Depends()],
+    q: str = Query(..., min_length=1, max_length=200, description="Szukany tekst"),
+    limit: int = Query(settings.places_default_page_size, ge=1, le=settings.places_max_page_size),
+    db: Session = Depends(get_db),
+):
+    """
+        Wyszukuje miejsca pełnotekstowo po nazwie, mieście i opisie.
+
+        Wyniki są posortowane według trafności (nazwa ma największą wagę), a ostatni
+        wyraz zapytania dopasowywany jest jako prefiks, co pozwala podpowiadać
+        wyniki podczas wpisywania.
+
+        Args:
+            filters (schemas.PlaceFilters): Dodatkowe filtry listy miejsc.
+            q (str): Szukany tekst.
+            limit (int): Maksymalna liczba wyników.
+            db (Session): Sesja bazy danych.
+
+        Returns:
+            list[schemas.PlaceSummary]: Znalezione miejsca.
+        """
+    return search_places(db, q, filters, limit=limit)
+
+
+@router.get("/nearby", response_model=list[schemas.PlaceNearby])
+def read_nearby_places_endpoint(
+    filters: Annotated[schemas.PlaceFilters, Depends()],
+    lat: float = Query(..., ge=-90, le=90, description="Szerokość geograficzna"),
+    lon: float = Query(..., ge=-180, le=180, description="Długość geograficzna"),
+    radius: float = Query(1000, gt=0, le=settings.places_nearby_max_radius_m, description="Promień w metrach"),
+    limit: int = Query(settings.places_default_page_size, ge=1, le=settings.places_max_page_size),
+    db: Session = Depends(get_db),
+):
+    """
+        Pobiera miejsca w pobliżu wskazanego punktu, posortowane od najbliższego.
+
+        Args:
+            filters (schemas.PlaceFilters): Dodatkowe filtry listy miejsc.
+            lat (float): Szerokość geograficzna punktu.
+            lon (float): Długość geograficzna punktu.
+            radius (float): Promień wyszukiwania w metrach.
+            limit (int): Maksymalna liczba miejsc.
+            db (Session): Sesja bazy danych.
+
+        Returns:
+            list[schemas.PlaceNearby]: Miejsca wraz z odległością od punktu.
+        """
+    return [
+        schemas.PlaceNearby(**schemas.PlaceSummary.model_validate(place).model_dump(), distance_m=distance)
+        for place, distance in get_nearby_places(db, lat, lon, radius, filters, limit=limit)
+    ]
+
+
+@router.get("/facets", response_model=schemas.PlaceFacets)
+def read_place_facets_endpoint(
+    filters: Annotated[schemas.PlaceFilters, Depends()],
+    limit: int = Query(settings.places_default_page_size, ge=1, le=settings.places_max_page_size),
+    db: Session = Depends(get_db),
+):
+    """
+        Zwraca liczbę miejsc dla każdej wartości kraju, miasta i bezpłatnego wstępu.
+
+        Liczniki odczytywane są z tabeli aktualizowanej przy każdej zmianie miejsca,
+        bez grupowania tabeli miejsc, i uwzględniają aktywne filtry listy.
+
+        Args:
+            filters (schemas.PlaceFilters): Aktywne filtry listy miejsc.
+            limit (int): Maksymalna liczba wartości każdego facetu.
+            db (Session): Sesja bazy danych.
+
+        Returns:
+            schemas.PlaceFacets: Łączna liczba miejsc i liczniki wartości facetów.
+        """
+    return get_facets(db, filters, limit=limit)
+
+
+@router.get("/top", response_model=list[schemas.PlaceRanked])
+def read_top_places_endpoint(
+    city: str | None = Query(None, description="Ranking w mieście"),
+    country: str | None = Query(None, description="Ranking w kraju"),
+    limit: int = Query(settings.places_default_page_size, ge=1, le=settings.places_max_page_size),
+    db: Session = Depends(get_db),
+):
+    """
+        Pobiera najlepiej oceniane miejsca – ogółem, w mieście lub w kraju.
+
+        Ranking używa średniej Bayesa, więc miejsca z kilkoma recenzjami nie wyprzedzają
+        miejsc z wieloma wysokimi ocenami. Wyniki są zapisane w indeksowanej kolumnie
+        i aktualizowane przy dodawaniu recenzji – zapytanie nie przegląda recenzji.
+
+        Args:
+            city (str | None): Ranking w mieście.
+            country (str | None): Ranking w kraju.
+            limit (int): Maksymalna liczba miejsc.
+            db (Session): Sesja bazy danych.
+
+        Returns:
+            list[schemas.PlaceRanked]: Miejsca od najwyższego wyniku.
+        """
+    key = response_cache.list_key({"ranking": "top", "city": city, "country": country, "limit": limit})
+    cached = response_cache.lookup(key)
+    if cached is not None:
+        return cached
+    return response_cache.store(key, dumps(get_top_places(db, city, country, limit=limit)))
+
+
+@router.get("/trending", response_model=list[schemas.PlaceRanked])
+def read_trending_places_endpoint(
+    city: str | None = Query(None, description="Ranking w mieście"),
+    country: str | None = Query(None, description="Ranking w kraju"),
+    limit: int = Query(settings.places_default_page_size, ge=1, le=settings.places_max_page_size),
+    db: Session = Depends(get_db),
+):
     """
-        Pobiera listę wszystkich dostępnych miejsc.
+        Pobiera miejsca zyskujące popularność – ogółem, w mieście lub w kraju.
+
+        Wynik to suma ocen recenzji ważonych ich wiekiem (waga maleje o połowę co
+        TRENDING_HALF_LIFE_HOURS). Wyniki są zapisane w indeksowanej kolumnie
+        i aktualizowane przy dodawaniu recenzji – zapytanie nie przegląda recenzji.
+
+        Args:
+            city (str | None): Ranking w mieście.
+            country (str | None): Ranking w kraju.
+            limit (int): Maksymalna liczba miejsc.
+            db (Session): Sesja bazy danych.
+
+        Returns:
+            list[schemas.PlaceRanked]: Miejsca od najwyższego wyniku.
+        """
+    key = response_cache.list_key({"ranking": "trending", "city": city, "country": country, "limit": limit})
+    cached = response_cache.lookup(key)
+    if cached is not None:
+        return cached
+    return response_cache.store(key, dumps(get_trending_places(db, city, country, limit=limit)))
+
+
+@router.get("/", response_model=schemas.Page[schemas.PlaceSummary])
+def read_places_endpoint(
+    filters: Annotated[schemas.PlaceFilters, Depends()],
+    request: Request,
+    sort: schemas.PlaceSort = schemas.PlaceSort.id,
+    limit: int = Query(settings.places_default_page_size, ge=1, le=settings.places_max_page_size),
+    cursor: str | None = None,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_db),
+):
+    """
+        Pobiera stronę listy miejsc z opcjonalnymi filtrami.
+
+        Lista zwraca lekki widok miejsc bez recenzji – recenzje nie są ładowane wcale.
+        Odpowiedź budowana jest bezpośrednio z wierszy zapytania i kodowana orjson.
+        Przy włączonej pamięci podręcznej (CACHE_BACKEND) strona zwracana jest z niej,
+        dopóki żadne miejsce ani recenzja nie zostaną zmienione. Odpowiedź ma ETag strony;
+        żądanie z aktualnym If-None-Match dostaje 304 na podstawie wąskiego zapytania.
+        Parametr fields (np. fields=summary lub fields=name,city) ogranicza odpowiedź
+        i pobierane kolumny do wybranych pól.
 
         Args:
+            filters (schemas.PlaceFilters): Filtry po mieście, kraju, początku nazwy i bezpłatnym wstępie.
+            request (Request): Żądanie HTTP (nagłówki warunkowe).
+            sort (schemas.PlaceSort): Sposób sortowania.
+            limit (int): Liczba miejsc na stronie.
+            cursor (str | None): Kursor kolejnej strony zwrócony w poprzedniej odpowiedzi.
+            fields (str | None): Wybrane pola lub zestawy pól (summary, full) rozdzielone przecinkami.
             db (Session): Sesja bazy danych.
 
+        Raises:
+            HTTPException: 400 jeśli kursor lub parametr fields jest niepoprawny.
+
         Returns:
-            List[schemas.Place]: Lista obiektów miejsc.
+            schemas.Page[schemas.PlaceSummary]: Strona miejsc wraz z kursorem kolejnej strony.
         """
-    return get_places(db)
+    try:
+        field_set = parse_place_fields(fields)
+        if has_conditions(request):
+            validator = get_places_validator(db, filters, sort=sort, limit=limit, cursor=cursor)
+            if is_not_modified(request, validator):
+                return not_modified(validator)
+
+        key = response_cache.list_key(
+            {
+                "filters": filters.model_dump(), "sort": sort, "limit": limit, "cursor": cursor,
+                "fields": field_set.key if field_set is not None else None,
+            }
+        )
+        cached = response_cache.lookup(key)
+        if cached is not None:
+            return cached
+
+        page, validator = get_places_document(
+            db, filters, sort=sort, limit=limit, cursor=cursor, fields=field_set
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    except InvalidFieldsError as error:
+        raise HTTPException(status_code=400, detail=f"Unknown field: {error}")
+    return response_cache.store(key, dumps(page), validator.headers())
 
 
 @router.get("/{place_id}", response_model=schemas.Place)
-def read_place_endpoint(place_id: int, db: Session = Depends(get_db)):
+def read_place_endpoint(
+    place_id: int,
+    request: Request,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_db),
+):
     """
         Pobiera szczegółowe informacje o konkretnym miejscu na podstawie ID.
 
+        Miejsce i jego recenzje pobierane są dwoma zapytaniami o wybrane kolumny, a odpowiedź
+        budowana bezpośrednio z wierszy i kodowana orjson (bez walidacji Pydantic obiektów ORM).
+        Przy włączonej pamięci podręcznej (CACHE_BACKEND) odpowiedź zwracana jest z niej
+        do czasu zmiany miejsca lub dodania recenzji. Odpowiedź ma nagłówki ETag i Last-Modified;
+        żądanie warunkowe z aktualną wersją dostaje 304 bez ładowania miejsca i recenzji.
+        Parametr fields ogranicza odpowiedź do wybranych pól – bez pola reviews
+        recenzje nie są pobierane.
+
         Args:
             place_id (int): ID miejsca.
+            request (Request): Żądanie HTTP (nagłówki warunkowe).
+            fields (str | None): Wybrane pola lub zestawy pól (summary, full) rozdzielone przecinkami.
             db (Session): Sesja bazy danych.
 
         Raises:
-            HTTPException: 404 jeśli miejsce nie istnieje.
+            HTTPException: 400 jeśli parametr fields jest niepoprawny, 404 jeśli miejsce nie istnieje.
 
         Returns:
             schemas.Place: Obiekt znalezionego miejsca.
         """
-    place = get_place(db, place_id)
-    if place is None:
+    try:
+        field_set = parse_place_fields(fields, detail=True)
+    except InvalidFieldsError as error:
+        raise HTTPException(status_code=400, detail=f"Unknown field: {error}")
+
+    if has_conditions(request):
+        validator = get_place_validator(db, place_id)
+        if validator is None:
+            raise HTTPException(status_code=404, detail="Place not found")
+        if is_not_modified(request, validator):
+            return not_modified(validator)
+
+    key = response_cache.place_key(place_id, field_set.key if field_set is not None else None)
+    cached = response_cache.lookup(key)
+    if cached is not None:
+        return cached
+
+    found = get_place_document(db, place_id, field_set)
+    if found is None:
         raise HTTPException(status_code=404, detail="Place not found")
-    return place
+    place, validator = found
+    return response_cache.store(key, dumps(place), validator.headers())
 
 
 @router.put("/{place_id}", response_model=schemas.Place)
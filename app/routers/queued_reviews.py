@@ -0,0 +1,61 @@
+"""
+Endpointy recenzji w trybie REVIEWS_WRITE_BEHIND – recenzje zapisywane są w tle partiami.
+"""
+from fastapi import APIRouter, HTTPException, Response
+from .. import schemas
+from ..ingest import QueueFullError, review_ingestor
+
+router = APIRouter(tags=["reviews"])
+
+
+@router.post("/places/{place_id}/reviews", status_code=202, response_model=schemas.ReviewIngestStatus)
+async def add_new_review(place_id: int, review: schemas.ReviewCreate, response: Response):
+    """
+        Przyjmuje recenzję do zapisu w tle (odpowiedź 202).
+
+        Istnienie miejsca sprawdzane jest przy zapisie partii – recenzja miejsca,
+        które nie istnieje, otrzymuje stan rejected.
+
+        Args:
+            place_id (int): Unikalny identyfikator miejsca.
+            review (schemas.ReviewCreate): Dane nowej recenzji.
+            response (Response): Odpowiedź, do której dodawany jest nagłówek Location.
+
+        Raises:
+            HTTPException: 503 z nagłówkiem Retry-After, jeśli kolejka zapisu jest pełna.
+
+        Returns:
+            schemas.ReviewIngestStatus: Identyfikator śledzenia i stan queued.
+        """
+    try:
+        status = review_ingestor.submit(place_id, review)
+    except QueueFullError:
+        raise HTTPException(
+            status_code=503,
+            detail="Review queue is full, retry later",
+            headers={"Retry-After": "1"},
+        )
+    response.headers["Location"] = f"/reviews/ingest/{status.tracking_id}"
+    return status
+
+
+@router.get("/reviews/ingest/{tracking_id}", response_model=schemas.ReviewIngestStatus)
+def read_review_ingest_status(tracking_id: str):
+    """
+        Zwraca stan recenzji przyjętej do zapisu w tle.
+
+        Stany przechowywane są w procesie roboczym, który przyjął recenzję.
+
+        Args:
+            tracking_id (str): Identyfikator zwrócony przy przyjęciu recenzji.
+
+        Raises:
+            HTTPException: 404 jeśli identyfikator jest nieznany.
+
+        Returns:
+            schemas.ReviewIngestStatus: Stan recenzji (queued, stored, rejected lub failed).
+        """
+    status = review_ingestor.status(tracking_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Unknown tracking id")
+    return status
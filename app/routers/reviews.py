@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from typing import Annotated
+from ..config import settings
 from ..database import get_db
 from .. import schemas
-from ..crud.review import create_review as create_review_crud
+from ..crud.review import create_review as create_review_crud, get_reviews
+from ..pagination import InvalidCursorError
 
 router = APIRouter(prefix="/places", tags=["reviews"])
 
@@ -27,4 +30,42 @@ def add_new_review(place_id: int, review: schemas.ReviewCreate, db: Session = De
     if db_review is None:
         raise HTTPException(status_code=404, detail="Place not found")
 
-    return db_review
\ No newline at end of file
+    return db_review
+
+
+@router.get("/{place_id}/reviews", response_model=schemas.Page[schemas.Review])
+def read_reviews(
+    place_id: int,
+    filters: Annotated[schemas.ReviewFilters, Depends()],
+    sort: schemas.ReviewSort = schemas.ReviewSort.created_at_desc,
+    limit: int = Query(settings.places_default_page_size, ge=1, le=settings.places_max_page_size),
+    cursor: str | None = None,
+    db: Session = Depends(get_db),
+):
+    """
+        Pobiera stronę recenzji określonego miejsca.
+
+        Args:
+            place_id (int): Unikalny identyfikator miejsca.
+            filters (schemas.ReviewFilters): Filtry po ocenie recenzji.
+            sort (schemas.ReviewSort): Kierunek sortowania po dacie dodania.
+            limit (int): Liczba recenzji na stronie.
+            cursor (str | None): Kursor kolejnej strony zwrócony w poprzedniej odpowiedzi.
+            db (Session): Sesja bazy danych.
+
+        Raises:
+            HTTPException: 400 jeśli kursor jest niepoprawny, 404 jeśli miejsce nie istnieje.
+
+        Returns:
+            schemas.Page[schemas.Review]: Strona recenzji wraz z kursorem kolejnej strony.
+        """
+    try:
+        page = get_reviews(db, place_id, filters, sort=sort, limit=limit, cursor=cursor)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if page is None:
+        raise HTTPException(status_code=404, detail="Place not found")
+
+    reviews, next_cursor = page
+    return {"items": reviews, "next_cursor": next_cursor}
@@ -1,4 +1,7 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import json
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from ..feed import MAX_TOPICS, feed_manager, parse_topic
 from ..websocket_manager import manager
 
 router = APIRouter(tags=["websocket", "status"])
@@ -22,4 +25,80 @@ async def websocket_server_status(websocket: WebSocket):
     except WebSocketDisconnect:
         pass
     finally:
-        manager.disconnect(websocket)
\ No newline at end of file
+        manager.disconnect(websocket)
+
+
+@router.websocket("/feed")
+async def websocket_feed(websocket: WebSocket, topic: list[str] = Query(default=[])):
+    """
+    WebSocket endpoint przesyłający zmiany miejsc i recenzji z subskrybowanych tematów.
+
+    Tematy można podać w adresie (?topic=places&topic=city:Kraków) lub zmieniać
+    w trakcie połączenia wiadomościami {"action": "subscribe" | "unsubscribe", "topic": "..."}.
+    Każda zmiana jest potwierdzana wiadomością {"type": "subscribed", "topics": [...]},
+    a błędne żądanie wiadomością {"type": "error", "detail": "..."}.
+
+    Args:
+        websocket (WebSocket): Obiekt WebSocket reprezentujący połączenie z klientem.
+        topic (list[str]): Początkowe tematy subskrypcji.
+    """
+
+    await feed_manager.connect(websocket)
+
+    try:
+        for name in topic:
+            _change_subscription(websocket, "subscribe", name)
+        _acknowledge(websocket)
+
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except ValueError:
+                message = None
+            if not isinstance(message, dict) or message.get("action") not in ("subscribe", "unsubscribe"):
+                feed_manager.send(websocket, {"type": "error", "detail": "Oczekiwano pól action i topic"})
+                continue
+            if _change_subscription(websocket, message["action"], message.get("topic")):
+                _acknowledge(websocket)
+
+    except WebSocketDisconnect:
+        pass
+    finally:
+        feed_manager.disconnect(websocket)
+
+
+def _change_subscription(websocket: WebSocket, action: str, topic) -> bool:
+    """
+    Subskrybuje lub anuluje subskrypcję tematu; o błędach informuje klienta.
+
+    Args:
+        websocket (WebSocket): Połączenie WebSocket.
+        action (str): subscribe lub unsubscribe.
+        topic: Nazwa tematu przesłana przez klienta.
+
+    Returns:
+        bool: True, jeśli subskrypcje zostały zmienione.
+    """
+    client = feed_manager.active_connections.get(websocket)
+    if client is None:
+        return False
+    try:
+        name = parse_topic(topic if isinstance(topic, str) else "")
+    except ValueError as e:
+        feed_manager.send(websocket, {"type": "error", "detail": str(e)})
+        return False
+
+    if action == "unsubscribe":
+        feed_manager.unsubscribe(websocket, name)
+    elif len(client.topics) >= MAX_TOPICS and name not in client.topics:
+        feed_manager.send(websocket, {"type": "error", "detail": f"Przekroczono limit {MAX_TOPICS} tematów"})
+        return False
+    else:
+        feed_manager.subscribe(websocket, name)
+    return True
+
+
+def _acknowledge(websocket: WebSocket):
+    client = feed_manager.active_connections.get(websocket)
+    if client is not None:
+        feed_manager.send(websocket, {"type": "subscribed", "topics": sorted(client.topics)})
@@ -1,6 +1,9 @@
-from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import Generic, Optional, TypeVar
 from datetime import datetime
+from enum import Enum
+
+T = TypeVar("T")
 
 class ReviewBase(BaseModel):
 
@@ -37,6 +40,31 @@ class ReviewCreate(ReviewBase):
 
     pass
 
+class ReviewIngestStatus(BaseModel):
+
+    """
+    Stan recenzji przyjętej do kolejki zapisu (tryb REVIEWS_WRITE_BEHIND).
+
+    Atrybuty:
+        tracking_id (str):
+            Identyfikator nadany recenzji przy przyjęciu.
+
+        status (str):
+            queued (oczekuje na zapis), stored (zapisana), rejected (miejsce
+            nie istnieje) lub failed (błąd zapisu partii).
+
+        place_id (int):
+            Identyfikator miejsca, którego dotyczy recenzja.
+
+        review_id (Optional[int]):
+            Identyfikator zapisanej recenzji (tylko dla stored).
+    """
+
+    tracking_id: str
+    status: str
+    place_id: int
+    review_id: Optional[int] = None
+
 class Review(ReviewBase):
 
     """
@@ -63,6 +91,35 @@ class Review(ReviewBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+class ReviewSort(str, Enum):
+    """
+    Dostępne sposoby sortowania recenzji miejsca.
+
+    Prefiks "-" oznacza sortowanie malejące (najnowsze recenzje najpierw).
+    """
+
+    created_at = "created_at"
+    created_at_desc = "-created_at"
+
+class ReviewFilters(BaseModel):
+    """
+    Filtry listy recenzji przekazywane w parametrach zapytania.
+
+    Atrybuty:
+        rating (Optional[int]):
+            Dokładna ocena recenzji.
+
+        min_rating (Optional[int]):
+            Minimalna ocena recenzji.
+
+        max_rating (Optional[int]):
+            Maksymalna ocena recenzji.
+    """
+
+    rating: Optional[int] = Field(None, ge=1, le=5)
+    min_rating: Optional[int] = Field(None, ge=1, le=5)
+    max_rating: Optional[int] = Field(None, ge=1, le=5)
+
 class PlaceBase(BaseModel):
     """
     Bazowy schemat miejsca zawierający podstawowe informacje
@@ -84,6 +141,12 @@ class PlaceBase(BaseModel):
         country (Optional[str]):
             Kraj, w którym znajduje się miejsce.
 
+        latitude (Optional[float]):
+            Szerokość geograficzna w stopniach (-90…90).
+
+        longitude (Optional[float]):
+            Długość geograficzna w stopniach (-180…180).
+
         visit_duration (Optional[str]):
             Szacowany czas wizyty (np. „1–2 godziny”).
 
@@ -96,9 +159,18 @@ class PlaceBase(BaseModel):
     street_address: Optional[str] = None
     city: Optional[str] = None
     country: Optional[str] = None
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
     visit_duration: Optional[str] = None
     is_free: Optional[bool] = None
 
+    @model_validator(mode="after")
+    def _check_coordinates(self):
+        """Współrzędne muszą być podane razem albo wcale."""
+        if (self.latitude is None) != (self.longitude is None):
+            raise ValueError("latitude i longitude muszą być podane razem")
+        return self
+
 class PlaceCreate(PlaceBase):
 
     """
@@ -109,32 +181,218 @@ class PlaceCreate(PlaceBase):
 
     pass
 
-class Place(PlaceBase):
+class PlaceSummary(PlaceBase):
 
     """
-     Schemat reprezentujący miejsce odczytywane z bazy danych.
+    Lekki schemat miejsca używany na listach – bez recenzji.
 
-     Atrybuty:
-         id (int):
-             Unikalny identyfikator miejsca.
+    Atrybuty:
+        id (int):
+            Unikalny identyfikator miejsca.
 
-         created_at (datetime):
-             Data i godzina utworzenia miejsca.
+        created_at (datetime):
+            Data i godzina utworzenia miejsca.
 
-         updated_at (datetime):
-             Data i godzina ostatniej aktualizacji miejsca.
+        updated_at (datetime):
+            Data i godzina ostatniej aktualizacji miejsca.
 
-         reviews (List[Review]):
-             Lista recenzji przypisanych do miejsca.
+        review_count (int):
+            Liczba recenzji miejsca.
+
+        rating_sum (int):
+            Suma ocen ze wszystkich recenzji.
+
+        rating_avg (float):
+            Średnia ocena (0, jeśli miejsce nie ma recenzji).
+
+        rating_histogram (dict[int, int]):
+            Liczba recenzji dla każdej oceny od 1 do 5.
 
     Konfiguracja:
         model_config (ConfigDict):
             Umożliwia tworzenie modelu z obiektów ORM.
-     """
+    """
 
     id: int
     created_at: datetime
     updated_at: datetime
+    review_count: int = 0
+    rating_sum: int = 0
+    rating_avg: float = 0.0
+    rating_histogram: dict[int, int] = Field(default_factory=lambda: {stars: 0 for stars in range(1, 6)})
+
+    model_config = ConfigDict(from_attributes=True)
+
+class Place(PlaceSummary):
+
+    """
+     Schemat reprezentujący miejsce odczytywane z bazy danych wraz z recenzjami.
+
+     Atrybuty:
+         reviews (List[Review]):
+             Lista recenzji przypisanych do miejsca.
+     """
+
     reviews: list[Review] = []
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+
+class PlaceNearby(PlaceSummary):
+
+    """
+    Miejsce zwracane przez wyszukiwanie w pobliżu.
+
+    Atrybuty:
+        distance_m (float):
+            Odległość od wskazanego punktu w metrach.
+    """
+
+    distance_m: float
+
+
+class PlaceRanked(PlaceSummary):
+
+    """
+    Miejsce zwracane przez rankingi (najlepiej oceniane i popularne).
+
+    Atrybuty:
+        score (float):
+            Wynik rankingu – średnia Bayesa ocen lub bieżący wynik popularności.
+    """
+
+    score: float
+
+
+class PlaceSort(str, Enum):
+    """
+    Dostępne sposoby sortowania listy miejsc.
+
+    Prefiks "-" oznacza sortowanie malejące. Każde sortowanie kończy się
+    kolumną id, dzięki czemu klucz stronicowania jest jednoznaczny.
+    """
+
+    id = "id"
+    id_desc = "-id"
+    created_at = "created_at"
+    created_at_desc = "-created_at"
+    rating = "rating"
+    rating_desc = "-rating"
+
+
+class PlaceFilters(BaseModel):
+    """
+    Filtry listy miejsc przekazywane w parametrach zapytania.
+
+    Atrybuty:
+        city (Optional[str]):
+            Dokładna nazwa miasta.
+
+        country (Optional[str]):
+            Dokładna nazwa kraju.
+
+        name (Optional[str]):
+            Początek nazwy miejsca.
+
+        is_free (Optional[bool]):
+            Czy wstęp do miejsca jest bezpłatny.
+
+        min_rating (Optional[float]):
+            Minimalna średnia ocena miejsca.
+    """
+
+    city: Optional[str] = None
+    country: Optional[str] = None
+    name: Optional[str] = None
+    is_free: Optional[bool] = None
+    min_rating: Optional[float] = Field(None, ge=0, le=5)
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    Strona wyników stronicowanych kursorem.
+
+    Atrybuty:
+        items (list[T]):
+            Elementy bieżącej strony.
+
+        next_cursor (Optional[str]):
+            Kursor kolejnej strony lub None, jeśli to ostatnia strona.
+    """
+
+    items: list[T]
+    next_cursor: Optional[str] = None
+
+
+class FacetCount(BaseModel, Generic[T]):
+    """
+    Liczba miejsc z daną wartością facetu.
+
+    Atrybuty:
+        value (T):
+            Wartość facetu (None – miejsca bez tej informacji).
+
+        count (int):
+            Liczba miejsc z tą wartością.
+    """
+
+    value: T
+    count: int
+
+
+class PlaceFacets(BaseModel):
+    """
+    Liczniki facetów listy miejsc dla panelu filtrów.
+
+    Atrybuty:
+        total (int):
+            Liczba miejsc spełniających filtry.
+
+        country (list[FacetCount[Optional[str]]]):
+            Liczba miejsc w każdym kraju.
+
+        city (list[FacetCount[Optional[str]]]):
+            Liczba miejsc w każdym mieście.
+
+        is_free (list[FacetCount[Optional[bool]]]):
+            Liczba miejsc bezpłatnych i płatnych.
+    """
+
+    total: int
+    country: list[FacetCount[Optional[str]]]
+    city: list[FacetCount[Optional[str]]]
+    is_free: list[FacetCount[Optional[bool]]]
+
+
+class BulkImportError(BaseModel):
+    """
+    Błąd pojedynczego wiersza importu zbiorczego.
+
+    Atrybuty:
+        index (int):
+            Numer wiersza (od 0) w przesłanej tablicy lub pliku NDJSON.
+
+        errors (list[str]):
+            Opisy błędów walidacji lub zapisu.
+    """
+
+    index: int
+    errors: list[str]
+
+
+class BulkImportResult(BaseModel):
+    """
+    Wynik importu zbiorczego miejsc.
+
+    Atrybuty:
+        inserted (int):
+            Liczba zapisanych miejsc.
+
+        failed (int):
+            Liczba odrzuconych wierszy.
+
+        errors (list[BulkImportError]):
+            Błędy odrzuconych wierszy (ograniczone do pierwszych N).
+    """
+
+    inserted: int = 0
+    failed: int = 0
+    errors: list[BulkImportError] = []
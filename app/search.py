@@ -0,0 +1,172 @@
+"""
+Wyszukiwanie pełnotekstowe miejsc po nazwie, mieście i opisie.
+
+Indeks zależy od bazy danych:
+
+- PostgreSQL: generowana kolumna ``places.search_vector`` typu tsvector
+  z indeksem GIN; wyniki oceniane funkcją ts_rank_cd,
+- SQLite: tabela FTS5 ``places_fts`` (external content) synchronizowana
+  wyzwalaczami; wyniki oceniane funkcją bm25.
+
+Oba indeksy nie są częścią modeli ORM – tworzone są zdarzeniami DDL przy
+``create_all`` oraz migracją 0004. Nazwa ma większą wagę niż miasto, a miasto
+większą niż opis. Ostatni wyraz zapytania dopasowywany jest jako prefiks, więc
+wyszukiwanie działa także przy wpisywaniu (type-ahead).
+"""
+import re
+
+from sqlalchemy import DDL, and_, case, event, func, literal_column, or_, table, column
+from sqlalchemy.sql import Select
+
+from app.models import Place
+
+# Konfiguracja tekstowa PostgreSQL – bez stemmingu, bo dane są wielojęzyczne
+TS_CONFIG = "simple"
+
+# Maksymalna liczba wyrazów zapytania (ogranicza koszt pojedynczego wyszukiwania)
+MAX_TERMS = 8
+
+_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+_POSTGRESQL_DDL = [
+    f"""
+    ALTER TABLE places ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{TS_CONFIG}', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('{TS_CONFIG}', coalesce(city, '')), 'B') ||
+        setweight(to_tsvector('{TS_CONFIG}', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX ix_places_search_vector ON places USING GIN (search_vector)",
+]
+
+_SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS places_fts USING fts5(
+        name, city, description,
+        content='places', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS places_fts_ai AFTER INSERT ON places BEGIN
+        INSERT INTO places_fts(rowid, name, city, description)
+        VALUES (new.id, new.name, new.city, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS places_fts_ad AFTER DELETE ON places BEGIN
+        INSERT INTO places_fts(places_fts, rowid, name, city, description)
+        VALUES ('delete', old.id, old.name, old.city, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS places_fts_au AFTER UPDATE OF name, city, description ON places BEGIN
+        INSERT INTO places_fts(places_fts, rowid, name, city, description)
+        VALUES ('delete', old.id, old.name, old.city, old.description);
+        INSERT INTO places_fts(rowid, name, city, description)
+        VALUES (new.id, new.name, new.city, new.description);
+    END
+    """,
+]
+
+for _statement in _POSTGRESQL_DDL:
+    event.listen(Place.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in _SQLITE_DDL:
+    event.listen(Place.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(Place.__table__, "before_drop", DDL("DROP TABLE IF EXISTS places_fts").execute_if(dialect="sqlite"))
+
+# Tabela FTS5 – kolumna o nazwie tabeli służy jako lewa strona operatora MATCH
+_fts = table("places_fts", column("rowid"), column("places_fts"))
+
+
+def is_search_object(name: str | None) -> bool:
+    """
+    Sprawdza, czy obiekt bazy danych należy do indeksu wyszukiwania.
+
+    Obiekty te nie są zdefiniowane w modelach, więc autogenerowanie migracji
+    Alembic musi je pomijać.
+
+    Args:
+        name (str | None): Nazwa tabeli, kolumny lub indeksu.
+
+    Returns:
+        bool: True dla kolumny search_vector, jej indeksu i tabel FTS5.
+    """
+    if name is None:
+        return False
+    return name in ("search_vector", "ix_places_search_vector") or name.startswith("places_fts")
+
+
+def search_terms(text: str) -> list[str]:
+    """
+    Dzieli zapytanie użytkownika na wyrazy.
+
+    Zostają tylko znaki słowne, więc wynik można bezpiecznie wstawić do składni
+    tsquery i FTS5 bez ryzyka błędu składni zapytania.
+
+    Args:
+        text (str): Tekst wpisany przez użytkownika.
+
+    Returns:
+        list[str]: Co najwyżej MAX_TERMS wyrazów zapisanych małymi literami.
+    """
+    return [term.lower() for term in _TERM_PATTERN.findall(text)][:MAX_TERMS]
+
+
+def _tsquery(terms: list[str]) -> str:
+    """Buduje tsquery PostgreSQL: wszystkie wyrazy muszą wystąpić, ostatni jako prefiks."""
+    return " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+
+
+def _fts5_query(terms: list[str]) -> str:
+    """Buduje zapytanie FTS5: wszystkie wyrazy muszą wystąpić, ostatni jako prefiks."""
+    return " AND ".join([f'"{term}"' for term in terms[:-1]] + [f'"{terms[-1]}"*'])
+
+
+def apply_search(query: Select, dialect: str, terms: list[str]) -> Select:
+    """
+    Dodaje do zapytania o miejsca warunek wyszukiwania i sortowanie po trafności.
+
+    Args:
+        query (Select): Zapytanie zwracające miejsca.
+        dialect (str): Nazwa dialektu bazy danych (postgresql lub sqlite).
+        terms (list[str]): Niepusta lista wyrazów z search_terms().
+
+    Na bazach bez obsługiwanego indeksu pełnotekstowego używane jest
+    dopasowanie ILIKE (bez indeksu, więc tylko dla niewielkich tabel).
+
+    Returns:
+        Select: Zapytanie posortowane od najlepiej dopasowanych miejsc.
+    """
+    if dialect == "postgresql":
+        vector = literal_column("places.search_vector")
+        tsquery = func.to_tsquery(TS_CONFIG, _tsquery(terms))
+        return query.where(vector.op("@@")(tsquery)).order_by(
+            func.ts_rank_cd(vector, tsquery).desc(), Place.id
+        )
+    if dialect == "sqlite":
+        # bm25 zwraca wartości ujemne – im mniejsza, tym lepsze dopasowanie
+        return (
+            query.join(_fts, _fts.c.rowid == Place.id)
+            .where(_fts.c.places_fts.op("MATCH")(_fts5_query(terms)))
+            .order_by(func.bm25(literal_column("places_fts"), 10.0, 5.0, 1.0), Place.id)
+        )
+    return _apply_ilike_search(query, terms)
+
+
+def _apply_ilike_search(query: Select, terms: list[str]) -> Select:
+    """
+    Wyszukiwanie zastępcze: każdy wyraz musi wystąpić w nazwie, mieście lub opisie.
+
+    Najpierw zwracane są miejsca, których nazwa zaczyna się od pierwszego wyrazu.
+    """
+    def pattern(term: str, prefix: bool = False) -> str:
+        escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"{escaped}%" if prefix else f"%{escaped}%"
+
+    conditions = [
+        or_(*(field.ilike(pattern(term), escape="\\") for field in (Place.name, Place.city, Place.description)))
+        for term in terms
+    ]
+    name_first = case((Place.name.ilike(pattern(terms[0], prefix=True), escape="\\"), 0), else_=1)
+    return query.where(and_(*conditions)).order_by(name_first, Place.id)
@@ -0,0 +1,234 @@
+"""
+Szybka ścieżka serializacji odpowiedzi odczytu miejsc.
+
+Zamiast ładować obiekty ORM, walidować je schematami Pydantic
+(from_attributes=True) i kodować wynik przez jsonable_encoder, endpointy
+odczytu pobierają tylko potrzebne kolumny jako RowMapping, składają słowniki
+o kształcie schematów odpowiedzi i kodują je jednym wywołaniem orjson.
+
+Schematy z app.schemas pozostają źródłem prawdy dla dokumentacji OpenAPI
+(response_model w dekoratorach), a listy kolumn wyliczane są z ich pól,
+więc nowe pole schematu automatycznie trafia do szybkiej ścieżki.
+
+Parametr fields= (PlaceFieldSet) zawęża odpowiedź do wybranych pól: model
+odpowiedzi budowany jest dynamicznie z pól schematu, a z jego pól wyliczana
+jest lista kolumn zapytania – np. lista na mapie nie pobiera kolumny
+description ani recenzji.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Iterable, Mapping
+import json
+
+from pydantic import BaseModel, create_model
+
+from app import schemas
+from app.models import Place, Review
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson jest opcjonalny
+    orjson = None
+
+# Kolumny histogramu ocen, składane w pole rating_histogram
+HISTOGRAM_COLUMNS = [getattr(Place, f"rating_{stars}") for stars in range(1, 6)]
+
+# Kolumny miejsca odpowiadające polom schematu PlaceSummary
+SUMMARY_COLUMNS = [
+    getattr(Place, name) for name in schemas.PlaceSummary.model_fields if name != "rating_histogram"
+]
+
+# Kolumny recenzji odpowiadające polom schematu Review
+REVIEW_COLUMNS = [getattr(Review, name) for name in schemas.Review.model_fields]
+
+_SUMMARY_FIELDS = [column.key for column in SUMMARY_COLUMNS]
+_REVIEW_FIELDS = [column.key for column in REVIEW_COLUMNS]
+
+
+def summary_document(row: Mapping[str, Any]) -> dict:
+    """
+    Buduje słownik o kształcie schemas.PlaceSummary z wiersza zapytania.
+
+    Args:
+        row (Mapping[str, Any]): Wiersz zawierający SUMMARY_COLUMNS i HISTOGRAM_COLUMNS.
+
+    Returns:
+        dict: Dane miejsca gotowe do serializacji.
+    """
+    document = {field: row[field] for field in _SUMMARY_FIELDS}
+    document["rating_histogram"] = {stars: row[f"rating_{stars}"] or 0 for stars in range(1, 6)}
+    return document
+
+
+def review_document(row: Mapping[str, Any]) -> dict:
+    """
+    Buduje słownik o kształcie schemas.Review z wiersza zapytania.
+
+    Args:
+        row (Mapping[str, Any]): Wiersz zawierający REVIEW_COLUMNS.
+
+    Returns:
+        dict: Dane recenzji gotowe do serializacji.
+    """
+    return {field: row[field] for field in _REVIEW_FIELDS}
+
+
+# Nazwane zestawy pól parametru fields=; full odpowiada odpowiedzi bez parametru
+PLACE_FIELD_PRESETS = {
+    "summary": (
+        "id", "name", "city", "country", "latitude", "longitude", "is_free", "review_count", "rating_avg",
+    ),
+}
+
+
+class InvalidFieldsError(ValueError):
+    """Parametr fields= zawiera nieznane pole lub zestaw pól."""
+
+
+@dataclass(frozen=True)
+class PlaceFieldSet:
+    """
+    Wybrany podzbiór pól miejsca.
+
+    Attributes:
+        fields: Nazwy pól w kolejności pól schematu.
+        model: Dynamicznie zbudowany model odpowiedzi z tymi polami.
+        columns: Kolumny tabeli places potrzebne do zbudowania odpowiedzi.
+    """
+
+    fields: tuple[str, ...]
+    model: type[BaseModel]
+    columns: tuple
+
+    @property
+    def reviews(self) -> bool:
+        """Czy odpowiedź zawiera recenzje (wymaga osobnego zapytania)."""
+        return "reviews" in self.fields
+
+    @property
+    def key(self) -> str:
+        """Identyfikator zestawu pól używany w kluczach pamięci podręcznej."""
+        return ",".join(self.fields)
+
+    def document(self, row: Mapping[str, Any]) -> dict:
+        """
+        Buduje słownik o kształcie modelu zestawu pól z wiersza zapytania.
+
+        Args:
+            row (Mapping[str, Any]): Wiersz zawierający kolumny zestawu pól.
+
+        Returns:
+            dict: Dane miejsca gotowe do serializacji (bez recenzji).
+        """
+        document = {}
+        for field in self.fields:
+            if field == "rating_histogram":
+                document[field] = {stars: row[f"rating_{stars}"] or 0 for stars in range(1, 6)}
+            elif field != "reviews":
+                document[field] = row[field]
+        return document
+
+
+@lru_cache(maxsize=256)
+def _place_field_set(fields: frozenset[str], detail: bool) -> PlaceFieldSet:
+    schema = schemas.Place if detail else schemas.PlaceSummary
+    ordered = tuple(name for name in schema.model_fields if name in fields)
+    model = create_model(
+        f"{schema.__name__}Fields",
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in ordered},
+    )
+    columns = []
+    for name in model.model_fields:
+        if name == "rating_histogram":
+            columns.extend(HISTOGRAM_COLUMNS)
+        elif name != "reviews":
+            columns.append(getattr(Place, name))
+    return PlaceFieldSet(fields=ordered, model=model, columns=tuple(columns))
+
+
+def parse_place_fields(value: str | None, detail: bool = False) -> PlaceFieldSet | None:
+    """
+    Zamienia parametr fields= na zestaw pól miejsca.
+
+    Parametr to nazwy pól lub zestawów (summary, full) rozdzielone przecinkami.
+    Pole id jest zawsze dołączane. Zestawy pól i ich modele są zapamiętywane,
+    więc model nie jest budowany przy każdym żądaniu.
+
+    Args:
+        value (str | None): Wartość parametru fields.
+        detail (bool): Czy chodzi o szczegóły miejsca (dozwolone pole reviews).
+
+    Raises:
+        InvalidFieldsError: Jeśli parametr zawiera nieznane pole lub zestaw.
+
+    Returns:
+        PlaceFieldSet | None: Zestaw pól lub None, gdy odpowiedź ma zawierać wszystkie pola.
+    """
+    if not value:
+        return None
+    schema = schemas.Place if detail else schemas.PlaceSummary
+    fields = {"id"}
+    for name in (part.strip() for part in value.split(",")):
+        if name == "full":
+            return None
+        if name in PLACE_FIELD_PRESETS:
+            fields.update(PLACE_FIELD_PRESETS[name])
+        elif name in schema.model_fields:
+            fields.add(name)
+        elif name:
+            raise InvalidFieldsError(name)
+    if len(fields) == len(schema.model_fields):
+        return None
+    return _place_field_set(frozenset(fields), detail)
+
+
+def unique_columns(*columns) -> list:
+    """
+    Usuwa powtórzone kolumny, zachowując kolejność.
+
+    Args:
+        *columns: Kolumny zapytania.
+
+    Returns:
+        list: Kolumny bez powtórzeń.
+    """
+    return list({column.key: column for column in columns}.values())
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Nieobsługiwany typ: {type(value).__name__}")
+
+
+def dumps(document: Any) -> bytes:
+    """
+    Koduje dokument jako zwarty JSON (orjson, a bez niego moduł json).
+
+    Daty bez strefy czasowej kodowane są tak jak w Pydantic (ISO 8601 bez
+    przesunięcia), a klucze całkowite (histogram ocen) zamieniane na tekst.
+
+    Args:
+        document (Any): Słowniki, listy i wartości proste.
+
+    Returns:
+        bytes: Treść odpowiedzi JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(document, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(document, default=_json_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def page_document(items: Iterable[dict], next_cursor: str | None) -> dict:
+    """
+    Buduje słownik o kształcie schemas.Page.
+
+    Args:
+        items (Iterable[dict]): Elementy strony.
+        next_cursor (str | None): Kursor kolejnej strony.
+
+    Returns:
+        dict: Strona gotowa do serializacji.
+    """
+    return {"items": list(items), "next_cursor": next_cursor}
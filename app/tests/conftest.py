@@ -1,10 +1,10 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.main import app
-from app.database import get_db
+from app.database import get_db, set_engine
 from app.models import Base
 
 
@@ -18,6 +18,8 @@ TestingSessionLocal = sessionmaker(bind=engine)
 @pytest.fixture(scope="session", autouse=True)
 def setup_database():
     """Tworzy tabele w bazie testowej przed testami i usuwa po zakończeniu."""
+    # Aplikacja (lifespan, metryki pul) korzysta z silnika bazy testowej zamiast DATABASE_URL
+    set_engine(engine)
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
@@ -44,3 +46,17 @@ def client(db_session):
     app.dependency_overrides[get_db] = override_get_db
     yield TestClient(app)
     app.dependency_overrides.clear()
+
+@pytest.fixture()
+def query_counter():
+    """Licznik zapytań SQL wykonanych na testowej bazie danych."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,23 @@
+"""
+Obiekty zastępcze współdzielone przez testy.
+"""
+import asyncio
+
+
+class FakeWebSocket:
+    """Połączenie WebSocket zapisujące wysłane wiadomości; opcjonalnie wolne."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent: list[str] = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload: str):
+        await asyncio.sleep(self.delay)
+        self.sent.append(payload)
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        self.closed_with = code
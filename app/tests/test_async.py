@@ -0,0 +1,110 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.database import get_async_db, to_async_url
+from app.main import _without_overridden
+from app.models import Base
+from app.routers import async_places, async_reviews, places
+
+
+@pytest.fixture()
+def async_client(tmp_path):
+    """Klient aplikacji z asynchronicznymi endpointami działającymi na pliku SQLite (aiosqlite)."""
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(bind=sync_engine)
+    sync_engine.dispose()
+
+    # NullPool: każde połączenie aiosqlite powstaje w pętli zdarzeń klienta testowego
+    async_engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+    session_factory = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_places.router)
+    app.include_router(async_reviews.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_to_async_url():
+    """
+    Test zamiany adresu bazy danych na adres ze sterownikiem asynchronicznym.
+    """
+
+    assert to_async_url("postgresql+psycopg2://u:p@localhost:5433/db") == "postgresql+asyncpg://u:p@localhost:5433/db"
+    assert to_async_url("postgresql://u:p@localhost/db") == "postgresql+asyncpg://u:p@localhost/db"
+    assert to_async_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+
+
+def test_async_place_and_review_flow(async_client):
+    """
+    Test tworzenia, odczytu, aktualizacji i usuwania miejsca oraz recenzji w trybie asynchronicznym.
+    """
+
+    created = async_client.post("/places/", json={"name": "Async Place", "description": "Desc"})
+    assert created.status_code == 200
+    assert created.json()["reviews"] == []
+    place_id = created.json()["id"]
+
+    review = async_client.post(
+        f"/places/{place_id}/reviews",
+        json={"title": "Async", "content": "Text", "rating": 4}
+    )
+    assert review.status_code == 200
+
+    listing = async_client.get("/places/").json()
+    assert [p["id"] for p in listing["items"]] == [place_id]
+    assert listing["items"][0]["review_count"] == 1
+
+    detail = async_client.get(f"/places/{place_id}").json()
+    assert len(detail["reviews"]) == 1
+    narrowed = async_client.get(f"/places/{place_id}", params={"fields": "name,review_count"}).json()
+    assert narrowed == {"id": place_id, "name": "Async Place", "review_count": 1}
+
+    updated = async_client.put(f"/places/{place_id}", json={"name": "Renamed", "description": "Desc"})
+    assert updated.status_code == 200
+    assert updated.json()["name"] == "Renamed"
+    assert len(updated.json()["reviews"]) == 1
+
+    reviews = async_client.get(f"/places/{place_id}/reviews").json()
+    assert [r["rating"] for r in reviews["items"]] == [4]
+
+    assert async_client.delete(f"/places/{place_id}").status_code == 204
+    assert async_client.get(f"/places/{place_id}").status_code == 404
+
+
+def test_async_review_for_missing_place(async_client):
+    """
+    Test tworzenia recenzji dla nieistniejącego miejsca w trybie asynchronicznym.
+    """
+
+    response = async_client.post(
+        "/places/99999/reviews",
+        json={"title": "Nowhere", "content": "Text", "rating": 3}
+    )
+
+    assert response.status_code == 404
+
+
+def test_async_routes_override_sync_routes():
+    """
+    Test usuwania z routera synchronicznego tras, które mają asynchroniczne odpowiedniki.
+    """
+
+    filtered = _without_overridden(places.router, [async_places.router, async_reviews.router])
+
+    sync_routes = {(route.path, method) for route in places.router.routes for method in route.methods}
+    async_routes = {(route.path, method) for route in async_places.router.routes for method in route.methods}
+    remaining = {(route.path, method) for route in filtered.routes for method in route.methods}
+
+    assert remaining == sync_routes - async_routes
@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+from app.backplane import ClusterStatus, MemoryBackplane
+from app.tests.fakes import FakeWebSocket
+from app.websocket_manager import ConnectionManager
+
+
+async def _worker(backplane, worker_id, clients):
+    """Symuluje proces roboczy: własny ConnectionManager z klientami i status klastra."""
+    manager = ConnectionManager(interval=None)
+    sockets = [FakeWebSocket() for _ in range(clients)]
+    for websocket in sockets:
+        await manager.connect(websocket)
+    status = ClusterStatus(manager, backplane, worker_id=worker_id, interval=0.02, lease_ttl=0.1)
+    await status.start()
+    return status, sockets
+
+
+def test_single_leader_publishes_cluster_wide_client_count():
+    """
+    Test backplane'u – status publikuje jeden proces, a klienci wszystkich procesów widzą łączną liczbę klientów.
+    """
+
+    async def scenario():
+        backplane = MemoryBackplane()
+        first, first_sockets = await _worker(backplane, "worker-1", clients=2)
+        second, second_sockets = await _worker(backplane, "worker-2", clients=3)
+        await asyncio.sleep(0.15)
+
+        assert [first.is_leader, second.is_leader].count(True) == 1
+        for websocket in first_sockets + second_sockets:
+            assert websocket.sent
+            assert json.loads(websocket.sent[-1])["connected_clients"] == 5
+        assert first.stats()["workers"] == 2
+
+        for status, sockets in ((first, first_sockets), (second, second_sockets)):
+            await status.stop()
+            for websocket in sockets:
+                status.manager.disconnect(websocket)
+
+    asyncio.run(scenario())
+
+
+def test_leader_failover():
+    """
+    Test backplane'u – po zatrzymaniu lidera publikowanie statusu przejmuje inny proces.
+    """
+
+    async def scenario():
+        backplane = MemoryBackplane()
+        first, _ = await _worker(backplane, "worker-1", clients=1)
+        await asyncio.sleep(0.05)
+        second, second_sockets = await _worker(backplane, "worker-2", clients=1)
+        await asyncio.sleep(0.05)
+        assert first.is_leader and not second.is_leader
+
+        await first.stop()
+        received = len(second_sockets[0].sent)
+        await asyncio.sleep(0.1)
+
+        assert second.is_leader
+        assert len(second_sockets[0].sent) > received
+        await second.stop()
+        second.manager.disconnect(second_sockets[0])
+
+    asyncio.run(scenario())
+
+
+class FlakyBackplane(MemoryBackplane):
+    """Backplane, którego pierwsza subskrypcja zrywa się jak połączenie z Redis."""
+
+    def __init__(self):
+        super().__init__()
+        self.subscriptions = 0
+
+    async def subscribe(self, channel):
+        self.subscriptions += 1
+        if self.subscriptions == 1:
+            raise ConnectionError("Connection reset by peer")
+        async for message in super().subscribe(channel):
+            yield message
+
+
+def test_subscription_recovers_after_error():
+    """
+    Test backplane'u – po błędzie subskrypcji proces subskrybuje kanał ponownie i dalej otrzymuje status.
+    """
+
+    async def scenario():
+        backplane = FlakyBackplane()
+        status, sockets = await _worker(backplane, "worker-1", clients=1)
+        await asyncio.sleep(0.3)
+
+        assert backplane.subscriptions == 2
+        assert sockets[0].sent
+        await status.stop()
+        status.manager.disconnect(sockets[0])
+
+    asyncio.run(scenario())
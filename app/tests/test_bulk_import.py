@@ -0,0 +1,108 @@
+import json
+
+from app.importer import PlaceImporter
+
+
+def test_bulk_import_json_array(client):
+    """
+    Test importu zbiorczego z tablicy JSON z jednym błędnym wierszem.
+    """
+
+    payload = [
+        {"name": "Bulk 1", "description": "Desc", "city": "Kraków"},
+        {"description": "Missing name"},
+        {"name": "Bulk 2", "description": "Desc"},
+    ]
+
+    response = client.post("/places/bulk", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["inserted"] == 2
+    assert data["failed"] == 1
+
+    # Sprawdzam, czy błąd wskazuje numer wiersza i brakujące pole
+    assert data["errors"][0]["index"] == 1
+    assert "name" in data["errors"][0]["errors"][0]
+
+    names = [p["name"] for p in client.get("/places/").json()["items"]]
+    assert names == ["Bulk 1", "Bulk 2"]
+
+
+def test_bulk_import_ndjson_stream(client):
+    """
+    Test importu zbiorczego ze strumienia NDJSON z niepoprawną linią JSON.
+    """
+
+    lines = [
+        json.dumps({"name": f"Stream {i}", "description": "Desc"}) for i in range(5)
+    ]
+    lines.insert(2, "{not json")
+    body = "\n".join(lines) + "\n\n"
+
+    def chunks():
+        # Fragmenty nie pokrywają się z granicami linii
+        encoded = body.encode()
+        for start in range(0, len(encoded), 7):
+            yield encoded[start:start + 7]
+
+    response = client.post(
+        "/places/bulk",
+        content=chunks(),
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["inserted"] == 5
+    assert data["failed"] == 1
+    assert data["errors"][0]["index"] == 2
+
+    assert len(client.get("/places/").json()["items"]) == 5
+
+
+def test_bulk_import_rejects_non_array(client):
+    """
+    Test importu zbiorczego z dokumentem JSON, który nie jest tablicą.
+    """
+
+    response = client.post("/places/bulk", json={"name": "Not a list"})
+
+    assert response.status_code == 400
+
+
+def test_bulk_import_unsupported_content_type(client):
+    """
+    Test importu zbiorczego z nieobsługiwanym typem treści.
+    """
+
+    response = client.post("/places/bulk", content="name,description", headers={"Content-Type": "text/csv"})
+
+    assert response.status_code == 415
+
+
+def test_place_importer_batches(db_session):
+    """
+    Test zapisu partiami i ograniczenia liczby zwracanych błędów.
+    """
+
+    importer = PlaceImporter(db_session, batch_size=2, max_errors=1)
+    full_batches = 0
+    rows = [
+        {"name": "A", "description": "D"},
+        {"name": "B", "description": "D"},
+        {"name": "C", "description": "D"},
+        {"description": "Bad 1"},
+        {"description": "Bad 2"},
+    ]
+    for index, row in enumerate(rows):
+        if importer.add(index, row):
+            full_batches += 1
+            importer.flush()
+
+    result = importer.finish()
+
+    assert full_batches == 1
+    assert result.inserted == 3
+    assert result.failed == 2
+    assert len(result.errors) == 1
@@ -0,0 +1,157 @@
+import time
+
+import pytest
+
+from app.cache import MemoryCache, RedisCache, response_cache
+
+
+class FakeRedis:
+    """Minimalny klient zgodny z redis-py przechowujący dane w słowniku."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    def scan_iter(self, match):
+        return [key for key in list(self.data) if key.startswith(match.rstrip("*"))]
+
+
+class BrokenRedis:
+    """Klient Redis, którego każda operacja kończy się błędem połączenia."""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("Redis is unavailable")
+        return fail
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cached_client(request, client):
+    """Klient z włączoną pamięcią podręczną odpowiedzi (oba backendy)."""
+    backend = MemoryCache() if request.param == "memory" else RedisCache(FakeRedis())
+    response_cache.backend = backend
+    response_cache.hits = response_cache.misses = response_cache.invalidations = response_cache.errors = 0
+    try:
+        yield client
+    finally:
+        response_cache.backend = None
+
+
+def test_place_detail_cached_and_invalidated(cached_client):
+    """
+    Test pamięci podręcznej szczegółów miejsca – trafienie i unieważnienie przy zmianach.
+    """
+
+    client = cached_client
+    place_id = client.post("/places/", json={"name": "Cache", "description": "Desc"}).json()["id"]
+
+    first = client.get(f"/places/{place_id}")
+    second = client.get(f"/places/{place_id}")
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert first.json() == second.json()
+
+    client.post(f"/places/{place_id}/reviews", json={"title": "T", "content": "C", "rating": 4})
+    after_review = client.get(f"/places/{place_id}")
+    assert after_review.headers["x-cache"] == "MISS"
+    assert after_review.json()["review_count"] == 1
+
+    client.put(f"/places/{place_id}", json={"name": "Nowa", "description": "Desc"})
+    assert client.get(f"/places/{place_id}").json()["name"] == "Nowa"
+
+    client.delete(f"/places/{place_id}")
+    assert client.get(f"/places/{place_id}").status_code == 404
+
+    stats = client.get("/metrics/cache").json()
+    assert stats["hits"] == 1
+    assert stats["invalidations"] == 4
+
+
+def test_place_list_cached_and_invalidated(cached_client):
+    """
+    Test pamięci podręcznej listy miejsc – osobne wpisy dla parametrów i unieważnienie po dodaniu miejsca.
+    """
+
+    client = cached_client
+    client.post("/places/", json={"name": "A", "description": "Desc", "city": "Kraków"})
+
+    assert client.get("/places/").headers["x-cache"] == "MISS"
+    assert client.get("/places/").headers["x-cache"] == "HIT"
+    assert client.get("/places/", params={"city": "Kraków"}).headers["x-cache"] == "MISS"
+
+    client.post("/places/", json={"name": "B", "description": "Desc"})
+    response = client.get("/places/")
+    assert response.headers["x-cache"] == "MISS"
+    assert len(response.json()["items"]) == 2
+
+
+def test_memory_cache_lru_and_ttl():
+    """
+    Test backendu w pamięci – usuwanie najdawniej używanych wpisów i wygasanie.
+    """
+
+    cache = MemoryCache(max_entries=2, ttl=60)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert cache.get("a") == b"1"
+    assert cache.get("b") is None
+
+    expiring = MemoryCache(ttl=0.01)
+    expiring.set("a", b"1")
+    time.sleep(0.02)
+    assert expiring.get("a") is None
+
+
+def test_cache_outage_degrades_to_database(client):
+    """
+    Test awarii backendu – odczyty i zapisy działają bez pamięci podręcznej, a błędy są liczone.
+    """
+
+    response_cache.backend = RedisCache(BrokenRedis())
+    response_cache.errors = 0
+    try:
+        created = client.post("/places/", json={"name": "Outage", "description": "Desc"})
+        assert created.status_code == 200
+        place_id = created.json()["id"]
+
+        detail = client.get(f"/places/{place_id}")
+        assert detail.status_code == 200
+        assert "x-cache" not in detail.headers
+        assert client.get("/places/").status_code == 200
+        assert client.put(f"/places/{place_id}", json={"name": "Outage 2", "description": "Desc"}).status_code == 200
+        assert response_cache.stats()["errors"] >= 4
+    finally:
+        response_cache.backend = None
+
+
+def test_stale_store_after_invalidation_is_never_served(cached_client):
+    """
+    Test wyścigu odczytu z zapisem – odpowiedź zbudowana przed zmianą nie trafia do kolejnych odczytów.
+    """
+
+    client = cached_client
+    place_id = client.post("/places/", json={"name": "Race", "description": "Desc"}).json()["id"]
+
+    # Czytelnik wylicza klucz i czyta stare dane, w tym czasie zapis unieważnia miejsce
+    stale_key = response_cache.place_key(place_id)
+    response_cache.invalidate_place(place_id)
+    response_cache.store(stale_key, b'{"name": "stale"}')
+
+    response = client.get(f"/places/{place_id}")
+    assert response.headers["x-cache"] == "MISS"
+    assert response.json()["name"] == "Race"
@@ -0,0 +1,81 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from app.models import Place
+
+
+def _create_place(client):
+    return client.post("/places/", json={"name": "ETag", "description": "Desc"}).json()["id"]
+
+
+def test_place_etag_not_modified(client, query_counter):
+    """
+    Test odpowiedzi 304 dla aktualnego ETagu – tylko jedno wąskie zapytanie do bazy.
+    """
+
+    place_id = _create_place(client)
+    first = client.get(f"/places/{place_id}")
+    etag = first.headers["etag"]
+
+    assert etag.startswith('"')
+    assert "last-modified" in first.headers
+
+    query_counter.clear()
+    response = client.get(f"/places/{place_id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    assert len(query_counter) == 1
+    assert "reviews" in query_counter[0] and "max" in query_counter[0].lower()
+
+
+def test_place_etag_changes_with_reviews_and_updates(client):
+    """
+    Test zmiany ETagu po dodaniu recenzji i edycji miejsca.
+    """
+
+    place_id = _create_place(client)
+    etag = client.get(f"/places/{place_id}").headers["etag"]
+
+    client.post(f"/places/{place_id}/reviews", json={"title": "T", "content": "C", "rating": 5})
+    after_review = client.get(f"/places/{place_id}", headers={"If-None-Match": etag})
+    assert after_review.status_code == 200
+    assert after_review.headers["etag"] != etag
+
+    etag = after_review.headers["etag"]
+    client.put(f"/places/{place_id}", json={"name": "Zmiana", "description": "Desc"})
+    assert client.get(f"/places/{place_id}", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_place_if_modified_since(client, db_session):
+    """
+    Test If-Modified-Since – 304 dla daty nie wcześniejszej niż ostatnia zmiana.
+    """
+
+    place_id = _create_place(client)
+    updated_at = db_session.get(Place, place_id).updated_at.replace(tzinfo=timezone.utc)
+
+    later = format_datetime(updated_at + timedelta(seconds=5), usegmt=True)
+    earlier = format_datetime(updated_at - timedelta(days=1), usegmt=True)
+
+    assert client.get(f"/places/{place_id}", headers={"If-Modified-Since": later}).status_code == 304
+    assert client.get(f"/places/{place_id}", headers={"If-Modified-Since": earlier}).status_code == 200
+    assert client.get(f"/places/{place_id}", headers={"If-Modified-Since": "nonsense"}).status_code == 200
+    assert client.get("/places/999999", headers={"If-None-Match": '"x"'}).status_code == 404
+
+
+def test_places_list_collection_etag(client):
+    """
+    Test ETagu listy miejsc – 304 dla niezmienionej strony, nowy ETag po zmianie.
+    """
+
+    place_id = _create_place(client)
+    _create_place(client)
+    etag = client.get("/places/").headers["etag"]
+
+    assert client.get("/places/", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/places/", params={"limit": 1}, headers={"If-None-Match": etag}).status_code == 200
+
+    client.post(f"/places/{place_id}/reviews", json={"title": "T", "content": "C", "rating": 3})
+    assert client.get("/places/", headers={"If-None-Match": etag}).status_code == 200
@@ -0,0 +1,129 @@
+from dataclasses import replace
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.config import Settings
+from app.database import database_url, engine_options
+from app.metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, pool_status
+
+
+def _settings(**overrides) -> Settings:
+    """Ustawienia testowe z możliwością nadpisania wybranych pól."""
+    values = dict(
+        db_pool_size=3,
+        db_max_overflow=2,
+        db_pool_timeout=1.5,
+        db_pool_recycle=600,
+        db_pool_pre_ping=True,
+        db_statement_timeout_ms=0,
+    )
+    values.update(overrides)
+    return replace(Settings.from_env(), **values)
+
+
+def test_engine_options_postgresql():
+    """
+    Test parametrów puli i limitu czasu zapytań dla PostgreSQL (psycopg2).
+    """
+
+    options = engine_options("postgresql+psycopg2://u:p@localhost/db", _settings(db_statement_timeout_ms=5000))
+
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 3
+    assert options["max_overflow"] == 2
+    assert options["pool_timeout"] == 1.5
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+
+def test_engine_options_asyncpg():
+    """
+    Test parametrów silnika asynchronicznego (asyncpg).
+    """
+
+    options = engine_options("postgresql+asyncpg://u:p@localhost/db", _settings(db_statement_timeout_ms=250))
+
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+    assert options["connect_args"] == {"server_settings": {"statement_timeout": "250"}}
+
+
+def test_engine_options_sqlite():
+    """
+    Test pominięcia parametrów puli dla SQLite.
+    """
+
+    assert engine_options("sqlite:///./app.db", _settings()) == {}
+
+
+def test_instrumented_pool_metrics(tmp_path):
+    """
+    Test statystyk puli: wypożyczone połączenia, nadmiar i przekroczenie czasu oczekiwania.
+    """
+
+    test_engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+
+    first = test_engine.connect()
+    second = test_engine.connect()
+    first.execute(text("SELECT 1"))
+
+    status = pool_status(test_engine.pool)
+    assert status["checkedout"] == 2
+    assert status["overflow"] == 1
+    assert status["acquisitions"] == 2
+
+    # Pula jest wyczerpana – kolejne pobranie kończy się przekroczeniem czasu
+    with pytest.raises(PoolTimeoutError):
+        test_engine.connect()
+    assert pool_status(test_engine.pool)["timeouts"] == 1
+
+    first.close()
+    second.close()
+    assert pool_status(test_engine.pool)["checkedout"] == 0
+    test_engine.dispose()
+
+
+def test_db_pool_metrics_endpoint(client):
+    """
+    Test endpointu udostępniającego stan puli połączeń.
+    """
+
+    response = client.get("/metrics/db-pool")
+
+    assert response.status_code == 200
+    assert "primary" in response.json()
+    assert "pool_class" in response.json()["primary"]
+
+
+def test_import_does_not_require_database():
+    """
+    Test leniwego uruchamiania – import aplikacji nie wymaga DATABASE_URL ani nie tworzy silnika.
+    """
+    env = {key: value for key, value in os.environ.items() if key != "DATABASE_URL"}
+    result = subprocess.run(
+        [sys.executable, "-c", "import app.main, app.database as d; assert d.engines() == {}"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_get_engine_without_database_url():
+    """
+    Test leniwego uruchamiania – brak DATABASE_URL zgłaszany jest przy pierwszym użyciu bazy.
+    """
+    with pytest.raises(ValueError, match="DATABASE_URL"):
+        database_url(replace(Settings.from_env(), database_url=None))
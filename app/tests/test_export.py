@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+
+
+def _seed(client):
+    """Tworzy dwa miejsca, z których pierwsze ma dwie recenzje."""
+    first = client.post("/places/", json={"name": "Export 1", "description": "Desc", "city": "Kraków"}).json()["id"]
+    second = client.post("/places/", json={"name": "Export 2", "description": "Desc"}).json()["id"]
+    for rating in (4, 5):
+        client.post(f"/places/{first}/reviews", json={"title": "T", "content": "C", "rating": rating})
+    return first, second
+
+
+def test_export_places_ndjson(client):
+    """
+    Test eksportu miejsc do NDJSON.
+    """
+
+    first, second = _seed(client)
+
+    response = client.get("/places/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [first, second]
+    assert rows[0]["city"] == "Kraków"
+    assert "reviews" not in rows[0]
+
+
+def test_export_places_ndjson_with_reviews(client):
+    """
+    Test eksportu miejsc razem z recenzjami do NDJSON.
+    """
+
+    first, second = _seed(client)
+
+    response = client.get("/places/export", params={"include_reviews": True})
+    rows = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [r["rating"] for r in rows[0]["reviews"]] == [4, 5]
+    assert rows[1]["reviews"] == []
+
+
+def test_export_places_csv_with_reviews(client):
+    """
+    Test eksportu miejsc z recenzjami do CSV (jeden wiersz na recenzję).
+    """
+
+    first, second = _seed(client)
+
+    response = client.get("/places/export", params={"format": "csv", "include_reviews": True})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["id"]) for row in rows] == [first, first, second]
+    assert [row["review_rating"] for row in rows] == ["4", "5", ""]
+
+
+def test_export_places_resume_after_id(client):
+    """
+    Test wznowienia eksportu od wskazanego identyfikatora.
+    """
+
+    first, second = _seed(client)
+
+    response = client.get("/places/export", params={"after_id": first})
+    rows = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [row["id"] for row in rows] == [second]
+
+
+def test_export_places_empty_csv_has_header(client):
+    """
+    Test eksportu CSV pustej tabeli – zwracany jest sam nagłówek.
+    """
+
+    response = client.get("/places/export", params={"format": "csv"})
+
+    assert response.text.splitlines()[0].startswith("id,name,")
+    assert len(response.text.splitlines()) == 1
@@ -0,0 +1,57 @@
+from app.crud.facet import get_facets, recompute_facet_counts
+from app.models import PlaceFacetCount
+from app.schemas import PlaceFilters
+
+
+def _create(client, name, city=None, country=None, is_free=None):
+    payload = {"name": name, "description": "", "city": city, "country": country, "is_free": is_free}
+    return client.post("/places/", json=payload).json()["id"]
+
+
+def _counts(facet):
+    return {entry["value"]: entry["count"] for entry in facet}
+
+
+def test_facets_follow_place_changes_and_filters(client, query_counter):
+    """
+    Test facetów – liczniki zmieniają się przy tworzeniu, edycji, usuwaniu i imporcie miejsc oraz uwzględniają filtry.
+    """
+
+    wawel = _create(client, "Wawel", "Kraków", "Polska", False)
+    _create(client, "Rynek", "Kraków", "Polska", True)
+    louvre = _create(client, "Luwr", "Paryż", "Francja", False)
+    client.post("/places/bulk", json=[{"name": "Bez miasta", "description": ""}])
+    client.put(f"/places/{louvre}", json={"name": "Luwr", "description": "", "city": "Paryż", "country": "Francja"})
+    client.delete(f"/places/{wawel}")
+    query_counter.clear()
+
+    facets = client.get("/places/facets").json()
+    polish = client.get("/places/facets", params={"country": "Polska"}).json()
+
+    assert len(query_counter) == 2 and all("FROM place_facet_counts" in sql for sql in query_counter)
+    assert facets["total"] == 3
+    assert facets["country"] == [
+        {"value": "Francja", "count": 1}, {"value": "Polska", "count": 1}, {"value": None, "count": 1},
+    ]
+    assert _counts(facets["is_free"]) == {True: 1, None: 2}
+    assert (polish["total"], _counts(polish["city"])) == (1, {"Kraków": 1})
+
+
+def test_facets_with_non_facet_filters_and_recompute(client, db_session):
+    """
+    Test facetów – filtr po nazwie liczony z tabeli miejsc, a przeliczenie odtwarza liczniki.
+    """
+
+    _create(client, "Wawel", "Kraków", "Polska", False)
+    _create(client, "Wieliczka", "Wieliczka", "Polska", False)
+    _create(client, "Rynek", "Kraków", "Polska", True)
+    db_session.query(PlaceFacetCount).delete()
+    db_session.commit()
+
+    by_name = client.get("/places/facets", params={"name": "W"}).json()
+    assert _counts(by_name["city"]) == {"Kraków": 1, "Wieliczka": 1}
+    assert get_facets(db_session).total == 0
+
+    assert recompute_facet_counts(db_session) == 3
+    facets = get_facets(db_session, PlaceFilters(is_free=False))
+    assert (facets.total, [entry.value for entry in facets.city]) == (2, ["Kraków", "Wieliczka"])
@@ -0,0 +1,89 @@
+import asyncio
+
+from app.feed import parse_topic
+from app.tests.fakes import FakeWebSocket
+from app.websocket_manager import ConnectionManager
+
+
+def _ok(response):
+    """Sprawdza status odpowiedzi przed czekaniem na zdarzenie – błąd zapisu kończy test zamiast go zawiesić."""
+    assert response.status_code in (200, 204), response.text
+    return response
+
+
+def _place(city):
+    return {"name": f"Miejsce w {city}", "description": "Opis", "city": city, "country": "Polska"}
+
+
+def test_feed_delivers_changes_only_to_subscribed_topics(client):
+    """
+    Test strumienia zmian – klient subskrybujący miasto otrzymuje tylko zmiany miejsc w tym mieście.
+    """
+
+    with client, client.websocket_connect("/feed?topic=city:kraków") as websocket:
+        assert websocket.receive_json() == {"type": "subscribed", "topics": ["city:kraków"]}
+
+        place_id = _ok(client.post("/places/", json=_place("Kraków"))).json()["id"]
+        event = websocket.receive_json()
+        assert event["type"] == "place.created"
+        assert event["place"]["id"] == place_id
+
+        # Zmiana w innym mieście nie trafia do klienta – następne zdarzenie to recenzja
+        _ok(client.post("/places/", json=_place("Gdańsk")))
+        _ok(client.post(f"/places/{place_id}/reviews", json={"title": "Super", "content": "Polecam", "rating": 4}))
+        event = websocket.receive_json()
+        assert event["type"] == "review.created"
+        assert event["place"] == {"id": place_id, "city": "Kraków", "review_count": 1, "rating_avg": 4.0}
+
+        _ok(client.delete(f"/places/{place_id}"))
+        assert websocket.receive_json()["type"] == "place.deleted"
+
+
+def test_feed_subscription_messages(client):
+    """
+    Test strumienia zmian – zmiana subskrypcji wiadomościami i obsługa błędnych tematów.
+    """
+
+    with client, client.websocket_connect("/feed") as websocket:
+        assert websocket.receive_json() == {"type": "subscribed", "topics": []}
+
+        websocket.send_json({"action": "subscribe", "topic": "city:Mars:"})
+        websocket.send_json({"action": "subscribe", "topic": "galaxy"})
+        assert websocket.receive_json() == {"type": "subscribed", "topics": ["city:mars:"]}
+        assert websocket.receive_json()["type"] == "error"
+
+        place_id = _ok(client.post("/places/", json=_place("Toruń"))).json()["id"]
+        websocket.send_json({"action": "subscribe", "topic": f"place:{place_id}"})
+        websocket.send_json({"action": "unsubscribe", "topic": "city:Mars:"})
+        assert websocket.receive_json()["topics"] == ["city:mars:", f"place:{place_id}"]
+        assert websocket.receive_json()["topics"] == [f"place:{place_id}"]
+
+        _ok(client.put(f"/places/{place_id}", json={**_place("Toruń"), "name": "Nowa nazwa"}))
+        event = websocket.receive_json()
+        assert event["type"] == "place.updated"
+        assert event["place"]["name"] == "Nowa nazwa"
+
+
+def test_publish_sends_once_per_client():
+    """
+    Test indeksu tematów – klient subskrybujący kilka pasujących tematów otrzymuje wiadomość raz.
+    """
+
+    async def scenario():
+        manager = ConnectionManager(interval=None)
+        both, other = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(both)
+        await manager.connect(other)
+        manager.subscribe(both, "places")
+        manager.subscribe(both, parse_topic("city:Kraków"))
+        manager.subscribe(other, "place:1")
+
+        assert manager.publish(["places", "city:kraków", "place:7"], "{}") == 1
+        await asyncio.sleep(0.01)
+        assert both.sent == ["{}"] and other.sent == []
+
+        manager.disconnect(both)
+        assert set(manager.subscribers) == {"place:1"}
+        manager.disconnect(other)
+
+    asyncio.run(scenario())
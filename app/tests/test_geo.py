@@ -0,0 +1,78 @@
+from app.geo import covering_cells, encode_geohash, haversine_m, prefix_range
+
+# Rynek Główny w Krakowie
+KRAKOW = (50.0617, 19.9373)
+
+
+def _create(client, name, latitude=None, longitude=None, **extra):
+    payload = {"name": name, "description": "Opis", "latitude": latitude, "longitude": longitude, **extra}
+    response = client.post("/places/", json=payload)
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def test_geohash_helpers():
+    """
+    Test kodowania geohash, zakresów prefiksów i pokrycia okręgu komórkami.
+    """
+
+    assert encode_geohash(42.6, -5.6, precision=5) == "ezs42"
+    assert prefix_range("u2y") == ("u2y", "u2z")
+    assert prefix_range("u2z") == ("u2z", "u3")
+    assert prefix_range("zz") == ("zz", None)
+
+    cells = covering_cells(*KRAKOW, 1000)
+    assert 1 <= len(cells) <= 9
+    # Punkt oddalony o ok. 900 m musi trafić do jednej z komórek
+    assert encode_geohash(KRAKOW[0] + 0.008, KRAKOW[1]).startswith(tuple(cells))
+
+
+def test_nearby_places_sorted_by_distance(client):
+    """
+    Test wyszukiwania miejsc w pobliżu – sortowanie po odległości i pomijanie dalekich miejsc.
+    """
+
+    far = _create(client, "Wieliczka", 49.9833, 20.0556)
+    near = _create(client, "Sukiennice", 50.0616, 19.9373)
+    middle = _create(client, "Wawel", 50.0540, 19.9354)
+    _create(client, "Bez współrzędnych")
+
+    response = client.get("/places/nearby", params={"lat": KRAKOW[0], "lon": KRAKOW[1], "radius": 2000})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["id"] for p in data] == [near, middle]
+    assert data[0]["distance_m"] < 50
+    assert abs(data[1]["distance_m"] - haversine_m(*KRAKOW, 50.0540, 19.9354)) < 1e-6
+    assert far not in [p["id"] for p in data]
+
+
+def test_nearby_places_follow_updates_and_filters(client):
+    """
+    Test wyszukiwania w pobliżu po zmianie współrzędnych oraz z filtrem.
+    """
+
+    place_id = _create(client, "Pomnik", 52.2297, 21.0122, is_free=True)
+
+    client.put(
+        f"/places/{place_id}",
+        json={"name": "Pomnik", "description": "Opis", "latitude": KRAKOW[0], "longitude": KRAKOW[1], "is_free": True},
+    )
+
+    params = {"lat": KRAKOW[0], "lon": KRAKOW[1], "radius": 100}
+    assert [p["id"] for p in client.get("/places/nearby", params=params).json()] == [place_id]
+    assert client.get("/places/nearby", params={**params, "is_free": False}).json() == []
+
+
+def test_place_coordinates_validation(client):
+    """
+    Test walidacji współrzędnych miejsca i parametrów wyszukiwania.
+    """
+
+    missing_longitude = client.post("/places/", json={"name": "X", "description": "Y", "latitude": 50})
+    out_of_range = client.post("/places/", json={"name": "X", "description": "Y", "latitude": 91, "longitude": 0})
+    too_far = client.get("/places/nearby", params={"lat": 0, "lon": 0, "radius": 10_000_000})
+
+    assert missing_longitude.status_code == 422
+    assert out_of_range.status_code == 422
+    assert too_far.status_code == 422
@@ -0,0 +1,101 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app import schemas
+from app.crud.review import create_reviews_batch
+from app.ingest import QueueFullError, ReviewIngestor
+from app.models import Place
+from app.routers import queued_reviews
+
+
+def _review(rating: int) -> schemas.ReviewCreate:
+    return schemas.ReviewCreate(title="Recenzja", content="Treść", rating=rating)
+
+
+def test_batch_insert_updates_aggregates(db_session, query_counter):
+    """
+    Test zapisu grupowego – recenzje wielu miejsc w stałej liczbie zapytań, z aktualizacją agregatów ocen.
+    """
+    first, second = Place(name="Wawel", description="Zamek"), Place(name="Sukiennice", description="Hala")
+    db_session.add_all([first, second])
+    db_session.commit()
+    items = [(first.id, _review(5)), (999999, _review(1)), (second.id, _review(2)), (first.id, _review(4))]
+    query_counter.clear()
+
+    created = create_reviews_batch(db_session, items * 25)
+
+    assert len(query_counter) <= 5
+    assert [review is None for review in created[:4]] == [False, True, False, False]
+    assert created[0].id < created[2].id < created[3].id
+    assert (created[0].place_id, created[0].rating, created[3].rating) == (first.id, 5, 4)
+    db_session.refresh(first)
+    db_session.refresh(second)
+    assert (first.review_count, first.rating_sum, first.rating_4, first.rating_5) == (50, 225, 25, 25)
+    assert first.rating_avg == 4.5
+    assert (second.review_count, second.rating_2) == (25, 25)
+
+
+def test_ingestor_groups_reviews_and_applies_backpressure(db_session):
+    """
+    Test kolejki recenzji – pełna kolejka odrzuca recenzje, a zatrzymanie zapisuje wszystkie przyjęte.
+    """
+    place = Place(name="Wawel", description="Zamek")
+    db_session.add(place)
+    db_session.commit()
+    place_id = place.id
+
+    async def scenario():
+        ingestor = ReviewIngestor(queue_size=3, batch_size=10, flush_interval=0.05, session_factory=lambda: db_session)
+        await ingestor.start()
+        accepted = [ingestor.submit(place_id, _review(rating)) for rating in (3, 4, 5)]
+        with pytest.raises(QueueFullError):
+            ingestor.submit(place_id, _review(1))
+        await ingestor.stop()
+        return ingestor, accepted
+
+    ingestor, accepted = asyncio.run(scenario())
+
+    assert [ingestor.status(status.tracking_id).status for status in accepted] == ["stored"] * 3
+    assert ingestor.stats()["batches"] == 1
+    assert ingestor.stats()["overflows"] == 1
+    assert db_session.get(Place, place_id).review_count == 3
+
+
+def test_write_behind_endpoint(db_session, monkeypatch):
+    """
+    Test endpointu w trybie zapisu w tle – odpowiedź 202 z identyfikatorem, stan stored lub rejected po zapisie.
+    """
+    place = Place(name="Wawel", description="Zamek")
+    db_session.add(place)
+    db_session.commit()
+    place_id = place.id
+    ingestor = ReviewIngestor(flush_interval=0.01, session_factory=lambda: db_session)
+    monkeypatch.setattr(queued_reviews, "review_ingestor", ingestor)
+
+    @asynccontextmanager
+    async def lifespan(_):
+        await ingestor.start()
+        yield
+        await ingestor.stop()
+
+    api = FastAPI(lifespan=lifespan)
+    api.include_router(queued_reviews.router)
+    payload = {"title": "Super", "content": "Polecam", "rating": 5}
+
+    with TestClient(api) as client:
+        accepted = client.post(f"/places/{place_id}/reviews", json=payload)
+        missing = client.post("/places/999999/reviews", json=payload)
+        invalid = client.post(f"/places/{place_id}/reviews", json={**payload, "rating": 7})
+
+    assert accepted.status_code == 202
+    assert accepted.headers["location"] == f"/reviews/ingest/{accepted.json()['tracking_id']}"
+    assert invalid.status_code == 422
+    with TestClient(api) as client:
+        stored = client.get(accepted.headers["location"]).json()
+        rejected = client.get(missing.headers["location"]).json()
+    assert stored["status"] == "stored" and stored["review_id"]
+    assert rejected["status"] == "rejected"
@@ -0,0 +1,98 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from app.main import app
+from app.metrics import (
+    InstrumentedQueuePool, LatencyHistogram, RequestMetrics, combine_summaries, prometheus_text, request_metrics,
+)
+
+
+def test_prometheus_metrics_per_route_template(client):
+    """
+    Test endpointu /metrics – żądania liczone są według szablonu trasy, a nie konkretnego adresu.
+    """
+    place = client.post("/places/", json={"name": "Wawel", "description": "Zamek", "city": "Kraków"}).json()
+    client.get(f"/places/{place['id']}")
+    client.get("/places/999999")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/places/{place_id}",status="200"}' in body
+    assert 'http_requests_total{method="GET",route="/places/{place_id}",status="404"}' in body
+    assert f"/places/{place['id']}\"" not in body
+    assert 'http_request_duration_seconds_bucket{method="POST",route="/places/",le="+Inf"}' in body
+    assert "http_requests_in_flight" in body
+
+
+def test_prometheus_pool_metrics():
+    """
+    Test formatu Prometheus – stan instrumentowanej puli połączeń opisany etykietą silnika.
+    """
+    engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool)
+    with engine.connect():
+        body = prometheus_text(RequestMetrics(), {"primary": engine})
+
+    assert "# TYPE db_pool_checkedout gauge" in body
+    assert 'db_pool_checkedout{engine="primary"} 1' in body
+    assert 'db_pool_acquisitions_total{engine="primary"} 1' in body
+    engine.dispose()
+
+
+def test_status_websocket_includes_request_metrics():
+    """
+    Test endpointu /status – wiadomość statusu zawiera podsumowanie metryk żądań i pul połączeń.
+    """
+    with TestClient(app) as client:
+        client.get("/metrics/cache")
+        with client.websocket_connect("/status") as websocket:
+            data = websocket.receive_json()
+
+    metrics = data["metrics"]
+    assert metrics["requests_per_second"] > 0
+    assert "GET /metrics/cache" in metrics["routes"]
+    assert {"p50_ms", "p95_ms", "p99_ms"} <= metrics["routes"]["GET /metrics/cache"].keys()
+    assert "primary" in metrics["db_pool"]
+    assert metrics["db_pool"]["primary"]["pool_class"]
+
+
+def test_request_metrics_window_and_quantiles(monkeypatch):
+    """
+    Test metryk żądań – kwantyle z histogramu, odsetek błędów i wygasanie okna kroczącego.
+    """
+    now = [1000.0]
+    monkeypatch.setattr("app.metrics.time.monotonic", lambda: now[0])
+    metrics = RequestMetrics()
+    for _ in range(90):
+        metrics.observe("GET", "/places/", 200, 0.004)
+    for _ in range(10):
+        metrics.observe("GET", "/places/", 500, 0.8)
+
+    now[0] += 30
+    summary = metrics.summary()
+    route = summary["routes"]["GET /places/"]
+    assert summary["error_rate"] == 0.1
+    assert route["p50_ms"] <= 5
+    assert 500 <= route["p99_ms"] <= 1000
+
+    now[0] += 120
+    assert metrics.summary()["routes"] == {}
+    assert metrics.routes[("GET", "/places/")].total.count == 100
+
+
+def test_combine_summaries_weights_error_rate():
+    """
+    Test podsumowania klastra – RPS i żądania w toku są sumowane, a odsetek błędów ważony ruchem.
+    """
+    combined = combine_summaries({
+        "a": {"requests_per_second": 30.0, "error_rate": 0.0, "in_flight": 2},
+        "b": {"requests_per_second": 10.0, "error_rate": 0.4, "in_flight": 1},
+    })
+
+    assert combined["requests_per_second"] == 40.0
+    assert combined["error_rate"] == 0.1
+    assert combined["in_flight"] == 3
+    assert LatencyHistogram().quantile(0.5) is None
+    assert request_metrics.in_flight == 0
@@ -95,7 +95,7 @@ def test_read_places(client):
 
     assert response.status_code == 200
 
-    data = response.json()
+    data = response.json()["items"]
 
     # Sprawdzam, czy w odpowiedzi są dokładnie 2 miejsca
     assert len(data) == 2
@@ -107,6 +107,98 @@ def test_read_places(client):
     assert "Place 2" in names
 
 
+def test_read_places_cursor_pagination(client):
+    """
+    Test stronicowania listy miejsc kursorem.
+    """
+
+    for i in range(5):
+        client.post("/places/", json={"name": f"Paged {i}", "description": "Desc"})
+
+    first = client.get("/places/", params={"limit": 2})
+    assert first.status_code == 200
+    first_page = first.json()
+
+    assert len(first_page["items"]) == 2
+    assert first_page["next_cursor"] is not None
+
+    # Przechodzę przez wszystkie strony i zbieram identyfikatory
+    ids = [p["id"] for p in first_page["items"]]
+    cursor = first_page["next_cursor"]
+    while cursor:
+        page = client.get("/places/", params={"limit": 2, "cursor": cursor}).json()
+        ids.extend(p["id"] for p in page["items"])
+        cursor = page["next_cursor"]
+
+    # Sprawdzam, czy strony się nie nakładają i są posortowane po id
+    assert len(ids) == 5
+    assert ids == sorted(ids)
+
+
+def test_read_places_sorted_by_created_at_desc(client):
+    """
+    Test stronicowania listy miejsc posortowanej malejąco po dacie utworzenia.
+    """
+
+    for i in range(3):
+        client.post("/places/", json={"name": f"Sorted {i}", "description": "Desc"})
+
+    first = client.get("/places/", params={"limit": 2, "sort": "-created_at"}).json()
+    second = client.get(
+        "/places/",
+        params={"limit": 2, "sort": "-created_at", "cursor": first["next_cursor"]}
+    ).json()
+
+    ids = [p["id"] for p in first["items"] + second["items"]]
+
+    # Przy równych datach o kolejności decyduje id (malejąco)
+    assert ids == sorted(ids, reverse=True)
+    assert second["next_cursor"] is None
+
+
+def test_read_places_filters(client):
+    """
+    Test filtrowania listy miejsc po mieście, kraju, nazwie i bezpłatnym wstępie.
+    """
+
+    client.post("/places/", json={"name": "Wawel", "description": "D", "city": "Kraków", "country": "PL", "is_free": False})
+    client.post("/places/", json={"name": "Sukiennice", "description": "D", "city": "Kraków", "country": "PL", "is_free": True})
+    client.post("/places/", json={"name": "Łazienki", "description": "D", "city": "Warszawa", "country": "PL", "is_free": True})
+
+    by_city = client.get("/places/", params={"city": "Kraków"}).json()["items"]
+    assert {p["name"] for p in by_city} == {"Wawel", "Sukiennice"}
+
+    free_in_city = client.get("/places/", params={"city": "Kraków", "is_free": True}).json()["items"]
+    assert [p["name"] for p in free_in_city] == ["Sukiennice"]
+
+    by_name = client.get("/places/", params={"name": "Wa"}).json()["items"]
+    assert [p["name"] for p in by_name] == ["Wawel"]
+
+    by_country = client.get("/places/", params={"country": "PL"}).json()["items"]
+    assert len(by_country) == 3
+
+
+def test_read_places_invalid_cursor(client):
+    """
+    Test odczytu listy miejsc z niepoprawnym kursorem.
+    """
+
+    response = client.get("/places/", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_read_places_limit_above_max(client):
+    """
+    Test odczytu listy miejsc z rozmiarem strony przekraczającym limit.
+    """
+
+    response = client.get("/places/", params={"limit": 100000})
+
+    assert response.status_code == 422
+
+
 def test_read_place_success(client):
     """
     Test odczytu pojedynczego miejsca po jego utworzeniu.
@@ -237,3 +329,60 @@ def test_place_contains_reviews(client):
     assert "reviews" in place
     assert len(place["reviews"]) == 1
     assert place["reviews"][0]["rating"] == 5
+
+def _create_places_with_reviews(client, count, reviews_per_place=3):
+    """Tworzy miejsca z recenzjami i zwraca ich identyfikatory."""
+    ids = []
+    for i in range(count):
+        place_id = client.post("/places/", json={"name": f"N+1 {i}", "description": "Desc"}).json()["id"]
+        for r in range(reviews_per_place):
+            client.post(
+                f"/places/{place_id}/reviews",
+                json={"title": f"Review {r}", "content": "Text", "rating": 4}
+            )
+        ids.append(place_id)
+    return ids
+
+
+def test_read_places_query_count_is_constant(client, db_session, query_counter):
+    """
+    Test regresji N+1: liczba zapytań listy miejsc nie zależy od liczby miejsc.
+    """
+
+    _create_places_with_reviews(client, 2)
+    db_session.expunge_all()
+    query_counter.clear()
+
+    response = client.get("/places/")
+    assert response.status_code == 200
+    queries_for_two = len(query_counter)
+
+    _create_places_with_reviews(client, 8)
+    db_session.expunge_all()
+    query_counter.clear()
+
+    response = client.get("/places/")
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 10
+
+    # Sprawdzam, czy lista nie zawiera recenzji i nie ładuje ich osobno dla każdego miejsca
+    assert "reviews" not in response.json()["items"][0]
+    assert len(query_counter) == queries_for_two == 1
+
+
+def test_read_place_loads_reviews_in_one_query(client, db_session, query_counter):
+    """
+    Test regresji N+1: szczegóły miejsca ładują recenzje jednym zapytaniem.
+    """
+
+    place_id = _create_places_with_reviews(client, 1, reviews_per_place=5)[0]
+    db_session.expunge_all()
+    query_counter.clear()
+
+    response = client.get(f"/places/{place_id}")
+
+    assert response.status_code == 200
+    assert len(response.json()["reviews"]) == 5
+
+    # Jedno zapytanie o miejsce i jedno zbiorcze zapytanie o recenzje
+    assert len(query_counter) == 2
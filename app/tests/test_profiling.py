@@ -0,0 +1,61 @@
+import logging
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.main import app
+from app.models import Place
+from app.profiling import SQLProfiler, SQLProfilingMiddleware
+
+
+@pytest.fixture()
+def sql_profiler():
+    """Profiler zapytań z niskim progiem wolnych zapytań, usuwany po teście."""
+    profiler = SQLProfiler(slow_query_ms=1e-6, n_plus_one_threshold=3)
+    yield profiler
+    profiler.uninstall()
+
+
+def test_server_timing_header(client, sql_profiler):
+    """
+    Test profilowania SQL – odpowiedź zawiera nagłówek Server-Timing z liczbą i czasem zapytań.
+    """
+    place = client.post("/places/", json={"name": "Wawel", "description": "Zamek", "city": "Kraków"}).json()
+    profiled = TestClient(SQLProfilingMiddleware(app, sql_profiler))
+
+    response = profiled.get(f"/places/{place['id']}")
+
+    assert response.status_code == 200
+    timing = response.headers["server-timing"]
+    assert timing.startswith("db;dur=")
+    assert 'queries"' in timing and 'desc="0 queries"' not in timing
+
+
+def test_n_plus_one_and_slow_query_log(db_session, sql_profiler, caplog):
+    """
+    Test profilowania SQL – powtarzane zapytanie z różnymi parametrami i wolne zapytania trafiają do dziennika z trasą.
+    """
+    places = [Place(name=f"Miejsce {i}", description="Opis") for i in range(4)]
+    db_session.add_all(places)
+    db_session.flush()
+
+    api = FastAPI()
+
+    @api.get("/names")
+    def read_names(db: Session = Depends(get_db)):
+        return [db.scalar(select(Place.name).where(Place.id == place.id)) for place in places]
+
+    api.dependency_overrides[get_db] = lambda: db_session
+
+    with caplog.at_level(logging.WARNING, logger="app.profiling"):
+        response = TestClient(SQLProfilingMiddleware(api, sql_profiler)).get("/names")
+
+    assert response.status_code == 200
+    assert 'desc="4 queries"' in response.headers["server-timing"]
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(message.startswith("Możliwe zapytania N+1 w GET /names: 4 wykonań") for message in messages)
+    assert any(message.startswith("Wolne zapytanie") and "GET /names" in message for message in messages)
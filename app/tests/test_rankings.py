@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.crud.review import create_reviews_batch, recompute_rankings
+from app.models import Place, Review
+from app.ranking import trending_now, trending_weight
+from app.schemas import ReviewCreate
+
+
+def _create(client, name, city="Kraków", ratings=()):
+    place_id = client.post("/places/", json={"name": name, "description": "", "city": city}).json()["id"]
+    for rating in ratings:
+        client.post(f"/places/{place_id}/reviews", json={"title": "T", "content": "C", "rating": rating})
+    return place_id
+
+
+def test_top_places_use_bayesian_average(client, query_counter):
+    """
+    Test rankingu najlepiej ocenianych – średnia Bayesa, ranking w mieście i jedno zapytanie bez recenzji.
+    """
+
+    single = _create(client, "Jedna recenzja", ratings=[5])
+    many = _create(client, "Wiele recenzji", ratings=[5, 5, 5, 4, 5, 5, 5, 5])
+    warsaw = _create(client, "Warszawa", city="Warszawa", ratings=[3])
+    _create(client, "Bez recenzji")
+    query_counter.clear()
+
+    top = client.get("/places/top").json()
+    krakow = client.get("/places/top", params={"city": "Kraków", "limit": 1}).json()
+
+    assert [place["id"] for place in top] == [many, single, warsaw]
+    assert top[0]["score"] == pytest.approx((10 * 3.5 + 39) / 18)
+    assert top[0]["rating_avg"] == pytest.approx(39 / 8)
+    assert [place["id"] for place in krakow] == [many]
+    assert len(query_counter) == 2 and not any("reviews" in statement for statement in query_counter)
+
+
+def test_trending_places_decay_with_review_age(client, db_session):
+    """
+    Test rankingu popularnych – stare recenzje ważą mniej, a przeliczenie daje te same wyniki co aktualizacje.
+    """
+
+    fresh = _create(client, "Świeże", ratings=[4])
+    old = _create(client, "Stare", city="Gdańsk")
+    month_ago = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=30)
+    db_session.add_all(
+        [Review(title="T", content="C", rating=5, place_id=old, created_at=month_ago) for _ in range(10)]
+    )
+    db_session.commit()
+    create_reviews_batch(db_session, [(fresh, ReviewCreate(title="T", content="C", rating=5))])
+    incremental = db_session.get(Place, fresh).trending_score
+
+    assert recompute_rankings(db_session) == 2
+    db_session.expire_all()
+
+    trending = client.get("/places/trending").json()
+    gdansk = client.get("/places/trending", params={"city": "Gdańsk"}).json()
+
+    assert db_session.get(Place, fresh).trending_score == pytest.approx(incremental, rel=1e-3)
+    assert [place["id"] for place in trending] == [fresh, old]
+    assert trending[0]["score"] == pytest.approx(1.8, rel=1e-3)
+    assert gdansk[0]["score"] == pytest.approx(10 * trending_now(trending_weight(5, month_ago)), rel=1e-6)
+    assert gdansk[0]["score"] < 1
@@ -0,0 +1,81 @@
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from app import database
+from app.database import PRIMARY_PIN_COOKIE, ReadYourWritesMiddleware, ReplicaSet, set_engine, set_replicas
+from app.main import app
+from app.models import Base
+
+
+@pytest.fixture()
+def primary_and_replica(tmp_path):
+    """Osobne bazy główna i replika (bez replikacji – replika symuluje opóźnienie)."""
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for engine in (primary, replica):
+        Base.metadata.create_all(bind=engine)
+    replicas = ReplicaSet([replica])
+    original = database.get_engine()
+    set_engine(primary)
+    set_replicas(replicas)
+    try:
+        yield replicas
+    finally:
+        set_replicas(None)
+        set_engine(original)
+        primary.dispose()
+        replica.dispose()
+
+
+def test_round_robin_skips_unhealthy_replicas(tmp_path):
+    """
+    Test replik – wybór po kolei, z pominięciem replik, które nie przeszły sprawdzenia dostępności.
+    """
+    first = create_engine(f"sqlite:///{tmp_path / 'first.db'}")
+    second = create_engine(f"sqlite:///{tmp_path / 'second.db'}")
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'broken.db'}")
+    replicas = ReplicaSet([first, broken, second])
+
+    replicas.check()
+
+    assert replicas.stats() == {"replica-0": True, "replica-1": False, "replica-2": True}
+    assert [replicas.pick() for _ in range(4)] == [first, second, first, second]
+    replicas.healthy = [False, False, False]
+    assert replicas.pick() is None
+
+
+def test_reads_use_replica_until_client_writes(primary_and_replica):
+    """
+    Test replik – odczyty trafiają do repliki, a klient po zapisie czyta z bazy głównej (read-your-writes).
+    """
+    api = ReadYourWritesMiddleware(app, pin_seconds=30)
+
+    with TestClient(api) as writer, TestClient(api) as reader:
+        created = writer.post("/places/", json={"name": "Wawel", "description": "Zamek"})
+        place_id = created.json()["id"]
+
+        assert PRIMARY_PIN_COOKIE in created.cookies
+        assert writer.get(f"/places/{place_id}").status_code == 200
+        # Klient bez ciasteczka czyta z repliki, która jeszcze nie ma nowego miejsca
+        assert reader.get(f"/places/{place_id}").status_code == 404
+
+        primary_and_replica.healthy = [False]
+        assert reader.get(f"/places/{place_id}").status_code == 200
+
+
+def test_expired_or_invalid_pin_reads_from_replica(primary_and_replica):
+    """
+    Test replik – przeterminowane lub niepoprawne ciasteczko nie kieruje odczytów do bazy głównej.
+    """
+    for value in ("1", "not-a-number"):
+        request = Request({
+            "type": "http",
+            "method": "GET",
+            "path": "/places/",
+            "headers": [(b"cookie", f"{PRIMARY_PIN_COOKIE}={value}".encode())],
+        })
+        sessions = database.get_db(request)
+        assert next(sessions).get_bind() is primary_and_replica.engines[0]
+        sessions.close()
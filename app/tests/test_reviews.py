@@ -68,3 +68,165 @@ def test_create_review_rating_too_high(client):
 
     # Sprawdzam, czy błąd dotyczy pola 'rating'
     assert data["detail"][0]["loc"][-1] == "rating"
+
+
+def _add_reviews(client, place_id, ratings):
+    """Dodaje recenzje o podanych ocenach do miejsca."""
+    for rating in ratings:
+        response = client.post(
+            f"/places/{place_id}/reviews",
+            json={"title": "Review", "content": "Text", "rating": rating}
+        )
+        assert response.status_code == 200
+
+
+def test_create_review_updates_rating_aggregates(client):
+    """
+    Test aktualizacji zdenormalizowanych agregatów ocen przy dodawaniu recenzji.
+    """
+
+    place_id = client.post("/places/", json={"name": "Rated", "description": "Desc"}).json()["id"]
+    _add_reviews(client, place_id, [5, 4, 4])
+
+    data = client.get(f"/places/{place_id}").json()
+
+    assert data["review_count"] == 3
+    assert data["rating_sum"] == 13
+    assert round(data["rating_avg"], 4) == round(13 / 3, 4)
+    assert data["rating_histogram"] == {"1": 0, "2": 0, "3": 0, "4": 2, "5": 1}
+
+
+def test_create_review_for_missing_place(client):
+    """
+    Test tworzenia recenzji dla miejsca, które nie istnieje.
+    """
+
+    response = client.post(
+        "/places/99999/reviews",
+        json={"title": "Nowhere", "content": "Text", "rating": 3}
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Place not found"
+
+
+def test_places_sorted_and_filtered_by_rating(client):
+    """
+    Test sortowania i filtrowania listy miejsc po średniej ocenie.
+    """
+
+    ratings = {"Low": [1, 2], "High": [5, 5], "Mid": [3, 4]}
+    for name, place_ratings in ratings.items():
+        place_id = client.post("/places/", json={"name": name, "description": "Desc"}).json()["id"]
+        _add_reviews(client, place_id, place_ratings)
+
+    best_first = client.get("/places/", params={"sort": "-rating"}).json()["items"]
+    assert [p["name"] for p in best_first] == ["High", "Mid", "Low"]
+
+    # Sprawdzam stronicowanie kursorem przy sortowaniu po ocenie
+    first = client.get("/places/", params={"sort": "-rating", "limit": 2}).json()
+    second = client.get(
+        "/places/",
+        params={"sort": "-rating", "limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    assert [p["name"] for p in second["items"]] == ["Low"]
+
+    good = client.get("/places/", params={"min_rating": 3.5}).json()["items"]
+    assert {p["name"] for p in good} == {"High", "Mid"}
+
+
+def test_recompute_rating_stats(client, db_session):
+    """
+    Test przeliczania agregatów ocen na podstawie tabeli recenzji.
+    """
+    from app.crud.review import recompute_rating_stats
+    from app.models import Place
+
+    place_id = client.post("/places/", json={"name": "Backfill", "description": "Desc"}).json()["id"]
+    _add_reviews(client, place_id, [2, 4])
+
+    # Psuję agregaty, symulując dane sprzed wprowadzenia denormalizacji
+    place = db_session.get(Place, place_id)
+    place.review_count = 0
+    place.rating_sum = 0
+    place.rating_avg = 0
+    place.rating_2 = 0
+    db_session.commit()
+
+    assert recompute_rating_stats(db_session, place_id=place_id) == 1
+
+    data = client.get(f"/places/{place_id}").json()
+    assert data["review_count"] == 2
+    assert data["rating_sum"] == 6
+    assert data["rating_avg"] == 3.0
+    assert data["rating_histogram"]["2"] == 1
+    assert data["rating_histogram"]["4"] == 1
+
+
+def test_read_reviews_paginated(client):
+    """
+    Test stronicowania recenzji miejsca kursorem (najnowsze najpierw).
+    """
+
+    place_id = client.post("/places/", json={"name": "Many reviews", "description": "Desc"}).json()["id"]
+    _add_reviews(client, place_id, [1, 2, 3, 4, 5])
+
+    ids = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(f"/places/{place_id}/reviews", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        ids.extend(r["id"] for r in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    # Przy równych datach dodania o kolejności decyduje id (malejąco)
+    assert len(ids) == 5
+    assert ids == sorted(ids, reverse=True)
+
+
+def test_read_reviews_rating_filters(client):
+    """
+    Test filtrowania recenzji miejsca po ocenie.
+    """
+
+    place_id = client.post("/places/", json={"name": "Filtered reviews", "description": "Desc"}).json()["id"]
+    _add_reviews(client, place_id, [1, 3, 5, 5])
+
+    exact = client.get(f"/places/{place_id}/reviews", params={"rating": 5}).json()["items"]
+    assert [r["rating"] for r in exact] == [5, 5]
+
+    ranged = client.get(
+        f"/places/{place_id}/reviews",
+        params={"min_rating": 2, "max_rating": 4}
+    ).json()["items"]
+    assert [r["rating"] for r in ranged] == [3]
+
+
+def test_read_reviews_place_not_found(client):
+    """
+    Test odczytu recenzji miejsca, które nie istnieje.
+    """
+
+    response = client.get("/places/99999/reviews")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Place not found"
+
+
+def test_read_reviews_empty_place(client):
+    """
+    Test odczytu recenzji istniejącego miejsca bez recenzji.
+    """
+
+    place_id = client.post("/places/", json={"name": "No reviews", "description": "Desc"}).json()["id"]
+
+    response = client.get(f"/places/{place_id}/reviews")
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": None}
@@ -0,0 +1,87 @@
+def _create(client, name, description="", city=None):
+    payload = {"name": name, "description": description, "city": city}
+    return client.post("/places/", json=payload).json()["id"]
+
+
+def test_search_places_ranks_name_matches_first(client):
+    """
+    Test wyszukiwania – dopasowanie w nazwie jest ważniejsze niż w opisie.
+    """
+
+    in_description = _create(client, "Rynek", "Obok stoi zamek królewski")
+    in_name = _create(client, "Zamek Królewski", "Rezydencja")
+    _create(client, "Muzeum", "Eksponaty")
+
+    response = client.get("/places/search", params={"q": "zamek"})
+
+    assert response.status_code == 200
+    assert [p["id"] for p in response.json()] == [in_name, in_description]
+
+
+def test_search_places_prefix_and_all_terms(client):
+    """
+    Test wyszukiwania – ostatni wyraz dopasowywany jako prefiks, wszystkie wyrazy wymagane.
+    """
+
+    wawel = _create(client, "Wawel", "Zamek królewski", city="Kraków")
+    _create(client, "Wawel", "Restauracja", city="Warszawa")
+
+    prefix = client.get("/places/search", params={"q": "waw"}).json()
+    both = client.get("/places/search", params={"q": "wawel krak"}).json()
+    accents = client.get("/places/search", params={"q": "krakow"}).json()
+
+    assert len(prefix) == 2
+    assert [p["id"] for p in both] == [wawel]
+    assert [p["id"] for p in accents] == [wawel]
+
+
+def test_search_places_follows_updates_and_filters(client):
+    """
+    Test wyszukiwania po zmianie i usunięciu miejsca oraz z dodatkowym filtrem.
+    """
+
+    place_id = _create(client, "Stara nazwa", "Opis", city="Gdańsk")
+    client.put(f"/places/{place_id}", json={"name": "Żuraw", "description": "Dźwig portowy", "city": "Gdańsk"})
+
+    assert client.get("/places/search", params={"q": "stara"}).json() == []
+    assert [p["id"] for p in client.get("/places/search", params={"q": "żuraw"}).json()] == [place_id]
+    assert client.get("/places/search", params={"q": "żuraw", "city": "Kraków"}).json() == []
+
+    client.delete(f"/places/{place_id}")
+    assert client.get("/places/search", params={"q": "żuraw"}).json() == []
+
+
+def test_search_places_ignores_query_syntax(client):
+    """
+    Test wyszukiwania – znaki specjalne w zapytaniu nie powodują błędu.
+    """
+
+    _create(client, "Muzeum", "Opis")
+
+    assert client.get("/places/search", params={"q": '"*) OR ('}).json() == []
+    assert client.get("/places/search", params={"q": ""}).status_code == 422
+
+
+def test_search_falls_back_to_ilike_without_fulltext_index(client, db_session):
+    """
+    Test wyszukiwania na bazie bez indeksu pełnotekstowego – dopasowanie ILIKE zamiast błędu.
+    """
+
+    from sqlalchemy import select
+
+    from app.models import Place
+    from app.search import apply_search, search_terms
+
+    in_description = _create(client, "Rynek", "Obok stoi zamek")
+    in_name = _create(client, "Zamek Ujazdowski", "Sztuka")
+    _create(client, "ZamekXkrólewski", "Znak _ we wzorcu nie może dopasować dowolnego znaku")
+
+    query = apply_search(select(Place.id), "mysql", search_terms("zamek"))
+    assert db_session.scalars(query).all()[-1] == in_description
+    assert db_session.scalars(query).all()[0] == in_name
+
+    query = apply_search(select(Place.id), "mysql", search_terms("zamek_królewski"))
+    assert db_session.scalars(query).all() == []
+
+    query = apply_search(select(Place.id), "mysql", search_terms("zamek sztuka"))
+    assert db_session.scalars(query).all() == [in_name]
@@ -0,0 +1,95 @@
+import json
+
+from app import schemas
+from app.crud.place import ReviewLoading, get_place, get_places
+from app.main import app
+from app.serialization import dumps, parse_place_fields
+
+
+def _seed(client):
+    place_id = client.post(
+        "/places/",
+        json={"name": "Szybka", "description": "Ścieżka", "city": "Łódź", "latitude": 51.77, "longitude": 19.46},
+    ).json()["id"]
+    client.post("/places/", json={"name": "Druga", "description": "Bez recenzji"})
+    for rating in (2, 5):
+        client.post(f"/places/{place_id}/reviews", json={"title": "T", "content": "C", "rating": rating})
+    return place_id
+
+
+def test_place_detail_matches_pydantic_serialization(client, db_session):
+    """
+    Test zgodności szybkiej ścieżki szczegółów miejsca ze schematem Pydantic.
+    """
+
+    place_id = _seed(client)
+
+    response = client.get(f"/places/{place_id}")
+    expected = schemas.Place.model_validate(get_place(db_session, place_id, reviews=ReviewLoading.selectin))
+
+    assert response.json() == json.loads(expected.model_dump_json())
+
+
+def test_place_list_matches_pydantic_serialization(client, db_session):
+    """
+    Test zgodności szybkiej ścieżki listy miejsc ze schematem Pydantic.
+    """
+
+    _seed(client)
+
+    response = client.get("/places/", params={"limit": 1})
+    places, next_cursor = get_places(db_session, limit=1)
+    expected = schemas.Page[schemas.PlaceSummary].model_validate(
+        {"items": places, "next_cursor": next_cursor}, from_attributes=True
+    )
+
+    assert response.json() == json.loads(expected.model_dump_json())
+
+
+def test_fast_path_keeps_openapi_schema():
+    """
+    Test, że dokumentacja OpenAPI nadal opisuje odpowiedzi schematami Pydantic.
+    """
+
+    paths = app.openapi()["paths"]
+    detail = paths["/places/{place_id}"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    listing = paths["/places/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+
+    assert detail == {"$ref": "#/components/schemas/Place"}
+    assert listing == {"$ref": "#/components/schemas/Page_PlaceSummary_"}
+    assert dumps({"histogram": {1: 0}}) == b'{"histogram":{"1":0}}'
+
+
+def test_sparse_fieldsets_narrow_select_and_response(client, query_counter):
+    """
+    Test parametru fields – odpowiedź i zapytanie SQL zawierają tylko wybrane pola.
+    """
+
+    place_id = _seed(client)
+    query_counter.clear()
+
+    listing = client.get("/places/", params={"fields": "summary", "limit": 1})
+    detail = client.get(f"/places/{place_id}", params={"fields": "name,city,rating_histogram"})
+
+    summary = parse_place_fields("summary")
+    assert list(listing.json()["items"][0]) == list(summary.model.model_fields)
+    assert "description" not in listing.json()["items"][0] and listing.json()["next_cursor"]
+    assert detail.json() == {
+        "id": place_id, "name": "Szybka", "city": "Łódź", "rating_histogram": {"1": 0, "2": 1, "3": 0, "4": 0, "5": 1},
+    }
+    assert len(query_counter) == 2
+    assert not any("description" in statement for statement in query_counter)
+    assert not any(statement.startswith("SELECT reviews.") for statement in query_counter)
+    assert client.get(f"/places/{place_id}", params={"fields": "full"}).json()["reviews"]
+
+
+def test_sparse_fieldsets_are_cached_and_validated(client):
+    """
+    Test parametru fields – modele zestawów pól są zapamiętywane, a nieznane pola odrzucane.
+    """
+
+    assert parse_place_fields("city,name") is parse_place_fields("name, city,id")
+    assert parse_place_fields("summary,reviews", detail=True).reviews
+    assert parse_place_fields("full") is None
+    assert client.get("/places/", params={"fields": "name,reviews"}).status_code == 400
+    assert client.get("/places/1", params={"fields": "secret"}).json() == {"detail": "Unknown field: secret"}
@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.tests.fakes import FakeWebSocket
+from app.websocket_manager import ConnectionManager
+
+
+def test_status_websocket_sends_status():
+    """
+    Test endpointu /status – klient otrzymuje status serwera.
+    """
+
+    with TestClient(app) as client, client.websocket_connect("/status") as websocket:
+        data = websocket.receive_json()
+
+    assert data["status"] == "running"
+    assert data["connected_clients"] == 1
+
+
+def test_broadcast_isolates_slow_clients():
+    """
+    Test rozsyłania – wolny klient nie opóźnia szybkich i zostaje rozłączony po przekroczeniu limitu czasu.
+    """
+
+    async def scenario():
+        manager = ConnectionManager(queue_size=4, send_timeout=0.05, interval=None)
+        fast, stalled = FakeWebSocket(), FakeWebSocket(delay=10)
+        await manager.connect(fast)
+        await manager.connect(stalled)
+
+        await manager.broadcast({"tick": 1})
+        await asyncio.sleep(0.1)
+
+        assert fast.sent == [json.dumps({"tick": 1})]
+        assert stalled.closed_with == 1008
+        assert list(manager.active_connections) == [fast]
+        assert manager.stats()["slow_disconnects"] == 1
+
+        manager.disconnect(fast)
+
+    asyncio.run(scenario())
+
+
+def test_broadcast_overflow_policies():
+    """
+    Test polityk przepełnienia kolejki – usunięcie najstarszej wiadomości albo rozłączenie klienta.
+    """
+
+    async def scenario(policy):
+        manager = ConnectionManager(queue_size=2, send_timeout=10, overflow_policy=policy, interval=None)
+        slow = FakeWebSocket(delay=0.05)
+        await manager.connect(slow)
+
+        # Rozsyłanie nie oddaje sterowania, więc kolejka zapełnia się przed pierwszym wysłaniem
+        for tick in range(5):
+            await manager.broadcast({"tick": tick})
+        await asyncio.sleep(0.3)
+        manager.disconnect(slow)
+        return manager, slow
+
+    manager, slow = asyncio.run(scenario("drop_oldest"))
+    assert [json.loads(p)["tick"] for p in slow.sent] == [3, 4]
+    assert manager.dropped_messages == 3
+
+    manager, slow = asyncio.run(scenario("disconnect"))
+    assert slow.closed_with == 1008
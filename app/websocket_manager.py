@@ -1,21 +1,125 @@
-from fastapi import WebSocket
-from typing import Set
+from fastapi import WebSocket, status
 from datetime import datetime
+from typing import Iterable
 import asyncio
+import json
+import logging
+import time
+
+from app.config import settings
+from app.metrics import status_summary
+
+logger = logging.getLogger(__name__)
+
+
+class ClientConnection:
+    """
+    Połączenie WebSocket z własną, ograniczoną kolejką wiadomości wychodzących.
+
+    Wiadomości wysyła osobne zadanie, więc wolny klient nie blokuje ani
+    rozsyłania do pozostałych, ani pętli statusu. Gdy kolejka jest pełna,
+    zależnie od polityki usuwana jest najstarsza wiadomość (drop_oldest)
+    albo klient jest rozłączany (disconnect). Klient, któremu nie udało się
+    wysłać wiadomości w czasie send_timeout, jest rozłączany.
+
+    Attributes:
+        websocket: Połączenie WebSocket.
+        queue: Kolejka zserializowanych wiadomości do wysłania.
+        dropped: Liczba wiadomości usuniętych z powodu przepełnienia kolejki.
+        topics: Tematy subskrybowane przez klienta.
+        sender_task: Zadanie wysyłające wiadomości z kolejki.
+    """
+
+    def __init__(self, websocket: WebSocket, manager: "ConnectionManager"):
+        self.websocket = websocket
+        self.manager = manager
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=manager.queue_size)
+        self.dropped = 0
+        self.topics: set[str] = set()
+        self.sender_task = asyncio.create_task(self._sender())
+
+    def enqueue(self, payload: str) -> bool:
+        """
+        Dodaje wiadomość do kolejki bez czekania.
+
+        Args:
+            payload (str): Zserializowana wiadomość.
+
+        Returns:
+            bool: False, jeśli kolejka jest pełna, a polityka nakazuje rozłączenie klienta.
+        """
+        try:
+            self.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            if self.manager.overflow_policy == "disconnect":
+                return False
+            # Dla cyklicznego statusu najważniejsza jest najnowsza wiadomość
+            self.queue.get_nowait()
+            self.queue.put_nowait(payload)
+            self.dropped += 1
+            self.manager.dropped_messages += 1
+            return True
+
+    async def _sender(self):
+        """Wysyła kolejne wiadomości z kolejki z limitem czasu na każdą z nich."""
+        try:
+            while True:
+                payload = await self.queue.get()
+                await asyncio.wait_for(self.websocket.send_text(payload), self.manager.send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            logger.info("Client too slow, disconnecting")
+            self.manager.slow_disconnects += 1
+            await self.manager.close(self.websocket, reason="Client too slow")
+        except Exception:
+            logger.warning("Error sending message, disconnecting client", exc_info=True)
+            await self.manager.close(self.websocket)
 
 
 class ConnectionManager:
     """
     Zarządza połączeniami WebSocket oraz obsługuje rozsyłanie wiadomości do podłączonych klientów.
 
+    Wiadomość serializowana jest raz i trafia do kolejek wszystkich klientów bez
+    czekania na wysłanie – koszt rozsyłania nie zależy od szybkości klientów.
+
     Attributes:
-        active_connections: Zbiór aktualnie aktywnych połączeń WebSocket.
+        active_connections: Aktywne połączenia WebSocket i ich kolejki.
+        subscribers: Indeks tematów – połączenia subskrybujące każdy temat.
         broadcast_task: Zadanie w tle odpowiedzialne za cykliczne wysyłanie statusu.
+        queue_size: Maksymalna liczba oczekujących wiadomości na klienta.
+        send_timeout: Maksymalny czas wysłania jednej wiadomości w sekundach.
+        overflow_policy: Zachowanie przy pełnej kolejce (drop_oldest lub disconnect).
+        interval: Odstęp między wiadomościami statusu w sekundach (None wyłącza status).
+        dropped_messages: Łączna liczba wiadomości usuniętych z przepełnionych kolejek.
+        slow_disconnects: Liczba klientów rozłączonych z powodu przekroczenia send_timeout.
+        last_broadcast_seconds: Czas ostatniego rozesłania wiadomości do kolejek.
+        skipped_ticks: Liczba pominiętych taktów statusu (pętla nie nadążała).
     """
 
-    def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
+    def __init__(
+        self,
+        queue_size: int = settings.ws_queue_size,
+        send_timeout: float = settings.ws_send_timeout,
+        overflow_policy: str = settings.ws_overflow_policy,
+        interval: float | None = 1.0,
+    ):
+        if overflow_policy not in ("drop_oldest", "disconnect"):
+            raise ValueError(f"Nieznana polityka przepełnienia kolejki: {overflow_policy!r}")
+        self.active_connections: dict[WebSocket, ClientConnection] = {}
+        self.subscribers: dict[str, set[WebSocket]] = {}
         self.broadcast_task: asyncio.Task | None = None
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.overflow_policy = overflow_policy
+        self.interval = interval
+        self.dropped_messages = 0
+        self.slow_disconnects = 0
+        self.last_broadcast_seconds = 0.0
+        self.skipped_ticks = 0
+        self._closing: set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket):
         """
@@ -27,73 +131,214 @@ class ConnectionManager:
                 websocket (WebSocket): Instancja połączenia WebSocket.
         """
         await websocket.accept()
-        self.active_connections.add(websocket)
+        self.active_connections[websocket] = ClientConnection(websocket, self)
 
         # Uruchom zadanie w tle tylko wtedy, gdy pojawił się pierwszy użytkownik
-        if len(self.active_connections) == 1:
+        if len(self.active_connections) == 1 and self.interval is not None:
             if self.broadcast_task is None or self.broadcast_task.done():
                 self.broadcast_task = asyncio.create_task(self._broadcast_status())
 
     def disconnect(self, websocket: WebSocket):
         """
-        Usuwa połączenie WebSocket z listy aktywnych.
+        Usuwa połączenie WebSocket z listy aktywnych i zatrzymuje jego zadanie wysyłające.
 
         Jeśli po rozłączeniu lista klientów jest pusta, zadanie w tle jest anulowane.
 
         Args:
             websocket (WebSocket): Połączenie WebSocket do usunięcia.
         """
-        self.active_connections.discard(websocket)
+        client = self.active_connections.pop(websocket, None)
+        if client is not None:
+            for topic in client.topics:
+                self.unsubscribe(websocket, topic)
+            if client.sender_task is not asyncio.current_task():
+                client.sender_task.cancel()
 
         # Zatrzymaj zadanie w tle, jeśli nie ma już nikogo nasłuchującego
         if not self.active_connections and self.broadcast_task:
-            self.broadcast_task.cancel()
+            if self.broadcast_task is not asyncio.current_task():
+                self.broadcast_task.cancel()
             self.broadcast_task = None
 
+    async def close(self, websocket: WebSocket, reason: str = ""):
+        """
+        Rozłącza klienta po stronie serwera (np. zbyt wolnego).
+
+        Args:
+            websocket (WebSocket): Połączenie do zamknięcia.
+            reason (str): Powód przekazywany klientowi w ramce zamknięcia.
+        """
+        self.disconnect(websocket)
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=reason), self.send_timeout
+            )
+        except Exception:
+            # Połączenie mogło zostać już zerwane przez klienta
+            pass
+
+    def _close_later(self, websocket: WebSocket):
+        """
+        Rozłącza zbyt wolnego klienta w osobnym zadaniu, bez czekania w miejscu wywołania.
+
+        Referencja do zadania jest przechowywana do jego zakończenia – pętla zdarzeń
+        trzyma tylko słabe referencje, więc niezapamiętane zadanie mogłoby zostać
+        usunięte przez GC, zanim zamknie połączenie.
+
+        Args:
+            websocket (WebSocket): Połączenie do zamknięcia.
+        """
+        task = asyncio.create_task(self.close(websocket, reason="Client too slow"))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
     async def broadcast(self, message: dict):
         """
         Wysyła wiadomość JSON do wszystkich aktualnie podłączonych klientów.
 
+        Wiadomość jest serializowana raz i dodawana do kolejek klientów; wysyłanie
+        odbywa się równolegle w zadaniach poszczególnych połączeń.
+
         Args:
             message (dict): Słownik z danymi do wysłania w formacie JSON.
         """
         if not self.active_connections:
             return
 
-        disconnected = []
+        started = time.perf_counter()
+        payload = json.dumps(message)
+        overflowed = [
+            client.websocket for client in list(self.active_connections.values()) if not client.enqueue(payload)
+        ]
+        self.last_broadcast_seconds = time.perf_counter() - started
 
-        for connection in list(self.active_connections):
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                print(f"Error sending message, disconnecting client: {e}")
-                disconnected.append(connection)
+        for websocket in overflowed:
+            self._close_later(websocket)
 
-        for conn in disconnected:
-            self.active_connections.discard(conn)
+    def subscribe(self, websocket: WebSocket, topic: str):
+        """
+        Dodaje połączenie do subskrybentów tematu.
+
+        Args:
+            websocket (WebSocket): Aktywne połączenie WebSocket.
+            topic (str): Nazwa tematu.
+        """
+        client = self.active_connections.get(websocket)
+        if client is None:
+            return
+        client.topics.add(topic)
+        self.subscribers.setdefault(topic, set()).add(websocket)
+
+    def unsubscribe(self, websocket: WebSocket, topic: str):
+        """
+        Usuwa połączenie z subskrybentów tematu.
+
+        Args:
+            websocket (WebSocket): Połączenie WebSocket.
+            topic (str): Nazwa tematu.
+        """
+        client = self.active_connections.get(websocket)
+        if client is not None and topic in client.topics:
+            client.topics.discard(topic)
+        websockets = self.subscribers.get(topic)
+        if websockets is not None:
+            websockets.discard(websocket)
+            if not websockets:
+                del self.subscribers[topic]
+
+    def send(self, websocket: WebSocket, message: dict):
+        """
+        Dodaje wiadomość do kolejki jednego klienta (np. potwierdzenie subskrypcji).
+
+        Wiadomość przechodzi przez kolejkę, więc nie jest wysyłana równolegle
+        z zadaniem wysyłającym klienta.
+
+        Args:
+            websocket (WebSocket): Aktywne połączenie WebSocket.
+            message (dict): Słownik z danymi do wysłania w formacie JSON.
+        """
+        client = self.active_connections.get(websocket)
+        if client is not None and not client.enqueue(json.dumps(message)):
+            self._close_later(websocket)
+
+    def publish(self, topics: Iterable[str], payload: str) -> int:
+        """
+        Dodaje zserializowaną wiadomość do kolejek klientów subskrybujących którykolwiek z tematów.
+
+        Klient subskrybujący kilka pasujących tematów otrzymuje wiadomość raz.
+
+        Args:
+            topics (Iterable[str]): Tematy, których dotyczy wiadomość.
+            payload (str): Zserializowana wiadomość JSON.
+
+        Returns:
+            int: Liczba klientów, do których trafiła wiadomość.
+        """
+        recipients: set[WebSocket] = set()
+        for topic in topics:
+            recipients.update(self.subscribers.get(topic, ()))
+
+        for websocket in recipients:
+            client = self.active_connections.get(websocket)
+            if client is not None and not client.enqueue(payload):
+                self._close_later(websocket)
+        return len(recipients)
+
+    def stats(self) -> dict:
+        """
+        Zwraca statystyki rozsyłania wiadomości.
+
+        Returns:
+            dict: Liczba klientów, łączna długość kolejek, utracone wiadomości,
+            rozłączenia wolnych klientów, czas ostatniego rozesłania, pominięte
+            takty i liczba subskrybowanych tematów.
+        """
+        return {
+            "connected_clients": len(self.active_connections),
+            "queued_messages": sum(client.queue.qsize() for client in self.active_connections.values()),
+            "dropped_messages": self.dropped_messages,
+            "slow_disconnects": self.slow_disconnects,
+            "last_broadcast_ms": self.last_broadcast_seconds * 1000,
+            "skipped_ticks": self.skipped_ticks,
+            "topics": len(self.subscribers),
+        }
 
     async def _broadcast_status(self):
         """
         Zadanie w tle, które co sekundę rozsyła status serwera.
 
+        Kolejne takty wyznaczane są względem chwili startu, więc czas rozsyłania
+        nie przesuwa harmonogramu; jeśli pętla nie nadąży, zaległe takty są pomijane.
+
         Wysyła słownik z kluczami:
             - status: aktualny status serwera
             - timestamp: bieżący czas
             - connected_clients: liczba podłączonych klientów
+            - metrics: metryki żądań i pul połączeń procesu (status_summary())
         """
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
         try:
             while True:
                 data = {
                     "status": "running",
                     "timestamp": datetime.now().isoformat(),
-                    "connected_clients": len(self.active_connections)
+                    "connected_clients": len(self.active_connections),
+                    "metrics": status_summary(),
                 }
                 await self.broadcast(data)
-                await asyncio.sleep(1)
+
+                next_tick += self.interval
+                now = loop.time()
+                if now > next_tick:
+                    missed = int((now - next_tick) // self.interval) + 1
+                    self.skipped_ticks += missed
+                    next_tick += missed * self.interval
+                await asyncio.sleep(next_tick - now)
         except asyncio.CancelledError:
             pass
         except Exception as e:
             print(f"Unexpected error in broadcast task: {e}")
 
 
-manager = ConnectionManager()
\ No newline at end of file
+manager = ConnectionManager()
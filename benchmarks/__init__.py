@@ -0,0 +1,7 @@
+"""
+Skrypty pomiarów wydajności PlaceExplorer.
+
+Każdy moduł uruchamia się poleceniem ``python -m benchmarks.<nazwa> --help``.
+Benchmarki nie są częścią testów (pytest) – wymagają uruchomionego serwera
+lub uruchamiają go samodzielnie w osobnym procesie.
+"""
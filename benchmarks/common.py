@@ -0,0 +1,178 @@
+"""
+Wspólne narzędzia benchmarków: uruchamianie serwera uvicorn w osobnym procesie,
+przygotowanie bazy danych i generowanie obciążenia o zadanej współbieżności.
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+from sqlalchemy import create_engine, func, insert, select
+
+from app.models import Base, Place
+
+
+def free_port() -> int:
+    """
+    Zwraca wolny port TCP na interfejsie lokalnym.
+
+    Returns:
+        int: Numer portu.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def seed_places(database_url: str, count: int) -> None:
+    """
+    Tworzy schemat bazy i uzupełnia tabelę miejsc do zadanej liczby wierszy.
+
+    Args:
+        database_url (str): Adres bazy danych (sterownik synchroniczny).
+        count (int): Docelowa liczba miejsc.
+    """
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        existing = conn.execute(select(func.count(Place.id))).scalar_one()
+        rows = [
+            {
+                "name": f"Place {i}",
+                "description": f"Benchmark place number {i}",
+                "city": f"City {i % 50}",
+                "country": f"Country {i % 5}",
+                "is_free": i % 2 == 0,
+            }
+            for i in range(existing, count)
+        ]
+        if rows:
+            conn.execute(insert(Place), rows)
+    engine.dispose()
+
+
+@contextmanager
+def running_server(env: dict[str, str], workers: int = 1, port: int | None = None):
+    """
+    Uruchamia aplikację w osobnym procesie uvicorn i czeka, aż zacznie odpowiadać.
+
+    Args:
+        env (dict[str, str]): Dodatkowe zmienne środowiskowe procesu (np. DATABASE_URL).
+        workers (int): Liczba procesów roboczych uvicorn.
+        port (int | None): Port serwera; domyślnie wybierany automatycznie.
+
+    Yields:
+        str: Adres bazowy uruchomionego serwera.
+    """
+    port = port or free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ],
+        env={**os.environ, **env},
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError("Serwer zakończył działanie podczas uruchamiania")
+            try:
+                httpx.get(f"{base_url}/openapi.json", timeout=1)
+                break
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("Serwer nie odpowiada po 30 sekundach")
+                time.sleep(0.2)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+@dataclass
+class LoadResult:
+    """
+    Wynik jednego przebiegu obciążenia.
+
+    Atrybuty:
+        concurrency (int): Liczba równoległych klientów.
+        requests (int): Liczba zakończonych żądań.
+        errors (int): Liczba żądań zakończonych błędem lub statusem >= 400.
+        duration (float): Czas trwania pomiaru w sekundach.
+        latencies (list[float]): Czasy odpowiedzi poszczególnych żądań w sekundach.
+    """
+
+    concurrency: int
+    requests: int
+    errors: int
+    duration: float
+    latencies: list[float]
+
+    @property
+    def rps(self) -> float:
+        """Przepustowość w żądaniach na sekundę."""
+        return self.requests / self.duration if self.duration else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Zwraca kwantyl czasu odpowiedzi (metoda najbliższej pozycji).
+
+        Args:
+            q (float): Kwantyl z przedziału (0, 1], np. 0.95.
+
+        Returns:
+            float: Czas odpowiedzi w sekundach (0, jeśli nie było żądań).
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+async def run_load(base_url: str, make_request, concurrency: int, duration: float) -> LoadResult:
+    """
+    Generuje obciążenie: ``concurrency`` klientów wysyła żądania w pętli przez ``duration`` sekund.
+
+    Args:
+        base_url (str): Adres bazowy serwera.
+        make_request: Funkcja ``async (client: httpx.AsyncClient, i: int) -> httpx.Response``.
+        concurrency (int): Liczba równoległych klientów.
+        duration (float): Czas trwania pomiaru w sekundach.
+
+    Returns:
+        LoadResult: Zebrane wyniki.
+    """
+    latencies: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+
+        async def worker(worker_id: int) -> None:
+            nonlocal errors
+            i = worker_id
+            while time.perf_counter() < deadline:
+                request_started = time.perf_counter()
+                try:
+                    response = await make_request(client, i)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - request_started)
+                i += concurrency
+
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return LoadResult(concurrency, len(latencies), errors, elapsed, latencies)
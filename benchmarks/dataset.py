@@ -0,0 +1,155 @@
+"""
+Generator syntetycznych danych do benchmarków: miejsca i recenzje o skośnym
+rozkładzie (nieliczne popularne miejsca mają większość recenzji, jak w ruchu
+produkcyjnym).
+
+Liczba recenzji miejsca o pozycji r (1 = najpopularniejsze) jest proporcjonalna
+do 1 / r^skew (rozkład Zipfa); skew = 0 oznacza rozkład równomierny.
+
+Przykład:
+    python -m benchmarks.dataset --database-url sqlite:///bench.db --places 10000 --reviews-per-place 20
+"""
+import argparse
+import random
+from bisect import bisect_left
+from itertools import accumulate
+
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.crud.review import recompute_rating_stats
+from app.models import Base, Place, Review
+
+# Liczba wierszy zapisywanych jednym poleceniem INSERT
+INSERT_BATCH = 5000
+
+
+def zipf_weights(count: int, skew: float) -> list[float]:
+    """
+    Zwraca znormalizowane wagi rozkładu Zipfa dla pozycji 1..count.
+
+    Args:
+        count (int): Liczba pozycji.
+        skew (float): Wykładnik rozkładu (0 – rozkład równomierny).
+
+    Returns:
+        list[float]: Wagi sumujące się do 1.
+    """
+    weights = [1 / rank ** skew for rank in range(1, count + 1)]
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+class SkewedPicker:
+    """
+    Losuje identyfikatory miejsc zgodnie z rozkładem Zipfa (popularne miejsca częściej).
+
+    Attributes:
+        ids: Identyfikatory miejsc od najpopularniejszego.
+    """
+
+    def __init__(self, ids: list[int], skew: float, seed: int = 0):
+        self.ids = ids
+        self._cumulative = list(accumulate(zipf_weights(len(ids), skew)))
+        self._random = random.Random(seed)
+
+    def pick(self) -> int:
+        index = bisect_left(self._cumulative, self._random.random())
+        return self.ids[min(index, len(self.ids) - 1)]
+
+
+def generate(
+    database_url: str,
+    places: int,
+    reviews_per_place: float,
+    skew: float = 1.1,
+    seed: int = 0,
+) -> dict:
+    """
+    Tworzy schemat bazy i zastępuje jej zawartość syntetycznym zbiorem danych.
+
+    Agregaty ocen miejsc przeliczane są na końcu (recompute_rating_stats), więc
+    dane są spójne z tym, co zapisuje aplikacja.
+
+    Args:
+        database_url (str): Adres bazy danych (sterownik synchroniczny).
+        places (int): Liczba miejsc.
+        reviews_per_place (float): Średnia liczba recenzji na miejsce.
+        skew (float): Wykładnik rozkładu Zipfa liczby recenzji.
+        seed (int): Ziarno generatora liczb losowych.
+
+    Returns:
+        dict: Opis zbioru (liczba miejsc i recenzji, parametry rozkładu, największa liczba recenzji miejsca).
+    """
+    rng = random.Random(seed)
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        conn.execute(delete(Review))
+        conn.execute(delete(Place))
+        rows = [
+            {
+                "name": f"Place {i}",
+                "description": f"Benchmark place number {i}",
+                "city": f"City {i % 50}",
+                "country": f"Country {i % 5}",
+                "latitude": rng.uniform(49.0, 54.8),
+                "longitude": rng.uniform(14.1, 24.1),
+                "is_free": i % 2 == 0,
+            }
+            for i in range(places)
+        ]
+        for start in range(0, len(rows), INSERT_BATCH):
+            conn.execute(insert(Place), rows[start:start + INSERT_BATCH])
+
+    with Session(engine) as db:
+        ids = list(db.scalars(select(Place.id).order_by(Place.id)))
+        total_reviews = round(places * reviews_per_place)
+        counts = [round(weight * total_reviews) for weight in zipf_weights(len(ids), skew)]
+
+        batch = []
+        for place_id, count in zip(ids, counts):
+            for n in range(count):
+                batch.append({
+                    "place_id": place_id,
+                    "title": f"Review {n}",
+                    "content": "Synthetic benchmark review",
+                    "rating": rng.choices((1, 2, 3, 4, 5), weights=(1, 1, 2, 4, 4))[0],
+                })
+                if len(batch) >= INSERT_BATCH:
+                    db.execute(insert(Review), batch)
+                    batch = []
+        if batch:
+            db.execute(insert(Review), batch)
+        db.commit()
+        recompute_rating_stats(db)
+    engine.dispose()
+
+    return {
+        "places": places,
+        "reviews": sum(counts),
+        "reviews_per_place": reviews_per_place,
+        "skew": skew,
+        "max_reviews_per_place": max(counts, default=0),
+        "seed": seed,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True, help="Adres bazy (sterownik synchroniczny)")
+    parser.add_argument("--places", type=int, default=10_000, help="Liczba miejsc")
+    parser.add_argument("--reviews-per-place", type=float, default=10.0, help="Średnia liczba recenzji na miejsce")
+    parser.add_argument("--skew", type=float, default=1.1, help="Wykładnik rozkładu Zipfa (0 – równomierny)")
+    parser.add_argument("--seed", type=int, default=0, help="Ziarno generatora")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    print(generate(args.database_url, args.places, args.reviews_per_place, args.skew, args.seed))
+
+
+if __name__ == "__main__":
+    main()
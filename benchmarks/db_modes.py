@@ -0,0 +1,56 @@
+"""
+Porównanie przepustowości trybu synchronicznego (pula wątków + psycopg2)
+i asynchronicznego (DATABASE_ASYNC=1, asyncpg/aiosqlite) przy różnej współbieżności.
+
+Przykład:
+    python -m benchmarks.db_modes --database-url postgresql+psycopg2://u:p@localhost:5433/db \\
+        --concurrency 1 16 64 256 --duration 10
+"""
+import argparse
+import asyncio
+import tempfile
+
+from benchmarks.common import run_load, running_server, seed_places
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="Adres bazy (domyślnie tymczasowy plik SQLite)")
+    parser.add_argument("--places", type=int, default=1000, help="Liczba miejsc w bazie testowej")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--duration", type=float, default=5.0, help="Czas pomiaru dla każdego poziomu (s)")
+    parser.add_argument("--workers", type=int, default=1, help="Liczba procesów uvicorn")
+    return parser.parse_args()
+
+
+async def _measure(base_url: str, places: int, levels: list[int], duration: float) -> list:
+    async def request(client, i):
+        # Na przemian lista miejsc i szczegóły pojedynczego miejsca
+        if i % 2:
+            return await client.get("/places/", params={"limit": 20})
+        return await client.get(f"/places/{i % places + 1}")
+
+    return [await run_load(base_url, request, level, duration) for level in levels]
+
+
+def main() -> None:
+    args = parse_args()
+    database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+    seed_places(database_url, args.places)
+
+    results = {}
+    for mode, flag in (("sync", "0"), ("async", "1")):
+        with running_server({"DATABASE_URL": database_url, "DATABASE_ASYNC": flag}, workers=args.workers) as url:
+            results[mode] = asyncio.run(_measure(url, args.places, args.concurrency, args.duration))
+
+    print(f"{'współbieżność':>14} {'sync req/s':>12} {'async req/s':>12} {'zmiana':>8}")
+    for sync_result, async_result in zip(results["sync"], results["async"]):
+        change = (async_result.rps / sync_result.rps - 1) * 100 if sync_result.rps else 0.0
+        print(
+            f"{sync_result.concurrency:>14} {sync_result.rps:>12.1f} {async_result.rps:>12.1f} {change:>7.1f}%"
+            + (f"  (błędy: {sync_result.errors}/{async_result.errors})" if sync_result.errors or async_result.errors else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
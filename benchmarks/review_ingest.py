@@ -0,0 +1,82 @@
+"""
+Porównanie przepustowości dodawania recenzji: zapis w żądaniu (domyślnie)
+i zapis w tle z grupowaniem transakcji (REVIEWS_WRITE_BEHIND=1).
+
+W trybie zapisu w tle po zakończeniu obciążenia mierzony jest też czas
+opróżnienia kolejki, a przepustowość zapisu liczona jest do chwili zapisania
+ostatniej recenzji – a nie tylko do przyjęcia żądań.
+
+Przykład:
+    python -m benchmarks.review_ingest --database-url postgresql+psycopg2://u:p@localhost:5433/db \\
+        --concurrency 16 64 256 --duration 10
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.common import run_load, running_server, seed_places
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="Adres bazy (domyślnie tymczasowy plik SQLite)")
+    parser.add_argument("--places", type=int, default=1000, help="Liczba miejsc w bazie testowej")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--duration", type=float, default=5.0, help="Czas pomiaru dla każdego poziomu (s)")
+    parser.add_argument("--batch-size", type=int, default=500, help="REVIEW_BATCH_SIZE w trybie zapisu w tle")
+    return parser.parse_args()
+
+
+async def _drain(base_url: str) -> float:
+    """Czeka, aż kolejka recenzji będzie pusta, i zwraca czas oczekiwania."""
+    started = time.perf_counter()
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while (await client.get("/metrics/review-ingest")).json()["queued"]:
+            await asyncio.sleep(0.01)
+    return time.perf_counter() - started
+
+
+async def _measure(base_url: str, places: int, levels: list[int], duration: float, write_behind: bool) -> list:
+    async def request(client, i):
+        return await client.post(
+            f"/places/{i % places + 1}/reviews",
+            json={"title": "Benchmark", "content": "Review written under load", "rating": i % 5 + 1},
+        )
+
+    results = []
+    for level in levels:
+        result = await run_load(base_url, request, level, duration)
+        drain = await _drain(base_url) if write_behind else 0.0
+        accepted = result.requests - result.errors
+        results.append((result, accepted / (result.duration + drain) if result.duration else 0.0, drain))
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+    seed_places(database_url, args.places)
+
+    results = {}
+    for mode, flag in (("direct", "0"), ("write_behind", "1")):
+        env = {"DATABASE_URL": database_url, "REVIEWS_WRITE_BEHIND": flag, "REVIEW_BATCH_SIZE": str(args.batch_size)}
+        with running_server(env) as url:
+            results[mode] = asyncio.run(_measure(url, args.places, args.concurrency, args.duration, flag == "1"))
+
+    print(
+        f"{'współbieżność':>14} {'direct req/s':>13} {'p99 ms':>8} "
+        f"{'w-b req/s':>10} {'p99 ms':>8} {'w-b zapis/s':>12} {'opróżnianie s':>14} {'503':>6}"
+    )
+    for (direct, direct_stored, _), (queued, queued_stored, drain) in zip(results["direct"], results["write_behind"]):
+        print(
+            f"{direct.concurrency:>14} {direct_stored:>13.1f} {direct.percentile(0.99) * 1000:>8.1f} "
+            f"{queued.rps:>10.1f} {queued.percentile(0.99) * 1000:>8.1f} {queued_stored:>12.1f} "
+            f"{drain:>14.2f} {queued.errors:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
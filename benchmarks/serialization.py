@@ -0,0 +1,93 @@
+"""
+Mikrobenchmark serializacji listy miejsc: obiekty ORM + walidacja Pydantic
+(dotychczasowa ścieżka FastAPI z response_model) kontra wiersze RowMapping
++ orjson (app.serialization).
+
+Mierzony jest czas zbudowania treści odpowiedzi dla wszystkich miejsc naraz –
+osobno z zapytaniem do bazy i bez niego (sama serializacja).
+
+Przykład:
+    python -m benchmarks.serialization --places 10000 --repeat 5
+"""
+import argparse
+import json
+import statistics
+import tempfile
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, raiseload
+
+from app import schemas
+from app.models import Place
+from app.serialization import HISTOGRAM_COLUMNS, SUMMARY_COLUMNS, dumps, page_document, summary_document
+from benchmarks.common import seed_places
+
+_PAGE = TypeAdapter(schemas.Page[schemas.PlaceSummary])
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="Adres bazy (domyślnie tymczasowy plik SQLite)")
+    parser.add_argument("--places", type=int, default=10_000, help="Liczba miejsc w odpowiedzi")
+    parser.add_argument("--repeat", type=int, default=5, help="Liczba powtórzeń każdego pomiaru")
+    return parser.parse_args()
+
+
+def _load_orm(db: Session, limit: int) -> list[Place]:
+    return list(db.scalars(select(Place).options(raiseload(Place.reviews)).order_by(Place.id).limit(limit)))
+
+
+def _load_rows(db: Session, limit: int) -> list:
+    return db.execute(select(*SUMMARY_COLUMNS, *HISTOGRAM_COLUMNS).order_by(Place.id).limit(limit)).mappings().all()
+
+
+def _serialize_pydantic(places: list[Place]) -> bytes:
+    # Odpowiednik serialize_response FastAPI: walidacja response_model, zrzut do typów JSON i json.dumps
+    page = _PAGE.validate_python({"items": places, "next_cursor": None}, from_attributes=True)
+    return json.dumps(_PAGE.dump_python(page, mode="json")).encode()
+
+
+def _serialize_rows(rows: list) -> bytes:
+    return dumps(page_document(map(summary_document, rows), None))
+
+
+def _median_ms(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    args = parse_args()
+    database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+    seed_places(database_url, args.places)
+    engine = create_engine(database_url)
+
+    with Session(engine) as db:
+        places = _load_orm(db, args.places)
+        rows = _load_rows(db, args.places)
+        assert json.loads(_serialize_pydantic(places)) == json.loads(_serialize_rows(rows))
+
+        results = {
+            "pydantic (serializacja)": _median_ms(lambda: _serialize_pydantic(places), args.repeat),
+            "orjson (serializacja)": _median_ms(lambda: _serialize_rows(rows), args.repeat),
+            "pydantic (zapytanie + serializacja)": _median_ms(
+                lambda: (db.expunge_all(), _serialize_pydantic(_load_orm(db, args.places))), args.repeat
+            ),
+            "orjson (zapytanie + serializacja)": _median_ms(
+                lambda: _serialize_rows(_load_rows(db, args.places)), args.repeat
+            ),
+        }
+
+    print(f"{args.places} miejsc, mediana z {args.repeat} powtórzeń")
+    for name, milliseconds in results.items():
+        print(f"{name:>40}: {milliseconds:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Zestaw benchmarków API: lista, szczegóły miejsca, dodawanie recenzji i WebSocket.
+
+Dla każdej bazy danych (domyślnie tymczasowy plik SQLite; można podać kilka,
+np. SQLite i lokalny PostgreSQL) generowany jest syntetyczny zbiór danych
+(benchmarks.dataset), uruchamiany serwer uvicorn, a każdy scenariusz
+obciążany jest przy zadanych poziomach współbieżności. Szczegóły i recenzje
+dotyczą miejsc losowanych z rozkładem Zipfa – ruch skupia się na popularnych
+miejscach. Wynik (p50/p95/p99 i przepustowość) zapisywany jest jako JSON,
+który można porównać z wynikiem innego commita.
+
+Scenariusze:
+- list – GET /places/?limit=20,
+- detail – GET /places/{id},
+- create_review – POST /places/{id}/reviews,
+- websocket – połączenie z /feed?topic=places do potwierdzenia subskrypcji.
+
+Przykłady:
+    python -m benchmarks.suite run --database-url sqlite:///bench.db postgresql+psycopg2://u:p@localhost/bench \\
+        --places 10000 --reviews-per-place 20 --concurrency 1 16 64 --output results/main.json
+    python -m benchmarks.suite compare results/main.json results/branch.json --threshold 10
+"""
+from datetime import datetime, timezone
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine import make_url
+from websockets.asyncio.client import connect
+from websockets.exceptions import WebSocketException
+
+from app.models import Place
+from benchmarks.common import LoadResult, run_load, running_server
+from benchmarks.dataset import SkewedPicker, generate
+
+SCENARIOS = ("list", "detail", "create_review", "websocket")
+
+# Kwantyle zapisywane w wynikach
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def _place_ids(database_url: str) -> list[int]:
+    engine = create_engine(database_url)
+    with engine.connect() as conn:
+        ids = list(conn.scalars(select(Place.id).order_by(Place.id)))
+    engine.dispose()
+    return ids
+
+
+def _http_scenario(name: str, picker: SkewedPicker):
+    async def request(client, i):
+        if name == "list":
+            return await client.get("/places/", params={"limit": 20})
+        if name == "detail":
+            return await client.get(f"/places/{picker.pick()}")
+        return await client.post(
+            f"/places/{picker.pick()}/reviews",
+            json={"title": "Benchmark", "content": "Review written under load", "rating": i % 5 + 1},
+        )
+
+    return request
+
+
+async def _websocket_load(base_url: str, concurrency: int, duration: float) -> LoadResult:
+    """Każdy z ``concurrency`` klientów w pętli łączy się z /feed i czeka na potwierdzenie subskrypcji."""
+    url = base_url.replace("http://", "ws://") + "/feed?topic=places"
+    latencies: list[float] = []
+    errors = 0
+    started = time.perf_counter()
+    deadline = started + duration
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            request_started = time.perf_counter()
+            try:
+                async with connect(url, open_timeout=30) as websocket:
+                    if json.loads(await websocket.recv()).get("type") != "subscribed":
+                        errors += 1
+            except (OSError, ValueError, asyncio.TimeoutError, WebSocketException):
+                errors += 1
+            latencies.append(time.perf_counter() - request_started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return LoadResult(concurrency, len(latencies), errors, time.perf_counter() - started, latencies)
+
+
+def _summary(scenario: str, result: LoadResult) -> dict:
+    return {
+        "scenario": scenario,
+        "concurrency": result.concurrency,
+        "requests": result.requests,
+        "errors": result.errors,
+        "rps": round(result.rps, 1),
+        **{f"p{int(q * 100)}_ms": round(result.percentile(q) * 1000, 2) for q in QUANTILES},
+    }
+
+
+async def _measure(backend: str, base_url: str, picker: SkewedPicker, args: argparse.Namespace) -> list[dict]:
+    results = []
+    for scenario in args.scenarios:
+        for level in args.concurrency:
+            if scenario == "websocket":
+                result = await _websocket_load(base_url, level, args.duration)
+            else:
+                result = await run_load(base_url, _http_scenario(scenario, picker), level, args.duration)
+            results.append(_summary(scenario, result))
+            _print_row(backend, results[-1])
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_row(label: str, row: dict) -> None:
+    print(
+        f"{label:>10} {row['scenario']:>14} {row['concurrency']:>6} {row['rps']:>10.1f} "
+        f"{row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['errors']:>7}"
+    )
+
+
+def run(args: argparse.Namespace) -> dict:
+    """
+    Uruchamia wszystkie scenariusze dla każdej bazy danych.
+
+    Args:
+        args (argparse.Namespace): Argumenty polecenia run.
+
+    Returns:
+        dict: Wyniki z metadanymi (commit, czas, parametry zbioru danych).
+    """
+    database_urls = args.database_url or [f"sqlite:///{tempfile.mkdtemp()}/bench.db"]
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "duration": args.duration,
+        "workers": args.workers,
+        "databases": {},
+    }
+    print(f"{'baza':>10} {'scenariusz':>14} {'wsp.':>6} {'req/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'błędy':>7}")
+    for database_url in database_urls:
+        backend = make_url(database_url).get_backend_name()
+        dataset = generate(database_url, args.places, args.reviews_per_place, args.skew, args.seed)
+        picker = SkewedPicker(_place_ids(database_url), args.skew, args.seed)
+        with running_server({"DATABASE_URL": database_url}, workers=args.workers) as url:
+            results = asyncio.run(_measure(backend, url, picker, args))
+        report["databases"][backend] = {"dataset": dataset, "results": results}
+    return report
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+    Porównuje dwa wyniki i zwraca opisy regresji.
+
+    Regresją jest wzrost p95 lub spadek przepustowości o więcej niż ``threshold`` procent.
+
+    Args:
+        baseline (dict): Wynik odniesienia.
+        current (dict): Wynik porównywany.
+        threshold (float): Dopuszczalna zmiana w procentach.
+
+    Returns:
+        list[str]: Opisy regresji (pusta lista, jeśli ich brak).
+    """
+    regressions = []
+    print(f"{'baza':>10} {'scenariusz':>14} {'wsp.':>6} {'req/s':>16} {'zmiana':>8} {'p95 ms':>18} {'zmiana':>8}")
+    for backend, data in current["databases"].items():
+        reference = {
+            (row["scenario"], row["concurrency"]): row
+            for row in baseline["databases"].get(backend, {}).get("results", [])
+        }
+        for row in data["results"]:
+            before = reference.get((row["scenario"], row["concurrency"]))
+            if before is None:
+                continue
+            rps_change = (row["rps"] / before["rps"] - 1) * 100 if before["rps"] else 0.0
+            p95_change = (row["p95_ms"] / before["p95_ms"] - 1) * 100 if before["p95_ms"] else 0.0
+            print(
+                f"{backend:>10} {row['scenario']:>14} {row['concurrency']:>6} "
+                f"{before['rps']:>7.1f} → {row['rps']:>6.1f} {rps_change:>7.1f}% "
+                f"{before['p95_ms']:>8.2f} → {row['p95_ms']:>7.2f} {p95_change:>7.1f}%"
+            )
+            if rps_change < -threshold or p95_change > threshold:
+                regressions.append(
+                    f"{backend} {row['scenario']} x{row['concurrency']}: "
+                    f"req/s {rps_change:+.1f}%, p95 {p95_change:+.1f}%"
+                )
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Uruchamia benchmarki i zapisuje wynik")
+    run_parser.add_argument("--database-url", nargs="+", help="Adresy baz (domyślnie tymczasowy plik SQLite)")
+    run_parser.add_argument("--places", type=int, default=5000, help="Liczba miejsc")
+    run_parser.add_argument("--reviews-per-place", type=float, default=10.0, help="Średnia liczba recenzji")
+    run_parser.add_argument("--skew", type=float, default=1.1, help="Wykładnik rozkładu Zipfa")
+    run_parser.add_argument("--seed", type=int, default=0, help="Ziarno generatora")
+    run_parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    run_parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    run_parser.add_argument("--duration", type=float, default=5.0, help="Czas pomiaru każdego przebiegu (s)")
+    run_parser.add_argument("--workers", type=int, default=1, help="Liczba procesów uvicorn")
+    run_parser.add_argument("--output", help="Plik JSON z wynikami")
+
+    compare_parser = commands.add_parser("compare", help="Porównuje dwa pliki wyników")
+    compare_parser.add_argument("baseline", help="Wynik odniesienia (JSON)")
+    compare_parser.add_argument("current", help="Wynik porównywany (JSON)")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="Dopuszczalna zmiana (%%)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.command == "run":
+        report = run(args)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(report, file, indent=2)
+        return
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, encoding="utf-8") as file:
+        current = json.load(file)
+    regressions = compare(baseline, current, args.threshold)
+    for regression in regressions:
+        print(f"REGRESJA: {regression}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
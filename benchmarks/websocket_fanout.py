@@ -0,0 +1,137 @@
+"""
+Test obciążeniowy rozsyłania statusu przez WebSocket do tysięcy klientów.
+
+Klienci symulowani są w procesie (obiekty z metodą send_text o zadanym
+opóźnieniu), dzięki czemu mierzony jest sam ConnectionManager, a nie stos
+sieciowy. Część klientów jest wolna, a część całkiem przestaje odbierać.
+
+Porównywane są:
+- sequential – dawne rozsyłanie (await send dla każdego klienta po kolei),
+- queued – ConnectionManager (jedna serializacja, kolejki i równoległe wysyłanie).
+
+Mierzone są: czas rozesłania taktu, opóźnienie dostarczenia do szybkich klientów
+(p50/p99) i przesunięcie taktów względem harmonogramu.
+
+Przykład:
+    python -m benchmarks.websocket_fanout --clients 5000 --slow 0.05 --stalled 0.01 --ticks 5
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from app.websocket_manager import ConnectionManager
+
+
+class SimulatedClient:
+    """Klient WebSocket odbierający wiadomości z zadanym opóźnieniem."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.latencies: list[float] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.latencies.append(time.perf_counter() - json.loads(payload)["sent_at"])
+
+    async def send_json(self, message: dict):
+        await self.send_text(json.dumps(message))
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        pass
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=5000, help="Liczba symulowanych klientów")
+    parser.add_argument("--slow", type=float, default=0.05, help="Odsetek wolnych klientów (200 ms na wiadomość)")
+    parser.add_argument("--stalled", type=float, default=0.01, help="Odsetek klientów, którzy przestają odbierać")
+    parser.add_argument("--ticks", type=int, default=5, help="Liczba taktów statusu")
+    parser.add_argument("--interval", type=float, default=1.0, help="Odstęp między taktami (s)")
+    parser.add_argument("--send-timeout", type=float, default=2.0, help="Limit czasu wysłania (tryb queued)")
+    return parser.parse_args()
+
+
+def _clients(args: argparse.Namespace) -> list[SimulatedClient]:
+    random.seed(0)
+    clients = []
+    for _ in range(args.clients):
+        draw = random.random()
+        if draw < args.stalled:
+            clients.append(SimulatedClient(delay=3600))
+        elif draw < args.stalled + args.slow:
+            clients.append(SimulatedClient(delay=0.2))
+        else:
+            clients.append(SimulatedClient(delay=0))
+    return clients
+
+
+async def _sequential(clients: list[SimulatedClient], message: dict) -> None:
+    # Dawne zachowanie: każdy klient czeka na poprzedniego (z limitem, aby pomiar się kończył)
+    for client in clients:
+        try:
+            await asyncio.wait_for(client.send_json(message), 5)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _run(mode: str, args: argparse.Namespace) -> dict:
+    clients = _clients(args)
+    manager = ConnectionManager(send_timeout=args.send_timeout, interval=None)
+    if mode == "queued":
+        for client in clients:
+            await manager.connect(client)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    broadcast_ms, drift_ms = [], []
+    for tick in range(args.ticks):
+        scheduled = start + tick * args.interval
+        await asyncio.sleep(max(0.0, scheduled - loop.time()))
+        drift_ms.append((loop.time() - scheduled) * 1000)
+
+        message = {"tick": tick, "sent_at": time.perf_counter()}
+        began = time.perf_counter()
+        if mode == "queued":
+            await manager.broadcast(message)
+        else:
+            await _sequential(clients, message)
+        broadcast_ms.append((time.perf_counter() - began) * 1000)
+
+    await asyncio.sleep(args.interval)
+    for client in clients:
+        manager.disconnect(client)
+
+    fast = [latency * 1000 for client in clients if client.delay == 0 for latency in client.latencies]
+    quantiles = statistics.quantiles(fast, n=100) if len(fast) > 1 else [0.0] * 99
+    return {
+        "mode": mode,
+        "broadcast_ms_max": max(broadcast_ms),
+        "delivery_ms_p50": quantiles[49],
+        "delivery_ms_p99": quantiles[98],
+        "tick_drift_ms_max": max(drift_ms),
+        "slow_disconnects": manager.slow_disconnects,
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    print(f"{args.clients} klientów ({args.slow:.1%} wolnych, {args.stalled:.1%} bez odbioru), {args.ticks} taktów")
+    for mode in ("queued", "sequential"):
+        result = asyncio.run(_run(mode, args))
+        print(
+            f"{result['mode']:>10}: rozesłanie max {result['broadcast_ms_max']:9.1f} ms | "
+            f"dostarczenie p50 {result['delivery_ms_p50']:8.1f} ms, p99 {result['delivery_ms_p99']:8.1f} ms | "
+            f"przesunięcie taktu max {result['tick_drift_ms_max']:9.1f} ms | "
+            f"rozłączeni wolni {result['slow_disconnects']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
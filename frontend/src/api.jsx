@@ -4,9 +4,20 @@ const API_BASE_URL = 'http://localhost:8000';
 
 const api = axios.create({baseURL: API_BASE_URL });
 
+// Maksymalny rozmiar strony akceptowany przez GET /places/ (PLACES_MAX_PAGE_SIZE)
+const PAGE_SIZE = 100;
+
 export const getAllPlaces = async () => {
-  const response = await api.get('/places/');
-  return response.data;
+  // Lista jest stronicowana kursorem – pobieramy kolejne strony, dopóki next_cursor nie jest pusty
+  const places = [];
+  let cursor = null;
+  do {
+    const params = cursor ? { limit: PAGE_SIZE, cursor } : { limit: PAGE_SIZE };
+    const response = await api.get('/places/', { params });
+    places.push(...response.data.items);
+    cursor = response.data.next_cursor;
+  } while (cursor);
+  return places;
 };
 
 export const getPlaceById = async (placeId) => {
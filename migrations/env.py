@@ -0,0 +1,75 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from app.database import database_url
+from app.models import Base
+from app.geo import GEOGRAPHY_INDEX
+from app.search import is_search_object
+
+config = context.config
+
+# Konfiguracja logowania z pliku alembic.ini
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+config.set_main_option("sqlalchemy.url", database_url().replace("%", "%%"))
+
+target_metadata = Base.metadata
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """
+    Pomija przy autogenerowaniu obiekty indeksów pełnotekstowego i przestrzennego.
+
+    Kolumna search_vector (PostgreSQL), tabele FTS5 (SQLite) i indeks GiST
+    PostGIS nie są częścią modeli – tworzą je zdarzenia DDL w app/search.py
+    i app/geo.py oraz migracje 0004 i 0005.
+    """
+    return not (is_search_object(name) or name == GEOGRAPHY_INDEX)
+
+
+def run_migrations_offline() -> None:
+    """
+    Generuje skrypt SQL migracji bez łączenia się z bazą danych.
+    """
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """
+    Wykonuje migracje na bazie danych wskazanej przez DATABASE_URL.
+    """
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite nie obsługuje większości ALTER TABLE – zmiany wykonywane są przez kopię tabeli
+            render_as_batch=connection.dialect.name == "sqlite",
+            include_object=include_object,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
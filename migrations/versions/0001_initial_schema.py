@@ -0,0 +1,66 @@
+"""Schemat początkowy: tabele places i reviews
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+Odpowiada schematowi tworzonemu dotychczas przez Base.metadata.create_all.
+Istniejące bazy należy oznaczyć tą wersją poleceniem ``alembic stamp 0001``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "places",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=200), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("street_address", sa.String(length=300), nullable=True),
+        sa.Column("city", sa.String(length=100), nullable=True),
+        sa.Column("country", sa.String(length=100), nullable=True),
+        sa.Column("visit_duration", sa.String(length=100), nullable=True),
+        sa.Column("is_free", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_places_id", "places", ["id"])
+    op.create_index("ix_places_name", "places", ["name"])
+    op.create_index("ix_places_city", "places", ["city"])
+    op.create_index("ix_places_country", "places", ["country"])
+
+    op.create_table(
+        "reviews",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=True),
+        sa.Column("content", sa.Text(), nullable=True),
+        sa.Column("rating", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column("place_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["place_id"], ["places.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_reviews_id", "reviews", ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reviews_id", table_name="reviews")
+    op.drop_table("reviews")
+    op.drop_index("ix_places_country", table_name="places")
+    op.drop_index("ix_places_city", table_name="places")
+    op.drop_index("ix_places_name", table_name="places")
+    op.drop_index("ix_places_id", table_name="places")
+    op.drop_table("places")
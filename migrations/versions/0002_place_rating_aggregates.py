@@ -0,0 +1,60 @@
+"""Agregaty ocen miejsc i indeksy stronicowania listy miejsc
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:01
+
+Dodaje zdenormalizowane kolumny review_count, rating_sum, rating_avg
+i histogram rating_1..rating_5, uzupełnia je na podstawie tabeli reviews
+oraz tworzy indeksy (created_at, id) i (rating_avg, id).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COUNTERS = ["review_count", "rating_sum", "rating_1", "rating_2", "rating_3", "rating_4", "rating_5"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("places") as batch:
+        for name in _COUNTERS:
+            batch.add_column(sa.Column(name, sa.Integer(), nullable=False, server_default="0"))
+        batch.add_column(sa.Column("rating_avg", sa.Float(), nullable=False, server_default="0"))
+
+    # Uzupełnienie agregatów dla istniejących recenzji
+    histogram = ", ".join(
+        f"rating_{stars} = (SELECT count(*) FROM reviews r WHERE r.place_id = places.id AND r.rating = {stars})"
+        for stars in range(1, 6)
+    )
+    op.execute(
+        "UPDATE places SET "
+        "review_count = (SELECT count(*) FROM reviews r WHERE r.place_id = places.id), "
+        "rating_sum = (SELECT coalesce(sum(r.rating), 0) FROM reviews r WHERE r.place_id = places.id), "
+        f"{histogram}"
+    )
+    op.execute(
+        "UPDATE places SET rating_avg = CASE WHEN review_count > 0 "
+        "THEN CAST(rating_sum AS FLOAT) / review_count ELSE 0 END"
+    )
+
+    op.create_index("ix_places_created_at_id", "places", ["created_at", "id"])
+    op.create_index("ix_places_rating_avg_id", "places", ["rating_avg", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_places_rating_avg_id", table_name="places")
+    op.drop_index("ix_places_created_at_id", table_name="places")
+    with op.batch_alter_table("places") as batch:
+        batch.drop_column("rating_avg")
+        for name in reversed(_COUNTERS):
+            batch.drop_column(name)
@@ -0,0 +1,40 @@
+"""Indeks (place_id, created_at, id) na tabeli reviews
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:02
+
+Bez indeksu na reviews.place_id ładowanie recenzji miejsca wymaga pełnego
+skanu tabeli. Na PostgreSQL indeks budowany jest równolegle (CONCURRENTLY),
+aby nie blokować zapisów w trakcie migracji.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY nie może działać wewnątrz transakcji
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_reviews_place_id_created_at",
+                "reviews",
+                ["place_id", "created_at", "id"],
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index("ix_reviews_place_id_created_at", "reviews", ["place_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reviews_place_id_created_at", table_name="reviews")
@@ -0,0 +1,87 @@
+"""Indeks pełnotekstowy miejsc (nazwa, miasto, opis)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:03
+
+PostgreSQL: generowana kolumna search_vector (tsvector) z indeksem GIN
+budowanym równolegle. SQLite: tabela FTS5 places_fts synchronizowana
+wyzwalaczami i wypełniana istniejącymi danymi.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_TRIGGERS = {
+    "places_fts_ai": """
+        CREATE TRIGGER places_fts_ai AFTER INSERT ON places BEGIN
+            INSERT INTO places_fts(rowid, name, city, description)
+            VALUES (new.id, new.name, new.city, new.description);
+        END
+    """,
+    "places_fts_ad": """
+        CREATE TRIGGER places_fts_ad AFTER DELETE ON places BEGIN
+            INSERT INTO places_fts(places_fts, rowid, name, city, description)
+            VALUES ('delete', old.id, old.name, old.city, old.description);
+        END
+    """,
+    "places_fts_au": """
+        CREATE TRIGGER places_fts_au AFTER UPDATE OF name, city, description ON places BEGIN
+            INSERT INTO places_fts(places_fts, rowid, name, city, description)
+            VALUES ('delete', old.id, old.name, old.city, old.description);
+            INSERT INTO places_fts(rowid, name, city, description)
+            VALUES (new.id, new.name, new.city, new.description);
+        END
+    """,
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        # Wyliczenie kolumny przepisuje tabelę; indeks budowany bez blokowania zapisów
+        op.execute(
+            """
+            ALTER TABLE places ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+                setweight(to_tsvector('simple', coalesce(city, '')), 'B') ||
+                setweight(to_tsvector('simple', coalesce(description, '')), 'C')
+            ) STORED
+            """
+        )
+        with op.get_context().autocommit_block():
+            op.execute("CREATE INDEX CONCURRENTLY ix_places_search_vector ON places USING GIN (search_vector)")
+    elif dialect == "sqlite":
+        op.execute(
+            """
+            CREATE VIRTUAL TABLE places_fts USING fts5(
+                name, city, description,
+                content='places', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+            """
+        )
+        for statement in SQLITE_TRIGGERS.values():
+            op.execute(statement)
+        op.execute("INSERT INTO places_fts(places_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_places_search_vector")
+        op.execute("ALTER TABLE places DROP COLUMN IF EXISTS search_vector")
+    elif dialect == "sqlite":
+        for name in SQLITE_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+        op.execute("DROP TABLE IF EXISTS places_fts")
@@ -0,0 +1,56 @@
+"""Współrzędne geograficzne miejsc i indeks przestrzenny
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:04
+
+Dodaje kolumny latitude, longitude i geohash (z indeksem B-tree używanym
+przez wyszukiwanie w pobliżu). Jeśli w bazie PostgreSQL zainstalowano
+PostGIS, tworzony jest dodatkowo indeks GiST na wyrażeniu geography.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_postgis() -> bool:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+    return bind.execute(sa.text("SELECT 1 FROM pg_extension WHERE extname = 'postgis'")).first() is not None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("places") as batch:
+        batch.add_column(sa.Column("latitude", sa.Float(), nullable=True))
+        batch.add_column(sa.Column("longitude", sa.Float(), nullable=True))
+        batch.add_column(sa.Column("geohash", sa.String(length=12), nullable=True))
+    op.create_index("ix_places_geohash", "places", ["geohash"])
+
+    if _has_postgis():
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY ix_places_geography ON places "
+                "USING GIST ((geography(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326))))"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_postgis():
+        op.execute("DROP INDEX IF EXISTS ix_places_geography")
+    op.drop_index("ix_places_geohash", table_name="places")
+    # Bez kopiowania tabeli na SQLite – kopia usunęłaby wyzwalacze FTS z migracji 0004
+    with op.batch_alter_table("places", recreate="never") as batch:
+        batch.drop_column("geohash")
+        batch.drop_column("longitude")
+        batch.drop_column("latitude")
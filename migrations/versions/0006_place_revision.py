@@ -0,0 +1,34 @@
+"""Numer wersji miejsca (składnik ETagu)
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:05
+
+Kolumna revision zwiększana przy każdej edycji miejsca. ETag nie może
+opierać się wyłącznie na updated_at, bo SQLite zapisuje daty z dokładnością
+do sekundy.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("places") as batch:
+        batch.add_column(sa.Column("revision", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Bez kopiowania tabeli na SQLite – kopia usunęłaby wyzwalacze FTS z migracji 0004
+    with op.batch_alter_table("places", recreate="never") as batch:
+        batch.drop_column("revision")
@@ -0,0 +1,48 @@
+"""Liczniki facetów listy miejsc
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:06
+
+Tabela place_facet_counts z liczbą miejsc dla każdej kombinacji kraju,
+miasta i bezpłatnego wstępu, uzupełniona na podstawie tabeli places.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "place_facet_counts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("country", sa.String(length=100), nullable=True),
+        sa.Column("city", sa.String(length=100), nullable=True),
+        sa.Column("is_free", sa.Boolean(), nullable=True),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_place_facet_counts_country_city_is_free", "place_facet_counts", ["country", "city", "is_free"]
+    )
+
+    # Uzupełnienie liczników dla istniejących miejsc
+    op.execute(
+        "INSERT INTO place_facet_counts (country, city, is_free, count) "
+        "SELECT country, city, is_free, count(*) FROM places GROUP BY country, city, is_free"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_place_facet_counts_country_city_is_free", table_name="place_facet_counts")
+    op.drop_table("place_facet_counts")
@@ -0,0 +1,70 @@
+"""Wyniki rankingów miejsc (najlepiej oceniane i popularne)
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:07
+
+Kolumny bayesian_score i trending_score (patrz app.ranking) z indeksami
+ogólnymi oraz w mieście i kraju, uzupełnione na podstawie tabeli reviews.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import settings
+from app.ranking import trending_weight
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SCORES = ["bayesian_score", "trending_score"]
+
+
+def _indexes():
+    for score in _SCORES:
+        yield f"ix_places_{score}_id", [score, "id"]
+        yield f"ix_places_city_{score}_id", ["city", score, "id"]
+        yield f"ix_places_country_{score}_id", ["country", score, "id"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("places") as batch:
+        for score in _SCORES:
+            batch.add_column(sa.Column(score, sa.Float(), nullable=False, server_default="0"))
+
+    # Uzupełnienie wyników dla istniejących recenzji
+    op.get_bind().execute(
+        sa.text(
+            "UPDATE places SET bayesian_score = CASE WHEN review_count > 0 "
+            "THEN (CAST(rating_sum AS FLOAT) + :prior) / (review_count + :weight) ELSE 0 END"
+        ),
+        {"prior": settings.ranking_prior_weight * settings.ranking_prior_mean, "weight": settings.ranking_prior_weight},
+    )
+    reviews = sa.table("reviews", sa.column("place_id"), sa.column("rating"), sa.column("created_at", sa.DateTime()))
+    scores: dict[int, float] = {}
+    for place_id, rating, created_at in op.get_bind().execute(sa.select(reviews)):
+        scores[place_id] = scores.get(place_id, 0.0) + trending_weight(rating, created_at)
+    if scores:
+        op.get_bind().execute(
+            sa.text("UPDATE places SET trending_score = :score WHERE id = :id"),
+            [{"id": place_id, "score": score} for place_id, score in scores.items()],
+        )
+
+    for name, columns in _indexes():
+        op.create_index(name, "places", columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _ in _indexes():
+        op.drop_index(name, table_name="places")
+    # Bez kopiowania tabeli na SQLite – kopia usunęłaby wyzwalacze FTS z migracji 0004
+    with op.batch_alter_table("places", recreate="never") as batch:
+        for score in reversed(_SCORES):
+            batch.drop_column(score)